@@ -0,0 +1,48 @@
+"""Benchmarks of the checks of Series values and types."""
+from pandas_keeper.assert_check import assert_type, assert_values, safe_replace_series
+from .generators import N_ROWS, make_mixed_df, make_values
+
+
+class AssertValues(object):
+    params = N_ROWS
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.pds = make_values(n_rows)
+        self.values = list(self.pds.unique())
+
+    def time_assert_values(self, n_rows):
+        assert_values(self.pds, self.values)
+
+    def peakmem_assert_values(self, n_rows):
+        assert_values(self.pds, self.values)
+
+
+class AssertType(object):
+    params = (N_ROWS, ["int", "float", "str"])
+    param_names = ["n_rows", "column"]
+
+    def setup(self, n_rows, column):
+        self.pds = make_mixed_df(n_rows)[column]
+        self.dtype = {"int": "int64", "float": "float64", "str": "str"}[column]
+
+    def time_assert_type(self, n_rows, column):
+        assert_type(self.pds, self.dtype, False)
+
+    def peakmem_assert_type(self, n_rows, column):
+        assert_type(self.pds, self.dtype, False)
+
+
+class SafeReplace(object):
+    params = N_ROWS
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.pds = make_values(n_rows)
+        self.values = {value: value.upper() for value in self.pds.unique()}
+
+    def time_safe_replace(self, n_rows):
+        safe_replace_series(self.pds, self.values)
+
+    def peakmem_safe_replace(self, n_rows):
+        safe_replace_series(self.pds, self.values)
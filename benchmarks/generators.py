@@ -0,0 +1,45 @@
+"""Synthetic data of the benchmarks, generated with fixed seeds so that runs are comparable.
+
+The benchmarks run on 1e4 to 1e8 rows. The sizes above PANDAS_KEEPER_BENCHMARK_MAX_ROWS (1e6 by
+default) are skipped, e.g. `PANDAS_KEEPER_BENCHMARK_MAX_ROWS=100000000 asv run` runs them all.
+"""
+import os
+import numpy as np
+import pandas as pd
+
+MAX_ROWS = int(float(os.environ.get("PANDAS_KEEPER_BENCHMARK_MAX_ROWS", 1e6)))
+N_ROWS = [n_rows for n_rows in [10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8] if n_rows <= MAX_ROWS]
+
+
+def make_df(n_rows, n_cols):
+    data = np.random.RandomState(0).randint(0, 1000, size=(n_rows, n_cols))
+    return pd.DataFrame(data, columns=["col_%i" % i for i in range(n_cols)])
+
+
+def make_values(n_rows, n_values=100, seed=0):
+    """String Series of `n_values` distinct values."""
+    codes = np.random.RandomState(seed).randint(0, n_values, size=n_rows)
+    return pd.Series(np.array(["value_%i" % i for i in range(n_values)], dtype=object)[codes])
+
+
+def make_mixed_df(n_rows, seed=0):
+    """DataFrame with an integer, a float, a low-cardinality string and a nullable float column."""
+    random_state = np.random.RandomState(seed)
+    floats = random_state.randn(n_rows)
+    floats[random_state.rand(n_rows) < 0.1] = np.nan
+    return pd.DataFrame({"int": random_state.randint(0, 1000000, size=n_rows),
+                         "float": random_state.randn(n_rows),
+                         "str": make_values(n_rows, seed=seed),
+                         "nullable": floats})
+
+
+def make_merge_dfs(n_rows, n_right_rows=None, seed=0):
+    """Left DataFrame with `n_rows` string keys among the `n_right_rows` unique keys of the right
+    DataFrame, each one with a value column."""
+    n_right_rows = n_right_rows or max(n_rows // 10, 1)
+    random_state = np.random.RandomState(seed)
+    keys = np.array(["key_%i" % i for i in range(n_right_rows)], dtype=object)
+    left_df = pd.DataFrame({"key": keys[random_state.randint(0, n_right_rows, size=n_rows)],
+                            "left_value": random_state.randn(n_rows)})
+    right_df = pd.DataFrame({"key": keys, "right_value": random_state.randn(n_right_rows)})
+    return left_df, right_df
@@ -0,0 +1,63 @@
+"""Benchmarks of the DataFrame import."""
+import shutil
+import tempfile
+from pathlib import Path
+from pandas_keeper.df_keeper.df_keeper import DFKeeper
+from pandas_keeper.df_keeper.importer import import_df
+from pandas_keeper.write import write
+from .generators import N_ROWS, make_df, make_mixed_df
+
+READERS = ["csv", "jsonl", "pq", "feather", "pkl5", "xlsx"]
+# Excel files are too slow to write and parse above this size.
+MAX_EXCEL_ROWS = 10 ** 5
+
+
+class ImportWideCSV(object):
+    params = [500]
+    param_names = ["n_cols"]
+
+    def setup(self, n_cols):
+        self.folder = Path(tempfile.mkdtemp())
+        file_path = self.folder / "data.csv"
+        make_df(1000, n_cols).to_csv(file_path, index=False)
+        self.df_keeper = DFKeeper(file_path=str(file_path), columns=[
+            {"name": "col_%i" % i, "actions": [{"name": "fillna", "args": 0}],
+             "rename": "renamed_%i" % i, "drop": i % 10 == 0}
+            for i in range(n_cols)])
+
+    def teardown(self, n_cols):
+        shutil.rmtree(self.folder)
+
+    def time_import_df(self, n_cols):
+        import_df(self.df_keeper)
+
+
+class ImportDF(object):
+    params = (N_ROWS, READERS)
+    param_names = ["n_rows", "reader"]
+
+    def setup(self, n_rows, reader):
+        if reader == "xlsx" and n_rows > MAX_EXCEL_ROWS:
+            raise NotImplementedError
+        self.folder = Path(tempfile.mkdtemp())
+        file_path = self.folder / ("data.%s" % reader)
+        df = make_mixed_df(n_rows)
+        if reader == "feather":
+            df.to_feather(file_path)
+        elif reader == "xlsx":
+            df.to_excel(file_path, index=False)
+        else:
+            write(df, str(file_path), **({"index": False} if reader == "csv" else {}))
+        self.df_keeper = DFKeeper(file_path=str(file_path), columns=[
+            {"name": "int", "dtype": "int64"},
+            {"name": "str", "dtype": "category"},
+            {"name": "nullable", "actions": [{"name": "fillna", "args": 0}]}])
+
+    def teardown(self, n_rows, reader):
+        shutil.rmtree(self.folder)
+
+    def time_import_df(self, n_rows, reader):
+        import_df(self.df_keeper)
+
+    def peakmem_import_df(self, n_rows, reader):
+        import_df(self.df_keeper)
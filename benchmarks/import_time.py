@@ -0,0 +1,20 @@
+"""Benchmarks of the import time of pandas_keeper modules, each run in a fresh interpreter.
+
+The detail of an import can be profiled with `python -X importtime -c "import <module>"`.
+"""
+
+
+def timeraw_import_pandas_keeper():
+    return "import pandas_keeper"
+
+
+def timeraw_import_safe_merge():
+    return "from pandas_keeper import safe_merge"
+
+
+def timeraw_import_write():
+    return "from pandas_keeper.write import write"
+
+
+def timeraw_import_import_df():
+    return "from pandas_keeper.df_keeper.importer import import_df"
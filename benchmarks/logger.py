@@ -0,0 +1,26 @@
+"""Benchmarks of the overhead of Logger.timeit, whose arguments are formatted for the debug log."""
+from pandas_keeper.logger import Logger
+from .generators import N_ROWS, make_mixed_df
+
+LOGGER = Logger(logger_name="benchmarks.logger")
+
+
+def identity(obj):
+    return obj
+
+
+timed_identity = LOGGER.timeit(identity)
+
+
+class TimeitOverhead(object):
+    params = N_ROWS
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.df = make_mixed_df(n_rows)
+
+    def time_not_timed(self, n_rows):
+        identity(self.df)
+
+    def time_timed(self, n_rows):
+        timed_identity(self.df)
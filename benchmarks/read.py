@@ -0,0 +1,27 @@
+"""Benchmarks of the data readers."""
+import shutil
+import tempfile
+from pathlib import Path
+from pandas_keeper.df_keeper.read import DataReaderExtension, DataReaderEngine, read_data
+from .generators import make_df
+
+SHAPES = {
+    "tall": (1000000, 10),
+    "wide": (10000, 1000)
+}
+
+
+class ReadCSV(object):
+    params = (list(SHAPES), [engine.value for engine in DataReaderEngine])
+    param_names = ["shape", "engine"]
+
+    def setup(self, shape, engine):
+        self.folder = Path(tempfile.mkdtemp())
+        self.file_path = self.folder / "data.csv"
+        make_df(*SHAPES[shape]).to_csv(self.file_path, index=False)
+
+    def teardown(self, shape, engine):
+        shutil.rmtree(self.folder)
+
+    def time_read_data(self, shape, engine):
+        read_data(self.file_path, DataReaderExtension.csv, reader_engine=DataReaderEngine(engine))
@@ -0,0 +1,83 @@
+"""Benchmarks of the checked merge."""
+import logging
+from pandas_keeper.merge_keys import factorize_keys, lookup_merge
+from pandas_keeper.safe_merger import safe_merge
+from .generators import N_ROWS, make_merge_dfs
+
+LOGGER = logging.getLogger("benchmarks.safe_merge")
+
+
+class SafeMerge(object):
+    params = (N_ROWS, ["left", "inner"])
+    param_names = ["n_rows", "how"]
+
+    def setup(self, n_rows, how):
+        self.left_df, self.right_df = make_merge_dfs(n_rows)
+
+    def time_safe_merge(self, n_rows, how):
+        safe_merge(self.left_df, self.right_df, how=how, on="key", logger=LOGGER)
+
+    def peakmem_safe_merge(self, n_rows, how):
+        safe_merge(self.left_df, self.right_df, how=how, on="key", logger=LOGGER)
+
+
+class LookupMerge(object):
+    """Left merge on unique right keys: lookup and take, against the hash join of `merge`."""
+    params = N_ROWS
+    param_names = ["n_rows"]
+
+    def setup(self, n_rows):
+        self.left_df, self.right_df = make_merge_dfs(n_rows)
+
+    def time_lookup_merge(self, n_rows):
+        left_codes, right_codes, n_codes = factorize_keys(self.left_df, ["key"], self.right_df,
+                                                          ["key"])
+        lookup_merge(self.left_df, left_codes, self.right_df[["right_value"]], right_codes,
+                     n_codes)
+
+    def time_merge(self, n_rows):
+        self.left_df.merge(self.right_df, how="left", on="key")
+
+    def peakmem_lookup_merge(self, n_rows):
+        left_codes, right_codes, n_codes = factorize_keys(self.left_df, ["key"], self.right_df,
+                                                          ["key"])
+        lookup_merge(self.left_df, left_codes, self.right_df[["right_value"]], right_codes,
+                     n_codes)
+
+    def peakmem_merge(self, n_rows):
+        self.left_df.merge(self.right_df, how="left", on="key")
+
+
+class SafeMergePresorted(object):
+    """Merge of DataFrames sorted on their key, hashing the keys or not."""
+    params = (N_ROWS, ["left", "inner"], [False, True])
+    param_names = ["n_rows", "how", "presorted"]
+
+    def setup(self, n_rows, how, presorted):
+        left_df, right_df = make_merge_dfs(n_rows)
+        self.left_df = left_df.sort_values("key", ignore_index=True)
+        self.right_df = right_df.sort_values("key", ignore_index=True)
+
+    def time_safe_merge(self, n_rows, how, presorted):
+        safe_merge(self.left_df, self.right_df, how=how, on="key", presorted=presorted,
+                   logger=LOGGER)
+
+    def peakmem_safe_merge(self, n_rows, how, presorted):
+        safe_merge(self.left_df, self.right_df, how=how, on="key", presorted=presorted,
+                   logger=LOGGER)
+
+
+class SafeMergeCategorical(object):
+    """Merge on categorical keys whose categories differ between both sides."""
+    params = (N_ROWS, ["left", "inner"])
+    param_names = ["n_rows", "how"]
+
+    def setup(self, n_rows, how):
+        self.left_df, self.right_df = make_merge_dfs(n_rows)
+        self.left_df["key"] = self.left_df["key"].astype("category")
+        self.right_df["key"] = self.right_df["key"].astype("category")
+        self.right_df["key"] = self.right_df["key"].cat.reorder_categories(
+            self.right_df["key"].cat.categories[::-1])
+
+    def time_safe_merge(self, n_rows, how):
+        safe_merge(self.left_df, self.right_df, how=how, on="key", logger=LOGGER)
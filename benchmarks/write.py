@@ -0,0 +1,35 @@
+"""Benchmarks of the writers, for each format."""
+import shutil
+import tempfile
+from pathlib import Path
+from pandas_keeper.write import write
+from .generators import N_ROWS, make_mixed_df
+
+FORMATS = {
+    "csv": {"index": False},
+    "csv.gz": {"index": False},
+    "csv.zst": {"index": False},
+    "jsonl": {},
+    "pq": {},
+    "pkl": {},
+    "pkl5": {}
+}
+
+
+class Write(object):
+    params = (N_ROWS, list(FORMATS))
+    param_names = ["n_rows", "file_format"]
+
+    def setup(self, n_rows, file_format):
+        self.folder = Path(tempfile.mkdtemp())
+        self.file_path = str(self.folder / ("data.%s" % file_format))
+        self.df = make_mixed_df(n_rows)
+
+    def teardown(self, n_rows, file_format):
+        shutil.rmtree(self.folder)
+
+    def time_write(self, n_rows, file_format):
+        write(self.df, self.file_path, **FORMATS[file_format])
+
+    def peakmem_write(self, n_rows, file_format):
+        write(self.df, self.file_path, **FORMATS[file_format])
@@ -1,12 +1,28 @@
-from pandas.core.frame import DataFrame, Series
-from .assert_check import assert_type, assert_values, safe_replace, safe_replace_series
-from .safe_merger import safe_merge
+from importlib import import_module
+
+# Public functions -> module defining them. The modules are imported on the first access to one of
+# their functions, so that importing pandas_keeper or one of its light modules is cheap.
+_LAZY_FUNCTIONS = {
+    "assert_type": "assert_check",
+    "assert_values": "assert_check",
+    "safe_replace": "assert_check",
+    "safe_replace_series": "assert_check",
+    "safe_merge": "safe_merger"
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_FUNCTIONS:
+        return getattr(import_module("%s.%s" % (__name__, _LAZY_FUNCTIONS[name])), name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
 
 def patch_pandas():
+    from pandas import DataFrame, Series
+    from . import assert_check, safe_merger
     # Monkey patch pandas
-    DataFrame.safe_merge = safe_merge
-    DataFrame.safe_replace = safe_replace
-    Series.assert_values = assert_values
-    Series.assert_type = assert_type
-    Series.safe_replace = safe_replace_series
+    DataFrame.safe_merge = safe_merger.safe_merge
+    DataFrame.safe_replace = assert_check.safe_replace
+    Series.assert_values = assert_check.assert_values
+    Series.assert_type = assert_check.assert_type
+    Series.safe_replace = assert_check.safe_replace_series
@@ -1,6 +1,7 @@
 from typing import Sized, Dict, Union, Optional
 import pandas as pd
 from pandas import DataFrame, Series
+from pandas.api.types import pandas_dtype, is_object_dtype, CategoricalDtype
 
 
 def _assert_empty_wrong_values(wrong_values: Sized, msg: str) -> None:
@@ -14,14 +15,42 @@ def assert_values(pds, values):
         pds (Series): Series to be checked.
         values (set, list-like): Values allowed to be found in the Series. N/A value are ignored.
     """
-    nn_col = pds[pds.notnull()]
-    nn_col_in = nn_col.isin(values)
-    wrong_values = set(nn_col[~nn_col_in])
+    wrong_values = set(get_wrong_values(pds, values))
     _assert_empty_wrong_values(wrong_values,
                                "These values should not be present in the pandas Series %s: %s" %
                                (pds.name, wrong_values))
 
 
+def get_wrong_values(pds: Series, values) -> Series:
+    """Get the non null values of the Series which are not among the expected ones."""
+    arrow_array = _get_arrow_array(pds)
+    if arrow_array is not None:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        try:
+            value_set = pa.array(list(values), type=arrow_array.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            value_set = None  # Some values cannot be Arrow values of the Series type.
+        if value_set is not None:
+            wrong_idx = pc.and_kleene(pc.is_valid(arrow_array),
+                                      pc.invert(pc.is_in(arrow_array, value_set=value_set)))
+            return pds[wrong_idx.to_numpy(zero_copy_only=False)]
+    nn_col = pds[pds.notnull()]
+    return nn_col[~nn_col.isin(values)]
+
+
+def _get_arrow_array(pds: Series):
+    """Get the Arrow array backing the Series (e.g. string[pyarrow]), None if it is not backed by
+    Arrow. The checks of Arrow-backed Series use pyarrow.compute kernels instead of Python objects.
+    """
+    if not (getattr(pds.dtype, "storage", None) == "pyarrow" or
+            hasattr(pds.dtype, "pyarrow_dtype")):
+        return None
+    array = pds.array
+    # The Arrow array attribute has been renamed from _data to _pa_array in pandas 2.
+    return array._pa_array if hasattr(array, "_pa_array") else array._data
+
+
 def safe_replace(df: DataFrame, values: Dict[str, Dict],
                  strip: Union[bool, Dict[str, bool]] = True,
                  lower: Union[bool, Dict[str, bool]] = False,
@@ -50,8 +79,16 @@ def safe_replace(df: DataFrame, values: Dict[str, Dict],
     return df
 
 
-def safe_replace_series(pds: Series, values: Dict, strip: bool = True,
-                        lower: bool = False, inplace=False) -> Optional[Series]:
+def replace_series(pds: Series, values: Dict, strip: bool = True,
+                   lower: bool = False, inplace=False) -> Optional[Series]:
+    """Replace the values of the Series as `safe_replace_series` does, without checking them."""
+    arrow_array = _get_arrow_array(pds)
+    if arrow_array is not None and _is_arrow_string(arrow_array):
+        replaced_pds = _replace_arrow_strings(pds, arrow_array, values, strip, lower)
+        if not inplace:
+            return replaced_pds
+        pds[:] = replaced_pds.array
+        return None
     if not inplace:
         pds = pds.copy()
     if strip and pds.dtype == "object":
@@ -62,6 +99,47 @@ def safe_replace_series(pds: Series, values: Dict, strip: bool = True,
         pds.loc[str_idx] = pds.loc[str_idx].str.lower()
         values = {k.lower(): v for k, v in values.items()}
     pds.replace(values, inplace=True)
+    if not inplace:
+        return pds
+    return None
+
+
+def _is_arrow_string(arrow_array) -> bool:
+    import pyarrow as pa
+    return pa.types.is_string(arrow_array.type) or pa.types.is_large_string(arrow_array.type)
+
+
+def _replace_arrow_strings(pds: Series, arrow_array, values: Dict, strip: bool,
+                           lower: bool) -> Series:
+    """Replace the values of a Series of Arrow strings with pyarrow.compute kernels.
+
+    The Series stays backed by Arrow if the replacement values are strings, otherwise it is
+    replaced as an object Series once stripped and lowered.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    if strip:
+        arrow_array = pc.utf8_trim_whitespace(arrow_array)
+    if lower:
+        arrow_array = pc.utf8_lower(arrow_array)
+        values = {k.lower(): v for k, v in values.items()}
+    try:
+        old_values = pa.array(list(values), type=arrow_array.type)
+        new_values = pa.array(list(values.values()), type=arrow_array.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        pds = Series(pd.arrays.ArrowStringArray(arrow_array), index=pds.index, name=pds.name)
+        return pds.astype(object).replace(values)
+    value_idx = pc.index_in(arrow_array, value_set=old_values)
+    replaced_array = pc.if_else(pc.is_null(value_idx), arrow_array, pc.take(new_values, value_idx))
+    return Series(pd.arrays.ArrowStringArray(replaced_array), index=pds.index, name=pds.name)
+
+
+def safe_replace_series(pds: Series, values: Dict, strip: bool = True,
+                        lower: bool = False, inplace=False) -> Optional[Series]:
+    if inplace:
+        replace_series(pds, values, strip, lower, inplace=True)
+    else:
+        pds = replace_series(pds, values, strip, lower)
     assert_values(pds, values.values())
     if not inplace:
         return pds
@@ -87,9 +165,66 @@ def assert_type(pds, dtype, na_allowed):
         na_allowed (bool): Are N/A values allowed ?
 
     """
-    non_null_idx = assert_non_null_idx(pds, na_allowed, return_value=True)
-    nn_col = pds[non_null_idx]
-    wrong_values = set(nn_col[nn_col != nn_col.astype(dtype)])
+    assert_non_null_idx(pds, na_allowed)
+    wrong_values = set(get_wrong_type_values(pds, dtype))
     _assert_empty_wrong_values(wrong_values,
                                "The Series %s has value(s) of a type different from %s: %s" %
                                (pds.name, dtype, wrong_values))
+
+
+def get_wrong_type_values(pds: Series, dtype) -> Series:
+    """Get the non null values of the Series which are not of the expected type."""
+    expected_dtype = pandas_dtype(dtype)
+    if expected_dtype == pds.dtype and not is_object_dtype(expected_dtype):
+        # The values have already been parsed or cast in the expected dtype.
+        return pds.iloc[:0]
+    if isinstance(pds.dtype, CategoricalDtype):
+        # The values are checked once per category rather than once per row.
+        wrong_categories = get_wrong_type_values(Series(pds.cat.categories), dtype)
+        return pds[pds.isin(wrong_categories)]
+    arrow_array = _get_arrow_array(pds)
+    if arrow_array is not None:
+        wrong_idx = _get_arrow_wrong_type_idx(arrow_array, expected_dtype)
+        if wrong_idx is not None:
+            return pds[wrong_idx.to_numpy(zero_copy_only=False)]
+    nn_col = pds[pds.notnull()]
+    try:
+        return nn_col[nn_col != nn_col.astype(dtype)]
+    except (ValueError, TypeError):
+        # Some values cannot be cast in the dtype, they are looked for one by one.
+        return nn_col[~nn_col.map(lambda value: _is_of_type(value, dtype)).astype(bool)]
+
+
+def _get_arrow_wrong_type_idx(arrow_array, expected_dtype):
+    """Get the mask of the non null values of the Arrow array which are not of the expected type,
+    None if the types are not handled with Arrow.
+
+    Like the values of an object Series, the Arrow strings are not of a numeric type, and the
+    Arrow numbers are of a numeric type if they are unchanged by their cast in it and back.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    is_string = _is_arrow_string(arrow_array)
+    is_numeric = pa.types.is_integer(arrow_array.type) or \
+        pa.types.is_floating(arrow_array.type) or pa.types.is_boolean(arrow_array.type)
+    kind = getattr(expected_dtype, "kind", None)
+    if kind == "O" or (kind == "U" and is_string):
+        return pc.and_kleene(pc.is_valid(arrow_array), False)
+    if kind == "U" and is_numeric:
+        return pc.is_valid(arrow_array)
+    if kind not in ("b", "i", "u", "f"):
+        return None
+    if is_string:
+        return pc.is_valid(arrow_array)
+    if not is_numeric:
+        return None
+    cast_array = pc.cast(arrow_array, pa.from_numpy_dtype(expected_dtype), safe=False)
+    unchanged = pc.equal(pc.cast(cast_array, arrow_array.type, safe=False), arrow_array)
+    return pc.and_kleene(pc.is_valid(arrow_array), pc.invert(unchanged))
+
+
+def _is_of_type(value, dtype) -> bool:
+    try:
+        return bool(Series([value]).astype(dtype).iloc[0] == value)
+    except (ValueError, TypeError):
+        return False
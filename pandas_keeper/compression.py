@@ -0,0 +1,72 @@
+from enum import Enum
+from pathlib import Path
+from typing import IO, Optional, Tuple, Union
+
+
+class Compression(Enum):
+    gzip = "gzip"
+    bz2 = "bz2"
+    xz = "xz"
+    zstd = "zstd"
+    lz4 = "lz4"
+
+
+COMPRESSION_EXTENSIONS = {
+    "gz": Compression.gzip,
+    "gzip": Compression.gzip,
+    "bz2": Compression.bz2,
+    "xz": Compression.xz,
+    "zst": Compression.zstd,
+    "zstd": Compression.zstd,
+    "lz4": Compression.lz4
+}
+
+
+def split_compression(file_path: Union[str, Path]) -> Tuple[str, Optional[Compression]]:
+    """Split the extension of a file and its compression, e.g. "data.csv.gz" -> ("csv", gzip).
+
+    Args:
+        file_path (str or Path): File path.
+
+    Returns:
+        The extension of the file once decompressed, and its compression if any.
+    """
+    extensions = str(file_path).split(".")
+    compression = COMPRESSION_EXTENSIONS.get(extensions[-1].lower())
+    if compression is not None and len(extensions) > 2:
+        return extensions[-2], compression
+    return extensions[-1], None
+
+
+def open_compressed(file_path: Union[str, Path, IO[bytes]], mode: str, compression: Compression,
+                    threads: int = -1) -> IO[bytes]:
+    """Open a compressed file as a binary stream, (de)compressed while it is read or written.
+
+    Args:
+        file_path (str, Path or binary file object): File path, or file already opened.
+        mode (str): "rb" or "wb".
+        compression (Compression): Compression of the file.
+        threads (int, default: -1): Number of threads compressing the stream, only zstd can
+            compress with several threads. -1 uses as many threads as CPUs.
+    """
+    if not hasattr(file_path, "read") and not hasattr(file_path, "write"):
+        file_path = str(file_path)
+    if compression is Compression.gzip:
+        import gzip
+        return gzip.open(file_path, mode)  # type: ignore
+    if compression is Compression.bz2:
+        import bz2
+        return bz2.open(file_path, mode)  # type: ignore
+    if compression is Compression.xz:
+        import lzma
+        return lzma.open(file_path, mode)  # type: ignore
+    if compression is Compression.zstd:
+        import zstandard
+        f = open(str(file_path), mode) if isinstance(file_path, (str, Path)) else file_path
+        if "w" in mode:
+            return zstandard.ZstdCompressor(threads=threads).stream_writer(f)
+        return zstandard.ZstdDecompressor().stream_reader(f)
+    if compression is Compression.lz4:
+        import lz4.frame
+        return lz4.frame.open(file_path, mode)
+    raise NotImplementedError("%s compression is not implemented." % compression)
@@ -1,12 +1,18 @@
 from collections.abc import Sequence
+from inspect import signature
 from typing import Callable, Dict, Any, Optional, List, Tuple
-from pandas import Series, DataFrame
+from pandas import Series, DataFrame, to_numeric
 from pandas._typing import Dtype
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import is_object_dtype, pandas_dtype
 from pydantic import validator
 from pydantic.main import BaseModel
-from pandas_keeper import safe_replace_series
 from enum import Enum
-from pandas_keeper.assert_check import _assert_empty_wrong_values, assert_type, assert_non_null_idx
+from pandas_keeper.assert_check import _assert_empty_wrong_values, assert_type, \
+    assert_non_null_idx, replace_series, safe_replace_series, get_wrong_values, \
+    get_wrong_type_values
+from pandas_keeper.df_keeper.parallel import ExecutorKind, get_executor
+from pandas_keeper.df_keeper.report import ColumnCheck, ValidationReport
 
 
 class ColumnActionName(Enum):
@@ -27,6 +33,9 @@ class ColumnAction(BaseModel):  # type: ignore
     kwargs: Dict[str, Any] = {}
     inplace: bool = False
 
+    class Config:
+        allow_mutation = False
+
     @validator("method", pre=True, always=True)
     def set_method(cls, _, values):
         if values["name"] is ColumnActionName.safe_replace:
@@ -54,6 +63,56 @@ class ColumnAction(BaseModel):  # type: ignore
         return kwargs
 
 
+def _is_replace_dict(action: ColumnAction) -> bool:
+    return action.name is ColumnActionName.replace and len(action.args) == 1 and \
+        isinstance(action.args[0], dict) and action.kwargs == {"inplace": True}
+
+
+def _compose_replace_dicts(first: Dict, second: Dict) -> Optional[Dict]:
+    """Compose two replacement dictionaries so that replacing with the result is the same as
+    replacing with `first` then with `second`. None if a value of `first` is not hashable."""
+    try:
+        composed = {key: second.get(value, value) for key, value in first.items()}
+    except TypeError:
+        return None
+    composed.update({key: value for key, value in second.items() if key not in first})
+    return composed
+
+
+def _is_same_astype(action: ColumnAction, other_action: ColumnAction) -> bool:
+    return action.name is ColumnActionName.astype and other_action.name is ColumnActionName.astype \
+        and action.args == other_action.args and action.kwargs == other_action.kwargs
+
+
+def compile_actions(actions: List[ColumnAction]) -> List[ColumnAction]:
+    """Compile the actions into an equivalent list of actions needing less passes on the column.
+
+    - `replace` actions with an empty dictionary are dropped.
+    - Consecutive `replace` actions with a dictionary are merged into one.
+    - An `astype` action identical to the previous action is dropped.
+    """
+    compiled_actions: List[ColumnAction] = []
+    for action in actions:
+        if _is_replace_dict(action) and not action.args[0]:
+            continue
+        previous_action = compiled_actions[-1] if compiled_actions else None
+        if previous_action is None:
+            compiled_actions.append(action)
+        elif _is_same_astype(previous_action, action):
+            continue
+        elif _is_replace_dict(previous_action) and _is_replace_dict(action):
+            composed = _compose_replace_dicts(previous_action.args[0], action.args[0])
+            if composed is None:
+                compiled_actions.append(action)
+            else:
+                compiled_actions[-1] = ColumnAction(name=ColumnActionName.replace,
+                                                    args=(composed, ))
+        else:
+            compiled_actions.append(action)
+    return compiled_actions
+
+
+# noinspection PyMethodParameters
 class ColumnKeeper(BaseModel):
     name: str
     dtype: Optional[Dtype] = None
@@ -61,9 +120,70 @@ class ColumnKeeper(BaseModel):
     rename: Optional[str] = None
     actions: List[ColumnAction] = []
     drop: bool = False
+    compact: Optional[bool] = None
 
     class Config:
         arbitrary_types_allowed = True
+        allow_mutation = False
+
+    @validator("actions")
+    def set_compiled_actions(cls, actions):
+        # Compiled once when the schema is validated, the DFKeeper can then be reused by import_df.
+        return compile_actions(actions)
+
+
+ColumnKeeper.update_forward_refs(ExtensionDtype=ExtensionDtype)
+
+
+def get_parse_dtype(column_keeper: ColumnKeeper) -> Optional[Dtype]:
+    """Get the dtype in which the column can be directly parsed by the reader.
+
+    It is the dtype of the last `astype` action if the column has only `astype` actions and this
+    dtype is numeric, else the dtype of the column if it has no actions. Parsing in another dtype
+    does not give the same values as casting the inferred ones (e.g. "007" is parsed as the str
+    "007" but cast from 7 into "7"), and the other actions expect the raw values, so these columns
+    are parsed as the reader infers them.
+
+    The nullable columns are not parsed in a numpy integer or boolean dtype, which cannot hold N/A
+    values: they are read as inferred and only checked against their dtype.
+    """
+    astype_actions = [action for action in column_keeper.actions
+                      if action.name is ColumnActionName.astype]
+    if len(astype_actions) != len(column_keeper.actions):
+        return None
+    if astype_actions:
+        astype_dtype = astype_actions[-1].args[0]
+        return astype_dtype if _is_numeric(astype_dtype) else None
+    if column_keeper.nullable and column_keeper.dtype is not None and \
+            not _can_hold_na(column_keeper.dtype):
+        return None
+    return column_keeper.dtype
+
+
+def _is_numeric(dtype: Dtype) -> bool:
+    """Is the dtype a numpy or nullable integer or float dtype ?"""
+    return pandas_dtype(dtype).kind in "iuf"
+
+
+def _can_hold_na(dtype: Dtype) -> bool:
+    dtype = pandas_dtype(dtype)
+    return isinstance(dtype, ExtensionDtype) or dtype.kind not in "biu"
+
+
+def get_columns_dtypes(column_keepers: List[ColumnKeeper]) -> Dict[str, Dtype]:
+    """Get the dtypes which can be given to the reader for the columns to be parsed directly."""
+    dtypes = {col.name: get_parse_dtype(col) for col in column_keepers}
+    return {name: dtype for name, dtype in dtypes.items() if dtype is not None}
+
+
+def parse_numeric_values(df: DataFrame, dtypes: Dict[str, Dtype]) -> DataFrame:
+    """Parse one by one the values of the columns read as inferred after their parse in a numeric
+    dtype has failed, so that the dtype checks only report the values which cannot be parsed."""
+    for name, dtype in dtypes.items():
+        if name in df.columns and is_object_dtype(df[name].dtype) and _is_numeric(dtype):
+            numbers = to_numeric(df[name], errors="coerce")
+            df[name] = df[name].where(numbers.isna(), numbers)
+    return df
 
 
 def check_df_keeper_columns_are_in_df(df: DataFrame, column_keepers: List[ColumnKeeper]) -> None:
@@ -80,7 +200,18 @@ def transform_column(pds: Series, action: ColumnAction) -> Series:
     return pds
 
 
-def treat_column(pds: Series, column_keeper: ColumnKeeper) -> Series:
+def treat_column(pds: Series, column_keeper: ColumnKeeper,
+                 report: Optional[ValidationReport] = None) -> Series:
+    """Apply the actions of the ColumnKeeper to the column and check the result.
+
+    Args:
+        pds (Series): Column to treat.
+        column_keeper (ColumnKeeper): Actions and checks of the column.
+        report (ValidationReport): If specified, the failed checks are added to the report instead
+            of raising an AssertionError.
+    """
+    if report is not None:
+        return _treat_column_with_report(pds, column_keeper, report)
     for action in column_keeper.actions:
         pds = transform_column(pds, action)
     if column_keeper.dtype is not None:
@@ -88,3 +219,92 @@ def treat_column(pds: Series, column_keeper: ColumnKeeper) -> Series:
     elif not column_keeper.nullable:
         assert_non_null_idx(pds, column_keeper.nullable)
     return pds
+
+
+def _treat_column_with_report(pds: Series, column_keeper: ColumnKeeper,
+                              report: ValidationReport) -> Series:
+    name = column_keeper.name
+    for action in column_keeper.actions:
+        if action.name is ColumnActionName.safe_replace:
+            arguments = signature(safe_replace_series).bind(pds, *action.args, **action.kwargs)
+            arguments.arguments["inplace"] = False
+            pds = replace_series(*arguments.args, **arguments.kwargs)
+            report.add(name, ColumnCheck.values,
+                       get_wrong_values(pds, arguments.arguments["values"].values()))
+            continue
+        try:
+            pds = transform_column(pds, action)
+        except Exception as error:
+            # The next checks are meaningless on a column whose action has failed.
+            report.add(name, ColumnCheck.action, ["%s: %s" % (action.name.value, error)],
+                       count=len(pds))
+            return pds
+    if not column_keeper.nullable:
+        n_null = int(pds.isnull().sum())
+        report.add(name, ColumnCheck.nullable, [None] if n_null else [], count=n_null)
+    if column_keeper.dtype is not None:
+        report.add(name, ColumnCheck.dtype, get_wrong_type_values(pds, column_keeper.dtype))
+    return pds
+
+
+def _treat_column_with_own_report(pds: Series, column_keeper: ColumnKeeper,
+                                  n_examples: int) -> Tuple[Series, ValidationReport]:
+    report = ValidationReport(n_examples=n_examples)
+    return treat_column(pds, column_keeper, report), report
+
+
+def _get_column_copy(df: DataFrame, name: str) -> Series:
+    """Copy the column given to a worker: the in-place actions on a column cached by the DataFrame
+    update its BlockManager, which must not be done by several threads at once."""
+    return df[name].copy()
+
+
+def treat_columns(df: DataFrame, column_keepers: List[ColumnKeeper],
+                  executor_kind: Optional[ExecutorKind] = None,
+                  max_workers: Optional[int] = None,
+                  report: Optional[ValidationReport] = None) -> List[Series]:
+    """Treat the columns of the DataFrame, sequentially or in parallel with an executor.
+
+    In parallel, all the columns are treated before raising: the check errors of all columns are
+    gathered in one AssertionError, the other errors are raised in the order of the columns.
+
+    Args:
+        df (DataFrame): DataFrame having the columns to treat.
+        column_keepers (list of ColumnKeeper): Columns to treat.
+        executor_kind (ExecutorKind): Kind of executor used to treat the columns in parallel, the
+            columns are treated sequentially if not specified.
+        max_workers (int): Maximum number of workers of the executor.
+        report (ValidationReport): If specified, the failed checks are added to the report, in the
+            order of the columns, instead of raising an AssertionError.
+
+    Returns:
+        The treated columns, in the order of `column_keepers`.
+    """
+    if report is not None:
+        n_examples = report.n_examples
+        if executor_kind is None:
+            results = [_treat_column_with_own_report(df[col.name], col, n_examples)
+                       for col in column_keepers]
+        else:
+            with get_executor(executor_kind, max_workers) as executor:
+                futures = [executor.submit(_treat_column_with_own_report,
+                                           _get_column_copy(df, col.name), col, n_examples)
+                           for col in column_keepers]
+            results = [future.result() for future in futures]
+        for _, column_report in results:
+            report.extend(column_report)
+        return [pds for pds, _ in results]
+    if executor_kind is None:
+        return [treat_column(df[col.name], col) for col in column_keepers]
+    with get_executor(executor_kind, max_workers) as executor:
+        futures = [executor.submit(treat_column, _get_column_copy(df, col.name), col)
+                   for col in column_keepers]
+    treated_columns, errors = [], []
+    for col, future in zip(column_keepers, futures):
+        try:
+            treated_columns.append(future.result())
+        except AssertionError as error:
+            errors.append("%s: %s" % (col.name, error))
+    _assert_empty_wrong_values(errors, "Those columns have failed their checks:\n%s" %
+                               "\n".join(errors))
+    return treated_columns
@@ -0,0 +1,73 @@
+from typing import Dict, List
+import pandas as pd
+from pandas import DataFrame, Series
+from pandas.api.types import is_integer_dtype, is_float_dtype, is_object_dtype, \
+    is_extension_array_dtype, infer_dtype
+from pandas_keeper.logger import Logger
+
+LOGGER = Logger()
+CATEGORY_MAX_RATIO = 0.5
+
+
+def _arrow_string_dtype():
+    try:
+        return pd.api.types.pandas_dtype("string[pyarrow]")
+    except (TypeError, ImportError):
+        return None
+
+
+def compact_column(pds: Series, category_max_ratio: float = CATEGORY_MAX_RATIO) -> Series:
+    """Convert the Series in the smallest dtype able to represent its values without loss.
+
+    - integers are downcast in the smallest (unsigned) integer dtype within their value range.
+    - floats are downcast to float32 if all their values are exactly representable.
+    - strings are converted to category if the number of unique values is lower than
+      `category_max_ratio` times the number of values, else to Arrow strings if available.
+
+    Args:
+        pds (Series): Series to compact.
+        category_max_ratio (float, default: 0.5): Maximum ratio of unique values to the number of
+            values for a string Series to be converted to category.
+    """
+    if is_extension_array_dtype(pds.dtype):
+        return pds
+    if is_integer_dtype(pds.dtype):
+        downcast = "unsigned" if len(pds) and pds.min() >= 0 else "integer"
+        return pd.to_numeric(pds, downcast=downcast)
+    if is_float_dtype(pds.dtype):
+        compacted_pds = pds.astype("float32")
+        if ((compacted_pds == pds) | pds.isnull()).all():
+            return compacted_pds
+        return pds
+    if is_object_dtype(pds.dtype) and infer_dtype(pds, skipna=True) == "string":
+        if pds.nunique() <= category_max_ratio * len(pds):
+            return pds.astype("category")
+        arrow_string_dtype = _arrow_string_dtype()
+        if arrow_string_dtype is not None:
+            return pds.astype(arrow_string_dtype)
+    return pds
+
+
+def compact_columns(columns: Dict[str, Series], to_compact: List[str]) -> Dict[str, Series]:
+    """Compact the given columns and log the memory saved.
+
+    Args:
+        columns (dict of str, Series): Column name -> column.
+        to_compact (list of str): Names of the columns to compact.
+    """
+    compacted_columns = dict(columns)
+    memory_before = sum(columns[name].memory_usage(index=False, deep=True) for name in to_compact)
+    for name in to_compact:
+        compacted_columns[name] = compact_column(columns[name])
+    memory_after = sum(compacted_columns[name].memory_usage(index=False, deep=True)
+                       for name in to_compact)
+    LOGGER.logger.info("Compaction of %i columns: %.2f MB -> %.2f MB, %.2f MB saved." % (
+        len(to_compact), memory_before / 2 ** 20, memory_after / 2 ** 20,
+        (memory_before - memory_after) / 2 ** 20))
+    return compacted_columns
+
+
+def compact_df(df: DataFrame, columns: List[str]) -> DataFrame:
+    """Compact the given columns of the DataFrame and log the memory saved."""
+    compacted_columns = compact_columns({col: df[col] for col in columns}, columns)
+    return df.assign(**compacted_columns)
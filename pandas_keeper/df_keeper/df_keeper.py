@@ -1,23 +1,70 @@
 from pathlib import Path
-from typing import Dict, Any, List
-from pydantic import root_validator, BaseModel
+from typing import Dict, Any, List, Optional, Tuple, Union
+from pydantic import root_validator, validator, BaseModel
+from pandas_keeper.compression import split_compression
 from pandas_keeper.df_keeper.column_keeper import ColumnKeeper
-from pandas_keeper.df_keeper.read import DataReaderExtension
+from pandas_keeper.df_keeper.parallel import ExecutorKind
+from pandas_keeper.df_keeper.read import DataReaderExtension, DataReaderEngine, \
+    ENGINE_DATA_READER, EXCEL_READERS, FILTERS_READERS, get_extension, is_registered, \
+    to_reader_extension
+from pandas_keeper.storage import StorageUrl
 
 
 # noinspection PyMethodParameters
 class DFKeeper(BaseModel):
 
-    file_path: Path
-    reader: DataReaderExtension
+    file_path: Union[StorageUrl, Path]
+    reader: Union[DataReaderExtension, str]
+    reader_engine: DataReaderEngine = DataReaderEngine.pandas
     read_arguments: Dict[str, Any] = dict()
     columns: List[ColumnKeeper] = list()
     keep_only: bool = False
+    compact: bool = False
+    executor: Optional[ExecutorKind] = None
+    max_workers: Optional[int] = None
+    sheets: Optional[List[Union[int, str]]] = None
+    cache_folder: Optional[Path] = None
+    filters: Optional[List[Tuple[str, str, Any]]] = None
+
+    class Config:
+        allow_mutation = False
 
     @root_validator(pre=True)
     def set_reader(cls, values) -> Dict[str, Any]:
         reader = values.get("reader")
         if reader is None:
-            reader = values["file_path"].split(".")[-1].lower()
-        values["reader"] = DataReaderExtension(reader)
+            reader = split_compression(values["file_path"])[0].lower()
+        reader = to_reader_extension(reader)
+        if not is_registered(reader):
+            raise ValueError("No reader is registered for .%s files." % get_extension(reader))
+        values["reader"] = reader
         return values
+
+    @validator("reader_engine")
+    def check_engine_supports_reader(cls, reader_engine, values):
+        reader = values.get("reader")
+        assert reader is None or reader in ENGINE_DATA_READER[reader_engine], \
+            "The %s engine cannot read .%s files." % (reader_engine.value,
+                                                      get_extension(reader))
+        return reader_engine
+
+    @validator("sheets", "cache_folder")
+    def check_excel_reader(cls, value, values, field):
+        reader = values.get("reader")
+        assert value is None or reader is None or reader in EXCEL_READERS, \
+            "%s can only be specified for Excel files." % field.name
+        return value
+
+    @validator("sheets")
+    def check_sheets_not_in_read_arguments(cls, sheets, values):
+        assert sheets is None or "sheet_name" not in values.get("read_arguments", {}), \
+            "sheets and the sheet_name read argument cannot be both specified."
+        return sheets
+
+    @validator("filters")
+    def check_reader_supports_filters(cls, filters, values):
+        reader, reader_engine = values.get("reader"), values.get("reader_engine")
+        assert filters is None or reader is None or reader_engine is None or \
+            reader in FILTERS_READERS[reader_engine], \
+            "The .%s reader cannot filter rows." % get_extension(reader)
+        return filters
@@ -1,20 +1,122 @@
-from typing import Dict, Any
-from pandas import DataFrame
-from .column_keeper import check_df_keeper_columns_are_in_df, treat_column
+from typing import Dict, Any, List, Union
+import pandas as pd
+from pandas import DataFrame, Series
+from .column_keeper import check_df_keeper_columns_are_in_df, treat_columns, get_columns_dtypes, \
+    parse_numeric_values
+from .compact import compact_columns
 from .df_keeper import DFKeeper
-from .read import read_data
-
-
-def import_df(df_keeper_schema: Dict[str, Any]) -> DataFrame:
-    df_keeper = DFKeeper(**df_keeper_schema)
-    df = read_data(df_keeper.file_path, df_keeper.reader, **df_keeper.read_arguments)
-    check_df_keeper_columns_are_in_df(df, df_keeper.columns)
-    if df_keeper.keep_only:
-        df = df[[col.name for col in df_keeper.columns]]
-    for col in df_keeper.columns:
-        df[col.name] = treat_column(df[col.name], col)
-    to_drop = [col.name for col in df_keeper.columns if col.drop]
-    df.drop(columns=to_drop, inplace=True)
+from .read import read_data, read_excel_sheets, COLUMNS_READERS, DTYPE_READERS
+from .registry import get_df_keeper
+from .report import ColumnCheck, ValidationReport
+
+
+def import_df(df_keeper_schema: Union[str, Dict[str, Any], DFKeeper],
+              collect_errors: bool = False) -> DataFrame:
+    """Import the DataFrame described by the schema.
+
+    Args:
+        df_keeper_schema (str, dict or DFKeeper): Schema of the DataFrame, or name of a schema
+            registered in SCHEMA_REGISTRY. A DFKeeper already validated can be given to import many
+            files with the same schema without validating it again.
+        collect_errors (bool, default: False): Should all the checks of all the columns be run
+            before raising ? The failed checks are then raised at once in a ValidationReportError
+            holding the report of the checks, instead of raising at the first failed check.
+    """
+    df_keeper = get_df_keeper(df_keeper_schema)
+    df = _read_df_keeper_data(df_keeper, collect_errors)
+    report = None
+    column_keepers = df_keeper.columns
+    if collect_errors:
+        report = ValidationReport(n_rows=len(df))
+        column_keepers = [col for col in df_keeper.columns if col.name in df.columns]
+        for col in df_keeper.columns:
+            if col.name not in df.columns:
+                report.add(col.name, ColumnCheck.presence, [col.name])
+    else:
+        check_df_keeper_columns_are_in_df(df, df_keeper.columns)
+    treated_columns = treat_columns(df, column_keepers, df_keeper.executor,
+                                    df_keeper.max_workers, report)
+    if report is not None:
+        report.assert_valid()
+    columns = {col.name: pds for col, pds in zip(column_keepers, treated_columns)}
+    names = list(columns) if df_keeper.keep_only else list(df.columns)
+    dropped = {col.name for col in df_keeper.columns if col.drop}
+    columns = {name: columns[name] if name in columns else df[name] for name in names
+               if name not in dropped}
+    to_compact = _get_columns_to_compact(df_keeper, list(columns))
+    if to_compact:
+        columns = compact_columns(columns, to_compact)
+    return _assemble_df(df_keeper, columns, df)
+
+
+def _read_df(df_keeper: DFKeeper, read_arguments: Dict[str, Any]) -> DataFrame:
+    if df_keeper.sheets is not None or df_keeper.cache_folder is not None:
+        return read_excel_sheets(df_keeper.file_path, df_keeper.sheets, df_keeper.cache_folder,
+                                 df_keeper.executor, df_keeper.max_workers, **read_arguments)
+    return read_data(df_keeper.file_path, df_keeper.reader,
+                     reader_engine=df_keeper.reader_engine, **read_arguments)
+
+
+def _read_df_keeper_data(df_keeper: DFKeeper, collect_errors: bool) -> DataFrame:
+    read_arguments = get_read_arguments(df_keeper)
+    try:
+        return _read_df(df_keeper, read_arguments)
+    except ValueError:
+        projected = "columns" in read_arguments and "columns" not in df_keeper.read_arguments
+        parsed = read_arguments.get("dtype") != df_keeper.read_arguments.get("dtype")
+        if not (collect_errors or projected or parsed):
+            raise
+    # A column of the projection is missing, or some values cannot be parsed in their dtype: the
+    # file is read again as the reader infers it, so that the checks report them.
+    df = _read_df(df_keeper, get_read_arguments(df_keeper, parse_dtypes=False,
+                                                project_columns=False))
+    return parse_numeric_values(df, read_arguments.get("dtype") or {})
+
+
+def get_read_arguments(df_keeper: DFKeeper, parse_dtypes: bool = True,
+                       project_columns: bool = True) -> Dict[str, Any]:
+    """Add to the read arguments what the reader of the file can do while reading:
+        - parse the columns directly in their final dtypes, the dtypes given in the read
+          arguments take precedence,
+        - read only the columns kept,
+        - skip the rows which do not match the filters.
+    """
+    read_arguments = dict(df_keeper.read_arguments)
+    if df_keeper.filters is not None:
+        read_arguments["filters"] = df_keeper.filters
+    if project_columns and df_keeper.keep_only and df_keeper.columns and \
+            df_keeper.reader in COLUMNS_READERS[df_keeper.reader_engine] and \
+            "columns" not in read_arguments:
+        read_arguments["columns"] = [col.name for col in df_keeper.columns]
+    read_dtype = read_arguments.get("dtype")
+    if not parse_dtypes or df_keeper.reader not in DTYPE_READERS[df_keeper.reader_engine] or \
+            not (read_dtype is None or isinstance(read_dtype, dict)):
+        return read_arguments
+    dtype = {**get_columns_dtypes(df_keeper.columns), **(read_dtype or {})}
+    if dtype:
+        read_arguments["dtype"] = dtype
+    return read_arguments
+
+
+def _get_columns_to_compact(df_keeper: DFKeeper, columns: List[str]) -> List[str]:
+    """Get the columns to compact: the ones whose ColumnKeeper asks it explicitly, else, if the
+    DFKeeper asks it, the ones with no dtype declared."""
+    column_keepers = {col.name: col for col in df_keeper.columns}
+    to_compact = []
+    for name in columns:
+        col = column_keepers.get(name)
+        if col is not None and col.compact is not None:
+            if col.compact:
+                to_compact.append(name)
+        elif df_keeper.compact and (col is None or col.dtype is None):
+            to_compact.append(name)
+    return to_compact
+
+
+def _assemble_df(df_keeper: DFKeeper, columns: Dict[str, Series], df: DataFrame) -> DataFrame:
+    """Build the output DataFrame from its renamed columns in a single construction step."""
+    if not columns:
+        return DataFrame(index=df.index)
     rename_values = {col.name: col.rename for col in df_keeper.columns if col.rename is not None}
-    df.rename(columns=rename_values, inplace=True)
-    return df
+    return pd.concat(list(columns.values()), axis=1, copy=False,
+                     keys=[rename_values.get(name, name) for name in columns])
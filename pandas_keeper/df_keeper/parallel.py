@@ -0,0 +1,20 @@
+from enum import Enum
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+class ExecutorKind(Enum):
+    """Kind of executor: threads for the actions releasing the GIL (NumPy, Arrow), processes for
+    the ones running Python code on each value."""
+    thread = "thread"
+    process = "process"
+
+
+def get_executor(executor_kind: ExecutorKind, max_workers: Optional[int] = None) -> "Executor":
+    # concurrent.futures imports multiprocessing, it is only imported when an executor is needed.
+    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+    if executor_kind is ExecutorKind.thread:
+        return ThreadPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers)
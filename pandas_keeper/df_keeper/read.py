@@ -1,11 +1,24 @@
+import hashlib
+import io
+import json as json_lib
+import os
+from contextlib import contextmanager, ExitStack
 from pathlib import Path
 import pandas as pd
 from pandas import DataFrame
+from pandas.api.extensions import ExtensionDtype
+from pandas.api.types import pandas_dtype, is_object_dtype, is_string_dtype, CategoricalDtype
 from enum import Enum
+from pandas_keeper.compression import open_compressed, split_compression
+from pandas_keeper.df_keeper.parallel import ExecutorKind, get_executor
+from pandas_keeper import pickle5
 from pandas_keeper.logger import Logger
-from typing import Dict, Callable
+from pandas_keeper.storage import get_storage, has_storage, is_local
+from typing import Dict, Callable, Optional, Any, List, Iterator, Union, IO
+from urllib.request import urlopen
 
 LOGGER = Logger()
+JSONL_CHUNKSIZE = 100000
 
 
 class DataReaderExtension(Enum):
@@ -17,21 +30,560 @@ class DataReaderExtension(Enum):
     xls = "xls"
     xlsx = "xlsx"
     xlsm = "xlsm"
+    feather = "feather"
+    arrow = "arrow"
+    jsonl = "jsonl"
+    ndjson = "ndjson"
+    pkl = "pkl"
+    pickle = "pickle"
+    pkl5 = "pkl5"
 
 
-DATA_READER: Dict[DataReaderExtension, Callable[..., DataFrame]] = {
+# Extension of a built-in format as a DataReaderExtension, or of a format added with
+# `register_reader` as a str.
+ReaderExtension = Union[DataReaderExtension, str]
+
+_BUILT_IN_EXTENSIONS = {extension.value: extension for extension in DataReaderExtension}
+
+
+def to_reader_extension(extension: ReaderExtension) -> ReaderExtension:
+    """Get the DataReaderExtension of a built-in format, the extension itself otherwise."""
+    if isinstance(extension, DataReaderExtension):
+        return extension
+    return _BUILT_IN_EXTENSIONS.get(extension, extension)
+
+
+def get_extension(file_reader_extension: ReaderExtension) -> str:
+    """Get the extension of the files of a format as a str."""
+    if isinstance(file_reader_extension, DataReaderExtension):
+        return file_reader_extension.value
+    return file_reader_extension
+
+
+class DataReaderEngine(Enum):
+    pandas = "pandas"
+    pyarrow = "pyarrow"
+
+
+def _to_arrow_type(dtype):
+    """Translate a pandas/numpy dtype into a pyarrow type, None if it has no direct equivalent."""
+    import pyarrow as pa
+    dtype = pandas_dtype(dtype)
+    if isinstance(dtype, CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+    if is_object_dtype(dtype) or is_string_dtype(dtype):
+        return pa.string()
+    try:
+        return pa.from_numpy_dtype(getattr(dtype, "numpy_dtype", dtype))
+    except (NotImplementedError, TypeError, pa.ArrowNotImplementedError):
+        return None
+
+
+def _to_source(file_path):
+    """Path as expected by pyarrow, file objects are passed as they are."""
+    return file_path if hasattr(file_path, "read") else str(file_path)
+
+
+def _read_first_line(file_path) -> bytes:
+    if hasattr(file_path, "read"):
+        first_line = file_path.readline()
+        file_path.seek(0)
+        return first_line
+    with open(str(file_path), "rb") as f:
+        return f.readline()
+
+
+def _arrow_column_types(dtype: Dict[str, Any]) -> Dict[str, Any]:
+    column_types = {}
+    for col, col_dtype in dtype.items():
+        arrow_type = _to_arrow_type(col_dtype)
+        if arrow_type is not None:
+            column_types[col] = arrow_type
+    return column_types
+
+
+def _arrow_csv_options(sep: str, dtype: Dict[str, Any], use_threads: bool,
+                       block_size: Optional[int]):
+    from pyarrow import csv
+    column_types = _arrow_column_types(dtype)
+    read_options = csv.ReadOptions(use_threads=use_threads)
+    if block_size is not None:
+        read_options.block_size = block_size
+    return {"read_options": read_options, "parse_options": csv.ParseOptions(delimiter=sep),
+            "convert_options": csv.ConvertOptions(column_types=column_types,
+                                                  strings_can_be_null=True)}
+
+
+def _arrow_to_pandas(table, dtype: Dict[str, Any]) -> DataFrame:
+    df = table.to_pandas()
+    # Arrow columns are converted to numpy dtypes, so extension dtypes are set afterwards.
+    for col, col_dtype in dtype.items():
+        col_dtype = pandas_dtype(col_dtype)
+        if isinstance(col_dtype, ExtensionDtype) and not isinstance(col_dtype, CategoricalDtype):
+            df[col] = df[col].astype(col_dtype)
+    return df
+
+
+def read_csv_arrow(file_path: Path, sep: str = ",", dtype: Optional[Dict[str, Any]] = None,
+                   use_threads: bool = True, block_size: Optional[int] = None) -> DataFrame:
+    """Read a csv file with the multithreaded pyarrow csv parser.
+
+    Args:
+        file_path (Path): File path.
+        sep (str, default: ","): Field delimiter.
+        dtype (dict of str, dtype): Column name -> dtype expected. The dtypes are translated into
+            Arrow column types, the ones without Arrow equivalent are inferred by the parser.
+        use_threads (bool, default: True): Should the file be parsed with multiple threads ?
+        block_size (int): Number of bytes processed at a time by each thread.
+    """
+    from pyarrow import csv
+    dtype = dtype or {}
+    table = csv.read_csv(_to_source(file_path),
+                         **_arrow_csv_options(sep, dtype, use_threads, block_size))
+    return _arrow_to_pandas(table, dtype)
+
+
+def read_jsonl_arrow(file_path: Path, dtype: Optional[Dict[str, Any]] = None,
+                     use_threads: bool = True, block_size: Optional[int] = None) -> DataFrame:
+    """Read a JSON lines file with the multithreaded pyarrow json parser.
+
+    Args:
+        file_path (Path): File path.
+        dtype (dict of str, dtype): Column name -> dtype expected. The dtypes are translated into
+            Arrow column types, the ones without Arrow equivalent are inferred by the parser.
+        use_threads (bool, default: True): Should the file be parsed with multiple threads ?
+        block_size (int): Number of bytes processed at a time by each thread.
+    """
+    import pyarrow as pa
+    from pyarrow import json
+    dtype = dtype or {}
+    read_options = json.ReadOptions(use_threads=use_threads)
+    if block_size is not None:
+        read_options.block_size = block_size
+    parse_options = json.ParseOptions(
+        explicit_schema=pa.schema(list(_arrow_column_types(dtype).items())),
+        unexpected_field_behavior="infer")
+    # Read before the file objects are consumed by pyarrow.
+    first_line = _read_first_line(file_path) if dtype else b""
+    table = json.read_json(_to_source(file_path), read_options=read_options,
+                           parse_options=parse_options)
+    if dtype:
+        # The columns of the explicit schema come first, the order of the file is restored.
+        first_columns = [col for col in json_lib.loads(first_line or b"{}")
+                         if col in table.column_names]
+        table = table.select(first_columns + [col for col in table.column_names
+                                              if col not in first_columns])
+    return _arrow_to_pandas(table, dtype)
+
+
+def iter_jsonl(file_path: Path, *args, chunksize: Optional[int] = None,
+               **kw) -> Iterator[DataFrame]:
+    """Read a JSON lines file by chunks of `chunksize` lines, so that the whole file is never
+    loaded in memory at once."""
+    with pd.read_json(file_path, *args, lines=True, chunksize=chunksize or JSONL_CHUNKSIZE,
+                      **kw) as reader:
+        yield from reader
+
+
+def read_jsonl(file_path: Path, *args, chunksize: Optional[int] = None, **kw) -> DataFrame:
+    """Read a JSON lines file, parsed by chunks of `chunksize` lines.
+
+    Unlike `pandas.read_json`, the file is not loaded as a single string before being parsed.
+    """
+    chunks = list(iter_jsonl(file_path, *args, chunksize=chunksize, **kw))
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True) if chunks else DataFrame()
+
+
+def read_arrow(file_path: Path, columns: Optional[List[str]] = None, memory_map: bool = False,
+               use_threads: bool = True) -> DataFrame:
+    """Read a feather or an Arrow IPC file.
+
+    With `memory_map`, the file is mapped instead of being read and, if the file is uncompressed
+    and written in one record batch, the columns whose dtype allows it (numeric without N/A values)
+    are not copied: the DataFrame points to the pages of the file, which are shared by all the
+    processes reading it. These columns must not be modified in place. `DataFrame.to_feather`
+    compresses the files with lz4 and splits them in batches of 64K rows by default: they must be
+    written with `compression="uncompressed"` and a `chunksize` of at least their number of rows to
+    be mapped without copy.
+
+    Args:
+        file_path (Path): File path.
+        columns (list of str): Columns to read, all columns if not specified.
+        memory_map (bool, default: False): Should the file be memory-mapped ?
+        use_threads (bool, default: True): Should the file be read with multiple threads ?
+    """
+    from pyarrow import feather
+    table = feather.read_table(_to_source(file_path), columns=columns, memory_map=memory_map,
+                               use_threads=use_threads)
+    return table.to_pandas(split_blocks=True, use_threads=use_threads)
+
+
+def read_parquet(file_path: Path, *args, memory_map: bool = False, **kw) -> DataFrame:
+    """Read a parquet file, memory-mapping it with pyarrow if `memory_map` is True.
+
+    With `memory_map`, the DataFrame blocks are not consolidated to avoid copying decoded columns.
+    """
+    if not memory_map:
+        return pd.read_parquet(file_path, *args, **kw)
+    from pyarrow import parquet
+    table = parquet.read_table(_to_source(file_path), *args, memory_map=True, **kw)
+    return table.to_pandas(split_blocks=True)
+
+
+def read_pickle5(file_path: Union[str, Path, IO[bytes]], memory_map: bool = False) -> DataFrame:
+    """Read a pickle 5 file written by `write`, whose buffers are stored out of band.
+
+    With `memory_map`, the numpy blocks are not copied: they point to the pages of the file.
+    """
+    return pickle5.load(file_path, memory_map=memory_map)
+
+
+def _file_hash(workbook: Union[str, Path, bytes]) -> str:
+    if isinstance(workbook, bytes):
+        return hashlib.sha256(workbook).hexdigest()
+    file_hash = hashlib.sha256()
+    with open(str(workbook), "rb") as f:
+        for block in iter(lambda: f.read(2 ** 20), b""):
+            file_hash.update(block)
+    return file_hash.hexdigest()
+
+
+def _load_workbook(file_path: Union[str, Path]) -> Union[str, Path, bytes]:
+    """Get the path of a local uncompressed workbook, else its content, loaded once for all its
+    sheets from its storage."""
+    if not has_storage(file_path):
+        with urlopen(str(file_path)) as f:
+            return f.read()
+    if _is_read_from_path(file_path):
+        return _get_reader_path(file_path)
+    with open_data(file_path, DataReaderExtension.xlsx) as f:
+        return f.read()
+
+
+def _open_workbook(workbook: Union[str, Path, bytes]) -> Union[str, Path, IO[bytes]]:
+    return io.BytesIO(workbook) if isinstance(workbook, bytes) else workbook
+
+
+def read_excel_sheet(file_path: Union[str, Path, IO[bytes]], sheet_name: Union[int, str],
+                     cache_path: Optional[Path] = None, **kw) -> DataFrame:
+    """Read a sheet of an Excel workbook, from its parquet conversion if `cache_path` exists.
+
+    Once read, the sheet is converted into the parquet file `cache_path` if it is specified. The
+    sheets which cannot be stored as parquet (e.g. columns of mixed types) are not cached.
+    """
+    if cache_path is not None and cache_path.exists():
+        return pd.read_parquet(cache_path)
+    df = pd.read_excel(file_path, sheet_name=sheet_name, **kw)
+    if cache_path is not None:
+        tmp_cache_path = cache_path.with_name("%s.%i.tmp" % (cache_path.name, os.getpid()))
+        try:
+            df.to_parquet(tmp_cache_path)
+            # Written at once so that a concurrent import never reads a partial conversion.
+            os.replace(str(tmp_cache_path), str(cache_path))
+        except Exception as error:
+            LOGGER.logger.warning("The sheet %s is not cached in %s: %s" % (
+                sheet_name, cache_path, error))
+            if tmp_cache_path.exists():
+                tmp_cache_path.unlink()
+    return df
+
+
+def read_excel_sheets(file_path: Union[str, Path],
+                      sheet_names: Optional[List[Union[int, str]]] = None,
+                      cache_folder: Optional[Path] = None,
+                      executor_kind: Optional[ExecutorKind] = None,
+                      max_workers: Optional[int] = None, **kw) -> DataFrame:
+    """Read sheets of an Excel workbook and concatenate them.
+
+    Args:
+        file_path (str or Path): File path, with a protocol if it is not local.
+        sheet_names (list of int or str): Names or positions of the sheets to read, the sheets of
+            the `sheet_name` argument of `pandas.read_excel` if not specified, else the first one.
+        cache_folder (Path): Folder where each parsed sheet is converted into a parquet file, keyed
+            by the hash of the workbook, the sheet and the read arguments. The next imports of an
+            unchanged workbook read these conversions instead of parsing it.
+        executor_kind (ExecutorKind): Kind of executor used to read the sheets concurrently, the
+            sheets are read sequentially if not specified.
+        max_workers (int): Maximum number of workers of the executor.
+        **kw: Keyword arguments to pass to `pandas.read_excel`.
+    """
+    workbook = _load_workbook(file_path)
+    if sheet_names is None:
+        sheet_name = kw.pop("sheet_name", 0)
+        if sheet_name is None:
+            sheet_names = pd.ExcelFile(_open_workbook(workbook)).sheet_names
+        else:
+            sheet_names = sheet_name if isinstance(sheet_name, list) else [sheet_name]
+    cache_paths: List[Optional[Path]] = [None] * len(sheet_names)
+    if cache_folder is not None:
+        Path(cache_folder).mkdir(parents=True, exist_ok=True)
+        workbook_hash = _file_hash(workbook)
+        cache_paths = [Path(cache_folder) / ("%s.parquet" % hashlib.sha256(repr(
+            (workbook_hash, sheet_name, sorted(kw.items()))).encode()).hexdigest())
+            for sheet_name in sheet_names]
+    if executor_kind is None:
+        dfs = [read_excel_sheet(_open_workbook(workbook), sheet_name, cache_path, **kw)
+               for sheet_name, cache_path in zip(sheet_names, cache_paths)]
+    else:
+        with get_executor(executor_kind, max_workers) as executor:
+            futures = [executor.submit(read_excel_sheet, _open_workbook(workbook), sheet_name,
+                                       cache_path, **kw)
+                       for sheet_name, cache_path in zip(sheet_names, cache_paths)]
+        dfs = [future.result() for future in futures]
+    if len(dfs) == 1:
+        return dfs[0]
+    return pd.concat(dfs, ignore_index=True)
+
+
+DATA_READER: Dict[ReaderExtension, Callable[..., DataFrame]] = {
     DataReaderExtension.csv: pd.read_csv,
     DataReaderExtension.txt: pd.read_csv,
-    DataReaderExtension.pq: pd.read_parquet,
-    DataReaderExtension.parquet: pd.read_parquet,
+    DataReaderExtension.pq: read_parquet,
+    DataReaderExtension.parquet: read_parquet,
     DataReaderExtension.json: pd.read_json,
     DataReaderExtension.xls: pd.read_excel,
     DataReaderExtension.xlsx: pd.read_excel,
-    DataReaderExtension.xlsm: pd.read_excel
+    DataReaderExtension.xlsm: pd.read_excel,
+    DataReaderExtension.feather: read_arrow,
+    DataReaderExtension.arrow: read_arrow,
+    DataReaderExtension.jsonl: read_jsonl,
+    DataReaderExtension.ndjson: read_jsonl,
+    DataReaderExtension.pkl: pd.read_pickle,
+    DataReaderExtension.pickle: pd.read_pickle,
+    DataReaderExtension.pkl5: read_pickle5
+}
+
+ARROW_DATA_READER: Dict[ReaderExtension, Callable[..., DataFrame]] = {
+    DataReaderExtension.csv: read_csv_arrow,
+    DataReaderExtension.txt: read_csv_arrow,
+    DataReaderExtension.jsonl: read_jsonl_arrow,
+    DataReaderExtension.ndjson: read_jsonl_arrow
+}
+
+ENGINE_DATA_READER: Dict[DataReaderEngine, Dict[ReaderExtension, Callable[..., DataFrame]]] = {
+    DataReaderEngine.pandas: DATA_READER,
+    DataReaderEngine.pyarrow: ARROW_DATA_READER
+}
+
+
+EXCEL_READERS = [DataReaderExtension.xls, DataReaderExtension.xlsx, DataReaderExtension.xlsm]
+
+# Readers accepting a `dtype` argument to parse columns directly in the given dtypes.
+DTYPE_READERS: Dict[DataReaderEngine, List[ReaderExtension]] = {
+    DataReaderEngine.pandas: [DataReaderExtension.csv, DataReaderExtension.txt,
+                              DataReaderExtension.json, DataReaderExtension.xls,
+                              DataReaderExtension.xlsx, DataReaderExtension.xlsm,
+                              DataReaderExtension.jsonl, DataReaderExtension.ndjson],
+    DataReaderEngine.pyarrow: [DataReaderExtension.csv, DataReaderExtension.txt,
+                               DataReaderExtension.jsonl, DataReaderExtension.ndjson]
+}
+
+
+# Readers accepting a `columns` argument to read only some columns.
+COLUMNS_READERS: Dict[DataReaderEngine, List[ReaderExtension]] = {
+    DataReaderEngine.pandas: [DataReaderExtension.pq, DataReaderExtension.parquet,
+                              DataReaderExtension.feather, DataReaderExtension.arrow],
+    DataReaderEngine.pyarrow: []
+}
+
+# Readers accepting `filters` to skip the rows which do not match them while reading.
+FILTERS_READERS: Dict[DataReaderEngine, List[ReaderExtension]] = {
+    DataReaderEngine.pandas: [DataReaderExtension.pq, DataReaderExtension.parquet],
+    DataReaderEngine.pyarrow: []
 }
 
+# Readers parsing the file sequentially: a compressed or remote file is streamed while parsed.
+STREAM_READERS: Dict[DataReaderEngine, List[ReaderExtension]] = {
+    DataReaderEngine.pandas: [DataReaderExtension.csv, DataReaderExtension.txt,
+                              DataReaderExtension.json, DataReaderExtension.jsonl,
+                              DataReaderExtension.ndjson],
+    DataReaderEngine.pyarrow: [DataReaderExtension.csv, DataReaderExtension.txt]
+}
+
+
+@contextmanager
+def open_data(file_path: Union[str, Path], file_reader_extension: ReaderExtension,
+              reader_engine: DataReaderEngine = DataReaderEngine.pandas) -> Iterator[IO]:
+    """Open a file of any storage for its reader, decompressing it if it is compressed, without
+    writing a local copy of the file.
+
+    The files of the stream readers are decompressed while they are parsed, the others (e.g.
+    parquet or Excel files), which need random access, are loaded in memory first.
+    """
+    file_reader_extension = to_reader_extension(file_reader_extension)
+    storage, path = get_storage(file_path)
+    _, compression = split_compression(path)
+    with ExitStack() as stack:
+        f = stack.enter_context(storage.open(path, "rb"))
+        if compression is not None:
+            f = stack.enter_context(open_compressed(f, "rb", compression))
+        if file_reader_extension not in STREAM_READERS[reader_engine]:
+            yield io.BytesIO(f.read())
+        else:
+            # Binary, the readers decode it with their `encoding` argument.
+            yield f
+
+
+def _is_read_from_path(file_path: Union[str, Path]) -> bool:
+    """Can the reader open the file by itself ? i.e. is it an uncompressed local file, or a file
+    without storage."""
+    if not has_storage(file_path):
+        return True
+    return is_local(file_path) and split_compression(file_path)[1] is None
+
+
+def _get_reader_path(file_path: Union[str, Path]) -> Union[str, Path]:
+    """Get the path given to the readers opening the file by themselves: the full URL of the files
+    without storage, else the local path."""
+    return get_storage(file_path)[1] if has_storage(file_path) else file_path
+
 
 @LOGGER.timeit
-def read_data(file_path: Path, file_reader_extension: DataReaderExtension,
-              *args, **kw) -> DataFrame:
-    return DATA_READER[file_reader_extension](file_path, *args, **kw)
+def read_data(file_path: Union[str, Path], file_reader_extension: ReaderExtension, *args,
+              reader_engine: DataReaderEngine = DataReaderEngine.pandas, **kw) -> DataFrame:
+    """Read a file with the reader of its format for the engine.
+
+    Args:
+        file_path (str or Path): File path, with a protocol if it is not local.
+        file_reader_extension (DataReaderExtension or str): Format of the file, a str for the
+            formats added with `register_reader`.
+        *args: Variable length argument to pass to the reader.
+        reader_engine (DataReaderEngine, default: pandas): Engine of the reader. It is not named
+            `engine` so that the `engine` argument of the pandas readers can still be passed.
+        **kw: Keyword arguments to pass to the reader.
+    """
+    file_reader_extension = to_reader_extension(file_reader_extension)
+    data_reader = ENGINE_DATA_READER[reader_engine]
+    if file_reader_extension not in data_reader:
+        raise NotImplementedError("Read .%s files with the %s engine is not implemented." %
+                                  (get_extension(file_reader_extension), reader_engine.value))
+    if _is_read_from_path(file_path):
+        return data_reader[file_reader_extension](_get_reader_path(file_path), *args, **kw)
+    with open_data(file_path, file_reader_extension, reader_engine) as f:
+        return data_reader[file_reader_extension](f, *args, **kw)
+
+
+def iter_csv_arrow(file_path: Path, chunksize: Optional[int] = None, sep: str = ",",
+                   dtype: Optional[Dict[str, Any]] = None, use_threads: bool = True,
+                   block_size: Optional[int] = None) -> Iterator[DataFrame]:
+    """Read a csv file by blocks of `block_size` bytes with the pyarrow streaming csv reader.
+
+    The Arrow streaming reader splits the file by bytes, so `chunksize` is ignored.
+    """
+    from pyarrow import csv
+    dtype = dtype or {}
+    reader = csv.open_csv(_to_source(file_path),
+                          **_arrow_csv_options(sep, dtype, use_threads, block_size))
+    for batch in reader:
+        yield _arrow_to_pandas(batch, dtype)
+
+
+def iter_csv(file_path: Path, *args, chunksize: Optional[int] = None, **kw) -> Iterator[DataFrame]:
+    if chunksize is None:
+        yield pd.read_csv(file_path, *args, **kw)
+    else:
+        yield from pd.read_csv(file_path, *args, chunksize=chunksize, **kw)
+
+
+def iter_parquet(file_path: Path, chunksize: Optional[int] = None,
+                 columns: Optional[List[str]] = None, filters: Optional[List[Any]] = None,
+                 use_threads: bool = True, engine: str = "pyarrow", **kw) -> Iterator[DataFrame]:
+    """Read a parquet file by batches of `chunksize` rows with pyarrow.
+
+    The rows which do not match the `filters` are skipped, and the other keyword arguments are
+    passed to `pyarrow.parquet.ParquetFile`. The `engine` argument of `pandas.read_parquet` is
+    accepted so that the same read arguments can be used to read the file at once.
+    """
+    from pyarrow import parquet, Table
+    assert engine in ("auto", "pyarrow"), "Parquet files are read by chunks with pyarrow only."
+    parquet_file = parquet.ParquetFile(_to_source(file_path), **kw)
+    expression = None if filters is None else parquet.filters_to_expression(filters)
+    for batch in parquet_file.iter_batches(batch_size=chunksize or 65536, columns=columns,
+                                           use_threads=use_threads):
+        if expression is None:
+            yield batch.to_pandas()
+        else:
+            yield Table.from_batches([batch]).filter(expression).to_pandas()
+
+
+CHUNK_DATA_READER: Dict[DataReaderEngine,
+                        Dict[ReaderExtension, Callable[..., Iterator[DataFrame]]]] = {
+    DataReaderEngine.pandas: {
+        DataReaderExtension.csv: iter_csv,
+        DataReaderExtension.txt: iter_csv,
+        DataReaderExtension.pq: iter_parquet,
+        DataReaderExtension.parquet: iter_parquet,
+        DataReaderExtension.jsonl: iter_jsonl,
+        DataReaderExtension.ndjson: iter_jsonl
+    },
+    DataReaderEngine.pyarrow: {
+        DataReaderExtension.csv: iter_csv_arrow,
+        DataReaderExtension.txt: iter_csv_arrow
+    }
+}
+
+
+def iter_data(file_path: Union[str, Path], file_reader_extension: ReaderExtension, *args,
+              chunksize: Optional[int] = None,
+              reader_engine: DataReaderEngine = DataReaderEngine.pandas,
+              **kw) -> Iterator[DataFrame]:
+    """Read the file chunk by chunk if its reader supports it, else read it at once."""
+    file_reader_extension = to_reader_extension(file_reader_extension)
+    chunk_data_reader = CHUNK_DATA_READER[reader_engine].get(file_reader_extension)
+    if chunk_data_reader is None:
+        yield read_data(file_path, file_reader_extension, *args, reader_engine=reader_engine,
+                        **kw)
+    elif _is_read_from_path(file_path):
+        yield from chunk_data_reader(_get_reader_path(file_path), *args, chunksize=chunksize,
+                                     **kw)
+    else:
+        with open_data(file_path, file_reader_extension, reader_engine) as f:
+            yield from chunk_data_reader(f, *args, chunksize=chunksize, **kw)
+
+
+def register_reader(extension: str, reader: Callable[..., DataFrame],
+                    reader_engine: DataReaderEngine = DataReaderEngine.pandas,
+                    chunk_reader: Optional[Callable[..., Iterator[DataFrame]]] = None,
+                    dtype: bool = False, stream: bool = False, columns: bool = False,
+                    filters: bool = False) -> ReaderExtension:
+    """Register the reader of a file format, new or not, for an engine.
+
+    The capabilities of the reader are declared so that the import uses the fastest path it allows.
+
+    Args:
+        extension (str): Extension of the files read.
+        reader (callable): Function reading a file, from its path or from a binary file object,
+            into a DataFrame.
+        reader_engine (DataReaderEngine, default: pandas): Engine of the reader.
+        chunk_reader (callable): Generator function reading a file by chunks of `chunksize` rows.
+        dtype (bool, default: False): Does the reader accept a `dtype` argument to parse the
+            columns directly in their dtypes ?
+        stream (bool, default: False): Does the reader parse the file sequentially ? Otherwise,
+            the files which are not local are loaded in memory before being read.
+        columns (bool, default: False): Does the reader accept a `columns` argument to read only
+            some columns ?
+        filters (bool, default: False): Does the reader accept `filters` to skip the rows which
+            do not match them while reading ?
+
+    Returns:
+        The format, to be used as reader of a DFKeeper: its DataReaderExtension if it is built in,
+        else the extension.
+    """
+    file_reader_extension = to_reader_extension(extension)
+    ENGINE_DATA_READER[reader_engine][file_reader_extension] = reader
+    if chunk_reader is not None:
+        CHUNK_DATA_READER[reader_engine][file_reader_extension] = chunk_reader
+    for capability, capability_readers in [(dtype, DTYPE_READERS), (stream, STREAM_READERS),
+                                           (columns, COLUMNS_READERS),
+                                           (filters, FILTERS_READERS)]:
+        if capability and file_reader_extension not in capability_readers[reader_engine]:
+            capability_readers[reader_engine].append(file_reader_extension)
+    return file_reader_extension
+
+
+def is_registered(file_reader_extension: ReaderExtension) -> bool:
+    """Has the format a reader, for any engine ?"""
+    file_reader_extension = to_reader_extension(file_reader_extension)
+    return any(file_reader_extension in data_reader for data_reader in ENGINE_DATA_READER.values())
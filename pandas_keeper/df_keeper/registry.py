@@ -0,0 +1,82 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+from .df_keeper import DFKeeper
+
+SCHEMA_EXTENSIONS = [".json", ".yaml", ".yml"]
+
+
+def _parse_schema(content: bytes, extension: str) -> Dict[str, Any]:
+    if extension == ".json":
+        return json.loads(content)
+    import yaml
+    return yaml.safe_load(content)
+
+
+class SchemaRegistry(object):
+    """Registry of DFKeepers loaded from schema files.
+
+    Each schema file is parsed and validated once into an immutable DFKeeper, cached by the hash
+    of the file content: loading again an unchanged file, or a file with the same content, costs
+    only its hashing.
+
+    Attributes:
+        df_keepers (dict of str, DFKeeper): Schema name -> DFKeeper.
+    """
+
+    def __init__(self):
+        self.df_keepers: Dict[str, DFKeeper] = {}
+        self._hash_df_keepers: Dict[str, DFKeeper] = {}
+
+    def register(self, name: str, df_keeper_schema: Union[Dict[str, Any], DFKeeper]) -> DFKeeper:
+        """Register the schema with the given name, validating it if it is not a DFKeeper."""
+        df_keeper = df_keeper_schema if isinstance(df_keeper_schema, DFKeeper) \
+            else DFKeeper(**df_keeper_schema)
+        self.df_keepers[name] = df_keeper
+        return df_keeper
+
+    def load(self, file_path: Union[str, Path], name: Optional[str] = None) -> DFKeeper:
+        """Load a json or yaml schema file and register it.
+
+        Args:
+            file_path (str or Path): Path of the schema file.
+            name (str): Name of the schema, the file name without extension if not specified.
+        """
+        file_path = Path(file_path)
+        content = file_path.read_bytes()
+        content_hash = hashlib.sha256(content).hexdigest()
+        df_keeper = self._hash_df_keepers.get(content_hash)
+        if df_keeper is None:
+            df_keeper = DFKeeper(**_parse_schema(content, file_path.suffix.lower()))
+            self._hash_df_keepers[content_hash] = df_keeper
+        return self.register(name or file_path.stem, df_keeper)
+
+    def load_folder(self, folder: Union[str, Path]) -> List[DFKeeper]:
+        """Load all the json and yaml schema files of the folder."""
+        return [self.load(file_path) for file_path in sorted(Path(folder).iterdir())
+                if file_path.suffix.lower() in SCHEMA_EXTENSIONS]
+
+    def get(self, name: str) -> DFKeeper:
+        assert name in self.df_keepers, "The schema %s is not registered." % name
+        return self.df_keepers[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.df_keepers
+
+
+SCHEMA_REGISTRY = SchemaRegistry()
+
+
+def get_df_keeper(df_keeper_schema: Union[str, Dict[str, Any], DFKeeper]) -> DFKeeper:
+    """Get the DFKeeper of a schema.
+
+    Args:
+        df_keeper_schema (str, dict or DFKeeper): Name of a schema registered in SCHEMA_REGISTRY,
+            raw schema to validate or DFKeeper already validated.
+    """
+    if isinstance(df_keeper_schema, DFKeeper):
+        return df_keeper_schema
+    if isinstance(df_keeper_schema, str):
+        return SCHEMA_REGISTRY.get(df_keeper_schema)
+    return DFKeeper(**df_keeper_schema)
@@ -0,0 +1,93 @@
+from enum import Enum
+from itertools import islice
+from typing import Any, Collection, List, Optional
+from pydantic import BaseModel
+
+N_EXAMPLES = 5
+
+
+class ColumnCheck(Enum):
+    presence = "presence"
+    nullable = "nullable"
+    dtype = "dtype"
+    values = "values"
+    action = "action"
+
+
+class CheckResult(BaseModel):
+    column: str
+    check: ColumnCheck
+    count: int = 0
+    examples: List[Any] = []
+
+
+class ValidationReportError(AssertionError):
+    """AssertionError raised when a report has failed checks, the report is kept as attribute."""
+
+    def __init__(self, report: "ValidationReport"):
+        super().__init__(str(report))
+        self.report = report
+
+
+class ValidationReport(BaseModel):
+    """Failed checks of the columns of a DataFrame, with the number of wrong values and a sample
+    of them for each check.
+
+    The wrong values are counted as they are added, so that the report can be filled chunk by
+    chunk without keeping the data.
+    """
+    n_rows: int = 0
+    results: List[CheckResult] = []
+    n_examples: int = N_EXAMPLES
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.results
+
+    def add(self, column: str, check: ColumnCheck, wrong_values: Collection,
+            count: Optional[int] = None) -> None:
+        """Add wrong values found by a check of a column.
+
+        Args:
+            column (str): Name of the column checked.
+            check (ColumnCheck): Check which has failed.
+            wrong_values (list-like): Wrong values, some of them are kept as examples.
+            count (int): Number of wrong values, the length of `wrong_values` if not specified.
+        """
+        count = len(wrong_values) if count is None else count
+        if count == 0:
+            return
+        result = self.get(column, check)
+        if result is None:
+            result = CheckResult(column=column, check=check)
+            self.results.append(result)
+        result.count += count
+        # The examples are looked for among the first values only to keep the report cheap.
+        for value in islice(wrong_values, 10 * self.n_examples):
+            if len(result.examples) >= self.n_examples:
+                break
+            if value not in result.examples:
+                result.examples.append(value)
+
+    def extend(self, other_report: "ValidationReport") -> None:
+        """Add the failed checks of another report of the same rows."""
+        for result in other_report.results:
+            self.add(result.column, result.check, result.examples, count=result.count)
+
+    def get(self, column: str, check: ColumnCheck) -> Optional[CheckResult]:
+        for result in self.results:
+            if result.column == column and result.check is check:
+                return result
+        return None
+
+    def __str__(self) -> str:
+        if self.is_valid:
+            return "All the checks of the %i rows have succeeded." % self.n_rows
+        lines = ["%s: %s check failed %i time(s), e.g. %s" % (
+            result.column, result.check.value, result.count, result.examples)
+            for result in self.results]
+        return "Some checks of the %i rows have failed:\n%s" % (self.n_rows, "\n".join(lines))
+
+    def assert_valid(self) -> None:
+        if not self.is_valid:
+            raise ValidationReportError(self)
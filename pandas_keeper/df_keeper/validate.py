@@ -0,0 +1,69 @@
+from typing import Dict, Any, Iterable, Optional, Union
+from pandas import DataFrame
+from .column_keeper import parse_numeric_values, treat_column
+from .df_keeper import DFKeeper
+from .importer import get_read_arguments
+from .read import iter_data, read_excel_sheets
+from .registry import get_df_keeper
+from .report import ColumnCheck, ValidationReport, N_EXAMPLES
+
+CHUNKSIZE = 100000
+
+
+def validate_df(df_keeper_schema: Union[str, Dict[str, Any], DFKeeper], chunksize: int = CHUNKSIZE,
+                n_examples: int = N_EXAMPLES) -> ValidationReport:
+    """Check that the file satisfies its schema without importing it.
+
+    The file is read chunk by chunk when its reader allows it, and the checks of the columns are
+    run on each chunk: only the counts of wrong values and some examples of them are kept. The file
+    is read as `import_df` reads it (parsed dtypes, projection, filters and sheets), so that the
+    report predicts the import collecting its errors.
+
+    Args:
+        df_keeper_schema (str, dict or DFKeeper): Schema of the DataFrame, or name of a schema
+            registered in SCHEMA_REGISTRY.
+        chunksize (int, default: 100000): Number of rows read at a time.
+        n_examples (int, default: 5): Maximum number of wrong values kept as examples by check.
+
+    Returns:
+        The report of the failed checks.
+    """
+    df_keeper = get_df_keeper(df_keeper_schema)
+    read_arguments = get_read_arguments(df_keeper)
+    try:
+        return _validate_chunks(df_keeper, read_arguments, chunksize, n_examples)
+    except ValueError:
+        pass
+    # As in import_df, the file is read again as the reader infers it so that the checks report
+    # the missing columns of the projection or the values which cannot be parsed.
+    return _validate_chunks(df_keeper, get_read_arguments(df_keeper, parse_dtypes=False,
+                                                          project_columns=False),
+                            chunksize, n_examples, read_arguments.get("dtype") or {})
+
+
+def _validate_chunks(df_keeper: DFKeeper, read_arguments: Dict[str, Any], chunksize: int,
+                     n_examples: int, failed_dtypes: Optional[Dict[str, Any]] = None
+                     ) -> ValidationReport:
+    report = ValidationReport(n_examples=n_examples)
+    column_keepers = None
+    if df_keeper.sheets is not None or df_keeper.cache_folder is not None:
+        chunks: Iterable[DataFrame] = [read_excel_sheets(
+            df_keeper.file_path, df_keeper.sheets, df_keeper.cache_folder, df_keeper.executor,
+            df_keeper.max_workers, **read_arguments)]
+    else:
+        chunks = iter_data(df_keeper.file_path, df_keeper.reader, chunksize=chunksize,
+                           reader_engine=df_keeper.reader_engine, **read_arguments)
+    for chunk in chunks:
+        if failed_dtypes:
+            chunk = parse_numeric_values(chunk, failed_dtypes)
+        if column_keepers is None:
+            column_keepers = []
+            for col in df_keeper.columns:
+                if col.name in chunk.columns:
+                    column_keepers.append(col)
+                else:
+                    report.add(col.name, ColumnCheck.presence, [col.name])
+        for col in column_keepers:
+            treat_column(chunk[col.name], col, report)
+        report.n_rows += len(chunk)
+    return report
@@ -1,7 +1,6 @@
 import inspect
 import logging
-import numpy as np
-import pandas as pd
+import sys
 import time
 from functools import wraps
 
@@ -142,9 +141,11 @@ class Stringer(object):
             return self.list_or_tuple(arg)
         elif type(arg) == dict:
             return self.dict(arg)
-        elif type(arg) == np.ndarray:
+        # numpy and pandas are not imported by the logger: if they are not loaded, arg cannot be
+        # one of their objects.
+        elif "numpy" in sys.modules and type(arg) == sys.modules["numpy"].ndarray:
             return self.numpy(arg)
-        elif type(arg) == pd.DataFrame:
+        elif "pandas" in sys.modules and type(arg) == sys.modules["pandas"].DataFrame:
             return self.dataframe(arg)
         else:
             return str(type(arg).__name__)
@@ -154,7 +155,7 @@ class Logger(object):
     """Custom logger providing a timer of function.
 
     Attributes:
-        logger (logging.Logger): Logger object
+        logger (logging.Logger): Logger object, configured on its first use to keep imports cheap
         stringer (Stringer): Stringer object
 
     "logging": {
@@ -171,28 +172,46 @@ class Logger(object):
 
     def __init__(self, logger_name="tools.logger", level=None, format=None, datefmt=None,
                  filename=None, filemode="a", use_console=True):
+        if not use_console:
+            assert filename is not None, "filename must be specified when use_console=False"
+        self.logger_name = logger_name
+        self.level = level
+        self.format = format
+        self.datefmt = datefmt
+        self.filename = filename
+        self.filemode = filemode
+        self.use_console = use_console
+        self._logger = None
+        self.stringer = Stringer()
+
+    @property
+    def logger(self):
+        if self._logger is None:
+            self._logger = self._make_logger()
+        return self._logger
+
+    def _make_logger(self):
         # logging is by default using a console handler unless a filename is specified
-        if use_console:
-            logging.basicConfig(level=level, format=format, datefmt=datefmt)
+        if self.use_console:
+            logging.basicConfig(level=self.level, format=self.format, datefmt=self.datefmt)
         else:
-            assert filename is not None, "filename must be specified when use_console=False"
-            logging.basicConfig(level=level, format=format, datefmt=datefmt, filename=filename,
-                                filemode=filemode)
-        self.logger = logging.getLogger(logger_name)
-        if use_console and filename is not None:
+            logging.basicConfig(level=self.level, format=self.format, datefmt=self.datefmt,
+                                filename=self.filename, filemode=self.filemode)
+        logger = logging.getLogger(self.logger_name)
+        if self.use_console and self.filename is not None:
             # create console handler
-            file_handler = logging.FileHandler(filename, filemode)
-            if level is not None:
-                file_handler.setLevel(level)
+            file_handler = logging.FileHandler(self.filename, self.filemode)
+            if self.level is not None:
+                file_handler.setLevel(self.level)
 
             # create formatter and add it to the handlers
-            formatter = logging.Formatter(format,
-                                          datefmt)
+            formatter = logging.Formatter(self.format,
+                                          self.datefmt)
             file_handler.setFormatter(formatter)
 
             # add the handlers to logger
-            self.logger.addHandler(file_handler)
-        self.stringer = Stringer()
+            logger.addHandler(file_handler)
+        return logger
 
     @staticmethod
     def assign_arguments(func, *args, **kw):
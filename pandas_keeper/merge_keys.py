@@ -0,0 +1,359 @@
+from typing import List, NamedTuple, Optional, Tuple
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+N_SAMPLES = 5
+SAMPLE_CHUNKSIZE = 2 ** 16
+_MAX_CODE = np.iinfo(np.int64).max
+
+
+class KeysMatch(NamedTuple):
+    """Statistics of the matching of the left and right key values of a merge.
+
+    Attributes:
+        left_counts (array of int): Number of left rows of each key code.
+        right_counts (array of int): Number of right rows of each key code.
+        left_matched (int): Number of left rows whose key values are in the right DataFrame.
+        right_matched (int): Number of right rows whose key values are in the left DataFrame.
+        left_unmatched_sample (array of int): Positions of the first left rows whose key values
+            are not in the right DataFrame.
+        right_unmatched_sample (array of int): Positions of the first right rows whose key values
+            are not in the left DataFrame.
+    """
+    left_counts: np.ndarray
+    right_counts: np.ndarray
+    left_matched: int
+    right_matched: int
+    left_unmatched_sample: np.ndarray
+    right_unmatched_sample: np.ndarray
+
+
+class MergeEstimate(NamedTuple):
+    """Size of the output of a merge, computed from the key counts before merging.
+
+    Attributes:
+        n_rows (int): Exact number of rows.
+        memory (int): Estimated memory, in bytes, of the columns (the objects referenced by the
+            object columns, shared with the merged DataFrames, are not counted).
+    """
+    n_rows: int
+    memory: int
+
+
+class DuplicatedKeys(NamedTuple):
+    """Key values on several rows of a DataFrame.
+
+    Attributes:
+        n_keys (int): Number of key values on several rows.
+        n_rows (int): Number of rows of these key values.
+        sample (array of int): Positions of the first row of the first duplicated key values.
+        sample_counts (array of int): Number of rows of these key values.
+    """
+    n_keys: int
+    n_rows: int
+    sample: np.ndarray
+    sample_counts: np.ndarray
+
+
+def factorize_keys(left_df: DataFrame, left_keys: List[str], right_df: DataFrame,
+                   right_keys: List[str]) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Encode the key values of the rows of both DataFrames as integer codes, the same key values
+    having the same code on both sides.
+
+    The N/A values are encoded as any other value, as `merge` matches them.
+
+    Returns:
+        The codes of the left rows, the codes of the right rows and the number of codes.
+    """
+    n_left = len(left_df)
+    codes = np.zeros(n_left + len(right_df), dtype=np.int64)
+    n_codes = 1
+    for left_key, right_key in zip(left_keys, right_keys):
+        key_codes, n_key_codes = _factorize_key(left_df[left_key], right_df[right_key])
+        if n_codes > _MAX_CODE // n_key_codes:
+            # The combined codes would overflow, only the combinations present are kept.
+            codes, uniques = pd.factorize(codes)
+            n_codes = len(uniques)
+        codes = codes * n_key_codes + key_codes
+        n_codes *= n_key_codes
+    if n_codes > len(codes):
+        codes, uniques = pd.factorize(codes)
+        n_codes = len(uniques)
+    return codes[:n_left], codes[n_left:], n_codes
+
+
+def _factorize_key(left_values: pd.Series, right_values: pd.Series) -> Tuple[np.ndarray, int]:
+    """Encode the values of a key of both sides, N/A values included, see `factorize_keys`."""
+    if _have_same_categories(left_values, right_values):
+        # Both sides are encoded on the same categories, their codes are used without hashing.
+        key_codes = np.concatenate([left_values.cat.codes, right_values.cat.codes])
+        n_uniques = len(left_values.cat.categories)
+    else:
+        key_codes, uniques = pd.factorize(pd.concat([left_values, right_values],
+                                                    ignore_index=True))
+        n_uniques = len(uniques)
+    return np.where(key_codes < 0, n_uniques, key_codes).astype(np.int64), n_uniques + 1
+
+
+def _have_same_categories(left_values: pd.Series, right_values: pd.Series) -> bool:
+    return isinstance(left_values.dtype, pd.CategoricalDtype) and \
+        isinstance(right_values.dtype, pd.CategoricalDtype) and \
+        left_values.cat.categories.equals(right_values.cat.categories)
+
+
+def unify_categories(left_df: DataFrame, left_keys: List[str], right_df: DataFrame,
+                     right_keys: List[str]) -> Tuple[DataFrame, DataFrame]:
+    """Set the same categories to the categorical keys of both sides, so that they are merged on
+    their codes rather than on their values.
+
+    The categories of the right key are appended to the left ones. The ordered categorical keys
+    are left unchanged, as their categories cannot be combined.
+
+    Returns:
+        The DataFrames, copied without their data if a key is changed.
+    """
+    for left_key, right_key in zip(left_keys, right_keys):
+        left_values, right_values = left_df[left_key], right_df[right_key]
+        if not isinstance(left_values.dtype, pd.CategoricalDtype) or \
+                not isinstance(right_values.dtype, pd.CategoricalDtype) or \
+                left_values.cat.ordered or right_values.cat.ordered or \
+                _have_same_categories(left_values, right_values):
+            continue
+        left_categories = left_values.cat.categories
+        right_categories = right_values.cat.categories
+        categories = left_categories.append(
+            right_categories[~right_categories.isin(left_categories)])
+        left_df, right_df = left_df.copy(deep=False), right_df.copy(deep=False)
+        left_df[left_key] = left_values.cat.set_categories(categories)
+        right_df[right_key] = right_values.cat.set_categories(categories)
+    return left_df, right_df
+
+
+def match_keys(left_codes: np.ndarray, right_codes: np.ndarray, n_codes: int,
+               n_samples: int = N_SAMPLES, use_numba: Optional[bool] = None) -> KeysMatch:
+    """Count the rows of each key code and the rows whose key is on the other side, in linear time.
+
+    Args:
+        left_codes (array of int): Key codes of the left rows, see `factorize_keys`.
+        right_codes (array of int): Key codes of the right rows.
+        n_codes (int): Number of codes.
+        n_samples (int, default: 5): Maximum number of unmatched rows sampled on each side.
+        use_numba (bool): Should the numba kernel be used ? By default, it is if numba is
+            installed, NumPy is used otherwise.
+    """
+    kernel = _get_numba_kernel() if use_numba is not False else None
+    if kernel is None:
+        assert not use_numba, "numba is not installed."
+        return _match_keys_numpy(left_codes, right_codes, n_codes, n_samples)
+    left_counts, right_counts, left_matched, right_matched, left_sample, right_sample = kernel(
+        left_codes, right_codes, n_codes, n_samples)
+    return KeysMatch(left_counts, right_counts, int(left_matched), int(right_matched), left_sample,
+                     right_sample)
+
+
+def _match_keys_numpy(left_codes: np.ndarray, right_codes: np.ndarray, n_codes: int,
+                      n_samples: int) -> KeysMatch:
+    left_counts = np.bincount(left_codes, minlength=n_codes)
+    right_counts = np.bincount(right_codes, minlength=n_codes)
+    left_in_right = right_counts[left_codes] > 0
+    right_in_left = left_counts[right_codes] > 0
+    return KeysMatch(left_counts, right_counts, int(left_in_right.sum()),
+                     int(right_in_left.sum()), np.flatnonzero(~left_in_right)[:n_samples],
+                     np.flatnonzero(~right_in_left)[:n_samples])
+
+
+def _match_keys_loop(left_codes, right_codes, n_codes, n_samples):
+    """Kernel of `match_keys` compiled with numba: a pass to count the codes, a pass to match."""
+    left_counts = np.zeros(n_codes, dtype=np.int64)
+    right_counts = np.zeros(n_codes, dtype=np.int64)
+    for code in left_codes:
+        left_counts[code] += 1
+    for code in right_codes:
+        right_counts[code] += 1
+    left_matched, left_sample, n_left_sample = 0, np.empty(n_samples, dtype=np.int64), 0
+    for i in range(len(left_codes)):
+        if right_counts[left_codes[i]] > 0:
+            left_matched += 1
+        elif n_left_sample < n_samples:
+            left_sample[n_left_sample] = i
+            n_left_sample += 1
+    right_matched, right_sample, n_right_sample = 0, np.empty(n_samples, dtype=np.int64), 0
+    for i in range(len(right_codes)):
+        if left_counts[right_codes[i]] > 0:
+            right_matched += 1
+        elif n_right_sample < n_samples:
+            right_sample[n_right_sample] = i
+            n_right_sample += 1
+    return left_counts, right_counts, left_matched, right_matched, \
+        left_sample[:n_left_sample], right_sample[:n_right_sample]
+
+
+_NUMBA_KERNEL = None
+
+
+def _get_numba_kernel():
+    """Compile the numba kernel on its first use, None if numba is not installed."""
+    global _NUMBA_KERNEL
+    if _NUMBA_KERNEL is None:
+        try:
+            import numba
+        except ImportError:
+            return None
+        _NUMBA_KERNEL = numba.njit(cache=True)(_match_keys_loop)
+    return _NUMBA_KERNEL
+
+
+def estimate_merge(keys_match: KeysMatch, how: str, left_df: DataFrame,
+                   right_df: DataFrame) -> MergeEstimate:
+    """Compute the size of the output of a merge from the key counts of both sides.
+
+    Each key code produces as many rows as the product of its left and right counts, plus the
+    unmatched rows kept by the join.
+    """
+    n_rows = int(np.dot(keys_match.left_counts, keys_match.right_counts))
+    if how in ("left", "outer"):
+        n_rows += len(left_df) - keys_match.left_matched
+    if how in ("right", "outer"):
+        n_rows += len(right_df) - keys_match.right_matched
+    row_memory = _row_memory(left_df) + _row_memory(right_df)
+    return MergeEstimate(n_rows, int(n_rows * row_memory))
+
+
+def _row_memory(df: DataFrame) -> float:
+    if len(df) == 0:
+        return 0.
+    return df.memory_usage(index=False).sum() / len(df)
+
+
+def lookup_merge(left_df: DataFrame, left_codes: np.ndarray, right_df: DataFrame,
+                 right_codes: np.ndarray, n_codes: int) -> DataFrame:
+    """Left merge with a right DataFrame whose key codes are unique, as `merge` would do it.
+
+    The position of the right row of each key code is looked up for the left rows, and the right
+    columns are gathered with `take` next to the left ones, in the order of the left rows.
+
+    Args:
+        left_df (DataFrame): Left DataFrame.
+        left_codes (array of int): Key codes of the left rows, see `factorize_keys`.
+        right_df (DataFrame): Right columns to add to the left DataFrame.
+        right_codes (array of int): Unique key codes of the right rows.
+        n_codes (int): Number of codes.
+    """
+    right_positions = np.full(n_codes, -1, dtype=np.int64)
+    right_positions[right_codes] = np.arange(len(right_codes))
+    right_df = _take_rows(right_df, right_positions[left_codes])
+    return pd.concat([left_df.reset_index(drop=True), right_df], axis=1, copy=False)
+
+
+def find_duplicated_keys(codes: np.ndarray, counts: np.ndarray,
+                         n_samples: int = N_SAMPLES) -> DuplicatedKeys:
+    """Find the key values on several rows from the key counts, with a bounded sample of them.
+
+    The rows are scanned by chunks for the sample, until `n_samples` key values are found.
+
+    Args:
+        codes (array of int): Key codes of the rows, see `factorize_keys`.
+        counts (array of int): Number of rows of each key code, see `match_keys`.
+        n_samples (int, default: 5): Maximum number of duplicated key values sampled.
+    """
+    duplicated = counts > 1
+    n_keys = int(duplicated.sum())
+    sample: List[int] = []
+    sample_codes: List[int] = []
+    for start in range(0, len(codes) if n_keys else 0, SAMPLE_CHUNKSIZE):
+        chunk_codes = codes[start:start + SAMPLE_CHUNKSIZE]
+        chunk_rows = np.flatnonzero(duplicated[chunk_codes])
+        _, first_rows = np.unique(chunk_codes[chunk_rows], return_index=True)
+        for row in chunk_rows[np.sort(first_rows)]:
+            if len(sample) == min(n_samples, n_keys):
+                break
+            if chunk_codes[row] not in sample_codes:
+                sample.append(start + row)
+                sample_codes.append(chunk_codes[row])
+        if len(sample) == min(n_samples, n_keys):
+            break
+    return DuplicatedKeys(n_keys, int(counts[duplicated].sum()), np.array(sample, dtype=np.int64),
+                          counts[np.array(sample_codes, dtype=np.int64)])
+
+
+def is_sorted_on_keys(df: DataFrame, keys: List[str]) -> bool:
+    """Is the DataFrame sorted on a single key, without N/A values ?
+
+    The categorical keys are not considered sorted, as they are sorted on their categories.
+    """
+    if len(keys) != 1:
+        return False
+    key_values = df[keys[0]]
+    return not isinstance(key_values.dtype, pd.CategoricalDtype) and \
+        key_values.is_monotonic_increasing and not key_values.hasnans
+
+
+def factorize_sorted_keys(left_values: np.ndarray,
+                          right_values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """Encode sorted key values as `factorize_keys` does, in linear time and without hashing.
+
+    The values of each side are numbered by comparing consecutive values, and the right unique
+    values are found among the left ones with a binary search.
+
+    Args:
+        left_values (array): Sorted left key values, without N/A, see `is_sorted_on_keys`.
+        right_values (array): Sorted right key values, without N/A.
+
+    Returns:
+        The codes of the left rows, the codes of the right rows and the number of codes.
+    """
+    left_new = _new_value_flags(left_values)
+    left_uniques = left_values[left_new]
+    right_new = _new_value_flags(right_values)
+    right_uniques = right_values[right_new]
+    positions = np.searchsorted(left_uniques, right_uniques)
+    matched = positions < len(left_uniques)
+    matched[matched] = left_uniques[positions[matched]] == right_uniques[matched]
+    right_unique_codes = np.where(matched, positions, len(left_uniques) + np.cumsum(~matched) - 1)
+    return np.cumsum(left_new) - 1, right_unique_codes[np.cumsum(right_new) - 1], \
+        len(left_uniques) + int((~matched).sum())
+
+
+def _new_value_flags(values: np.ndarray) -> np.ndarray:
+    flags = np.ones(len(values), dtype=bool)
+    flags[1:] = values[1:] != values[:-1]
+    return flags
+
+
+def sorted_merge(left_df: DataFrame, left_codes: np.ndarray, right_df: DataFrame,
+                 right_codes: np.ndarray, right_counts: np.ndarray, how: str) -> DataFrame:
+    """Left or inner merge of DataFrames sorted on their key, as `merge` would do it.
+
+    The right rows of a key being contiguous, each left row is repeated for the range of its
+    right rows, without hashing the keys.
+
+    Args:
+        left_df (DataFrame): Left DataFrame.
+        left_codes (array of int): Key codes of the left rows, see `factorize_sorted_keys`.
+        right_df (DataFrame): Right columns to add to the left DataFrame.
+        right_codes (array of int): Key codes of the right rows.
+        right_counts (array of int): Number of right rows of each key code, see `match_keys`.
+        how (str): "left" or "inner".
+    """
+    right_starts = np.zeros(len(right_counts), dtype=np.int64)
+    first_rows = np.flatnonzero(_new_value_flags(right_codes))
+    right_starts[right_codes[first_rows]] = first_rows
+    n_right_rows = right_counts[left_codes]
+    n_rows = n_right_rows if how == "inner" else np.maximum(n_right_rows, 1)
+    left_indexer = np.repeat(np.arange(len(left_codes)), n_rows)
+    right_indexer = np.repeat(right_starts[left_codes] - np.cumsum(n_rows) + n_rows, n_rows) + \
+        np.arange(len(left_indexer))
+    right_indexer[np.repeat(n_right_rows == 0, n_rows)] = -1
+    return pd.concat([_take_rows(left_df, left_indexer), _take_rows(right_df, right_indexer)],
+                     axis=1, copy=False)
+
+
+def _take_rows(df: DataFrame, indexer: np.ndarray) -> DataFrame:
+    """Take the rows of the DataFrame with a RangeIndex, -1 taking a N/A row."""
+    if (indexer < 0).any():
+        # The last row, selected by -1, is a N/A row upcasting the columns as `merge` does.
+        df = pd.concat([df, df.iloc[:0].reindex([len(df)])])
+    df = df.take(indexer)
+    df.index = pd.RangeIndex(len(df))
+    return df
@@ -0,0 +1,102 @@
+"""Pickle files whose large buffers (e.g. the numpy blocks of a DataFrame) are stored out of band.
+
+With the pickle protocol 5, the buffers are not copied into the pickle stream: they are written
+as they are after it, each one aligned on `ALIGNMENT` bytes, and loaded back as views on the file
+content, or on the file pages when it is memory-mapped.
+
+Layout of a file:
+    - MAGIC
+    - pickle stream length, number of buffers and buffer lengths, as little-endian uint64
+    - pickle stream
+    - buffers, each one starting at an offset multiple of ALIGNMENT
+"""
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import IO, Any, List, Union
+
+MAGIC = b"PKL5\x00\x00\x00\x01"
+ALIGNMENT = 64
+
+
+def _pickle():
+    if sys.version_info >= (3, 8):
+        import pickle
+        return pickle
+    import pickle5
+    return pickle5
+
+
+def _padding(offset: int) -> int:
+    return -offset % ALIGNMENT
+
+
+def dump(obj: Any, f: IO[bytes]) -> None:
+    """Write the object into a binary file object, with its buffers out of band."""
+    pickle = _pickle()
+    buffers: List = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    header = MAGIC + struct.pack("<%iQ" % (len(raw_buffers) + 2), len(data), len(raw_buffers),
+                                 *[raw.nbytes for raw in raw_buffers])
+    f.write(header)
+    f.write(data)
+    offset = len(header) + len(data)
+    for raw in raw_buffers:
+        f.write(b"\0" * _padding(offset))
+        offset += _padding(offset)
+        f.write(raw)
+        offset += raw.nbytes
+
+
+def _read_aligned(f: IO[bytes], size: int):
+    """Read the file into memory aligned as a memory-mapped file would be."""
+    import numpy as np
+    memory = np.empty(size + ALIGNMENT, dtype=np.uint8)
+    start = -memory.ctypes.data % ALIGNMENT
+    content = memory[start:start + size]
+    f.readinto(content)  # type: ignore
+    return content
+
+
+def loads(content) -> Any:
+    """Load the object from the content of a file, its buffers being views on the content.
+
+    Args:
+        content (bytes-like): Content of the file. If it is writable (e.g. a bytearray or a mmap
+            opened with ACCESS_COPY), so are the arrays loaded.
+    """
+    pickle = _pickle()
+    view = memoryview(content)
+    assert bytes(view[:len(MAGIC)]) == MAGIC, "The file is not a pickle 5 file."
+    offset = len(MAGIC)
+    data_length, n_buffers = struct.unpack_from("<2Q", view, offset)
+    offset += 16
+    buffer_lengths = struct.unpack_from("<%iQ" % n_buffers, view, offset)
+    offset += 8 * n_buffers
+    data = view[offset:offset + data_length]
+    offset += data_length
+    buffers = []
+    for buffer_length in buffer_lengths:
+        offset += _padding(offset)
+        buffers.append(view[offset:offset + buffer_length])
+        offset += buffer_length
+    return pickle.loads(data, buffers=buffers)
+
+
+def load(file_path: Union[str, Path, IO[bytes]], memory_map: bool = False) -> Any:
+    """Load the object of a pickle 5 file.
+
+    Args:
+        file_path (str, Path or binary file object): File path, or file already opened.
+        memory_map (bool, default: False): Should the file be memory-mapped ? The buffers are then
+            loaded without copy: they point to the pages of the file, copied only when they are
+            modified.
+    """
+    if hasattr(file_path, "read"):
+        return loads(bytearray(file_path.read()))  # type: ignore
+    with open(str(file_path), "rb") as f:
+        if not memory_map:
+            return loads(_read_aligned(f, Path(str(file_path)).stat().st_size))
+        return loads(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
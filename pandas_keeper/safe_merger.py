@@ -1,15 +1,57 @@
+import numpy as np
 import pandas as pd
 from .logger import Logger
 from .assert_check import assert_type
+from .merge_keys import estimate_merge, factorize_keys, factorize_sorted_keys, \
+    find_duplicated_keys, is_sorted_on_keys, lookup_merge, match_keys, sorted_merge, \
+    unify_categories
+from .write import write
 
 SIDES = ["left", "right"]
+SORTED_MERGE_HOWS = ["left", "inner"]
+# validate -> (are the left keys unique, are the right keys unique)
+VALIDATE_UNIQUE_KEYS = {
+    None: (False, False),
+    "one_to_one": (True, True),
+    "1:1": (True, True),
+    "one_to_many": (True, False),
+    "1:m": (True, False),
+    "many_to_one": (False, True),
+    "m:1": (False, True),
+    "many_to_many": (False, False),
+    "m:m": (False, False)
+}
 LOGGER = Logger()
 
 
 def safe_merge(left_df, right_df, how="left", on_key_dtypes="str", on=None, left_on=None,
                right_on=None, na_allowed=False, left_na_allowed=None, right_na_allowed=None,
                drop_side_keys="right", suffixes=(False, False), validate="many_to_one",
-               logger=LOGGER.logger, **merge_kwargs):
+               logger=None, explain=False, max_rows=None, max_memory=None, presorted=False,
+               duplicates_file=None, **merge_kwargs):
+    """Merge two DataFrames after checking their key columns.
+
+    The size of the output is computed from the key counts before merging, so that a merge
+    multiplying the rows is stopped before it uses the memory.
+
+    The unordered categorical keys of both sides are given the same categories, so that their
+    types are checked on the categories and they are merged on their codes.
+
+    Args:
+        explain (bool, default: False): Should the size of the output be returned instead of
+            merging ? It is returned as a MergeEstimate(n_rows, memory).
+        max_rows (int): Maximum number of rows of the output, no limit if not specified.
+        max_memory (int): Maximum estimated memory of the output in bytes, no limit if not
+            specified.
+        presorted (bool or "auto", default: False): Are both DataFrames sorted on a single key
+            without N/A values ? It is checked if True, and detected if "auto". The keys are then
+            encoded without hashing them, and the left and inner merges are done by ranges of
+            right rows.
+        duplicates_file (str): File where all the key values on several rows are written, with
+            their number of rows, when `validate` fails (e.g. duplicated_keys.csv). Only a sample
+            of them is in the error message.
+    """
+    logger = LOGGER.logger if logger is None else logger
     left_keys_dtypes, right_key_dtypes, left_keys, right_keys = _get_left_right_keys(
         on_key_dtypes, on, left_on, right_on)
 
@@ -22,16 +64,45 @@ def safe_merge(left_df, right_df, how="left", on_key_dtypes="str", on=None, left
     _check_key_columns(left_df, left_keys, left_keys_dtypes, left_na_allowed)
     _check_key_columns(right_df, right_keys, right_key_dtypes, right_na_allowed)
 
-    left_concat_keys = _concat_keys(left_df, left_keys)
-    right_concat_keys = _concat_keys(right_df, right_keys)
-
-    logger.info("Left key values in right table: %s / %s, %.2f%%" % _get_matching_keys_info(
-        left_concat_keys, right_concat_keys))
-    logger.info("Right key values in left table: %s / %s, %.2f%%" % _get_matching_keys_info(
-        right_concat_keys, left_concat_keys))
-
-    merged_df = left_df.merge(right_df, how=how, left_on=left_keys, right_on=right_keys,
-                              suffixes=suffixes, validate=validate, **merge_kwargs)
+    left_df, right_df = unify_categories(left_df, left_keys, right_df, right_keys)
+    sorted_keys = _check_presorted(presorted, left_df, left_keys, right_df, right_keys)
+    if sorted_keys:
+        left_codes, right_codes, n_codes = factorize_sorted_keys(
+            left_df[left_keys[0]].to_numpy(), right_df[right_keys[0]].to_numpy())
+    else:
+        left_codes, right_codes, n_codes = factorize_keys(left_df, left_keys, right_df,
+                                                          right_keys)
+    keys_match = match_keys(left_codes, right_codes, n_codes)
+    _log_keys_match(logger, keys_match, left_df, left_keys, right_df, right_keys)
+
+    _check_validate(validate, keys_match, left_df, left_keys, left_codes, right_df, right_keys,
+                    right_codes, duplicates_file)
+
+    merge_estimate = estimate_merge(keys_match, how, left_df, right_df)
+    logger.info("Merged table: %s rows, %.1f MB" % (merge_estimate.n_rows,
+                                                    merge_estimate.memory / 2 ** 20))
+    if explain:
+        return merge_estimate
+    assert max_rows is None or merge_estimate.n_rows <= max_rows, \
+        "The merge would produce %s rows, more than max_rows=%s." % (merge_estimate.n_rows,
+                                                                     max_rows)
+    assert max_memory is None or merge_estimate.memory <= max_memory, \
+        "The merge would use %s bytes, more than max_memory=%s." % (merge_estimate.memory,
+                                                                    max_memory)
+
+    right_columns = [col for col in right_df.columns
+                     if col not in _common_keys(left_keys, right_keys)]
+    merge_by_codes = _can_merge_by_codes(left_df, left_keys, right_df, right_keys, validate,
+                                         keys_match, merge_kwargs)
+    if merge_by_codes and how == "left" and (keys_match.right_counts <= 1).all():
+        merged_df = lookup_merge(left_df, left_codes, right_df[right_columns], right_codes,
+                                 n_codes)
+    elif merge_by_codes and sorted_keys and how in SORTED_MERGE_HOWS:
+        merged_df = sorted_merge(left_df, left_codes, right_df[right_columns], right_codes,
+                                 keys_match.right_counts, how)
+    else:
+        merged_df = left_df.merge(right_df, how=how, left_on=left_keys, right_on=right_keys,
+                                  suffixes=suffixes, validate=validate, **merge_kwargs)
     if drop_side_keys == "right":
         merged_df = _drop_other_key_columns(merged_df, left_keys, right_keys)
     elif drop_side_keys == "left":
@@ -45,10 +116,6 @@ def _to_list(val):
     return [val]
 
 
-def _concat_keys(df, keys):
-    return pd.Series(list(zip(*[df[col] for col in keys])))
-
-
 def _get_check_na_allowed_args(na_allowed_arg, left_na_allowed_arg, right_na_allowed_arg):
     if na_allowed_arg is None:
         assert left_na_allowed_arg is not None and right_na_allowed_arg is not None, \
@@ -170,18 +237,100 @@ def _check_side_non_key_columns(df, other_df, keys, df_side):
         df_side, other_side, list(df_common_cols))
 
 
+def _check_validate(validate, keys_match, left_df, left_keys, left_codes, right_df, right_keys,
+                    right_codes, duplicates_file):
+    """Check the unicity of the key values required by `validate`, as `merge` does, with a
+    bounded error message."""
+    if validate not in VALIDATE_UNIQUE_KEYS:
+        return
+    for side, unique, df, keys, codes, counts in zip(
+            SIDES, VALIDATE_UNIQUE_KEYS[validate], [left_df, right_df], [left_keys, right_keys],
+            [left_codes, right_codes], [keys_match.left_counts, keys_match.right_counts]):
+        if unique and (counts > 1).any():
+            raise pd.errors.MergeError("Merge keys are not unique in %s dataset; not a %s merge. %s"
+                                       % (side, validate, _get_duplicated_keys_info(
+                                           df, keys, codes, counts, duplicates_file)))
+
+
+def _get_duplicated_keys_info(df, keys, codes, counts, duplicates_file):
+    duplicated_keys = find_duplicated_keys(codes, counts)
+    sample = list(zip(df[keys].iloc[duplicated_keys.sample].itertuples(index=False, name=None),
+                      duplicated_keys.sample_counts))
+    info = "%s key values are on several rows (%s rows), e.g. %s" % (
+        duplicated_keys.n_keys, duplicated_keys.n_rows,
+        ", ".join("%s: %s rows" % (key, count) for key, count in sample))
+    if duplicates_file is None:
+        return info
+    duplicated_rows = np.flatnonzero(counts[codes] > 1)
+    _, first_rows = np.unique(codes[duplicated_rows], return_index=True)
+    first_rows = duplicated_rows[np.sort(first_rows)]
+    duplicates_df = df[keys].iloc[first_rows].reset_index(drop=True)
+    duplicates_df["n_rows"] = counts[codes[first_rows]]
+    write(duplicates_df, duplicates_file)
+    return "%s. All of them are written in %s." % (info, duplicates_file)
+
+
 def _check_right_key_values_unicity(right_concat_keys):
-    val_key = right_concat_keys.value_counts(dropna=False)
-    wrong_keys = list(val_key[val_key > 1].index)
-    assert len(
-        wrong_keys) == 0, "Each of these key values are present on multiple rows: %s" % wrong_keys
+    codes, uniques = pd.factorize(right_concat_keys)
+    codes = np.where(codes < 0, len(uniques), codes)
+    counts = np.bincount(codes, minlength=len(uniques) + 1)
+    duplicated_keys = find_duplicated_keys(codes, counts)
+    assert duplicated_keys.n_keys == 0, \
+        "%s key values are each present on multiple rows, e.g. %s" % (
+            duplicated_keys.n_keys, list(right_concat_keys.iloc[duplicated_keys.sample]))
 
 
-def _get_matching_keys_info(concat_keys, other_concat_keys):
-    isin = concat_keys.isin(other_concat_keys)
-    return isin.sum(), isin.shape[0], isin.mean() * 100
+def _get_match_info(matched, size):
+    return matched, size, matched / size * 100 if size else float("nan")
+
+
+def _log_keys_match(logger, keys_match, left_df, left_keys, right_df, right_keys):
+    logger.info("Left key values in right table: %s / %s, %.2f%%" % _get_match_info(
+        keys_match.left_matched, len(left_df)))
+    logger.info("Right key values in left table: %s / %s, %.2f%%" % _get_match_info(
+        keys_match.right_matched, len(right_df)))
+    for side, df, keys, sample in [("Left", left_df, left_keys, keys_match.left_unmatched_sample),
+                                   ("Right", right_df, right_keys,
+                                    keys_match.right_unmatched_sample)]:
+        if len(sample):
+            logger.debug("%s key values not matched, e.g. %s" % (
+                side, list(df[keys].iloc[sample].itertuples(index=False, name=None))))
 
 
 def _drop_other_key_columns(df, keys, other_keys):
     key_cols_to_drop = list(set(other_keys) - set(keys))
     return df.drop(columns=key_cols_to_drop)
+
+
+def _common_keys(left_keys, right_keys):
+    """Key columns with the same name on both sides, kept once by `merge`."""
+    return {left_key for left_key, right_key in zip(left_keys, right_keys)
+            if left_key == right_key}
+
+
+def _can_merge_by_codes(left_df, left_keys, right_df, right_keys, validate, keys_match,
+                        merge_kwargs):
+    """Can the merge be done from the key codes rather than by `merge` ?
+
+    It is the case without other merge options, when the key counts satisfy `validate`, and
+    without columns in common which `merge` would suffix or reject.
+    """
+    if validate not in VALIDATE_UNIQUE_KEYS or len(merge_kwargs) > 0:
+        return False
+    left_unique, right_unique = VALIDATE_UNIQUE_KEYS[validate]
+    if (left_unique and (keys_match.left_counts > 1).any()) or \
+            (right_unique and (keys_match.right_counts > 1).any()):
+        return False
+    common_columns = set(left_df.columns) & set(right_df.columns)
+    return common_columns <= _common_keys(left_keys, right_keys) and \
+        left_df.columns.is_unique and right_df.columns.is_unique
+
+
+def _check_presorted(presorted, left_df, left_keys, right_df, right_keys):
+    """Check whether both DataFrames are sorted on their key, as specified by `presorted`."""
+    if presorted is False:
+        return False
+    is_sorted = is_sorted_on_keys(left_df, left_keys) and is_sorted_on_keys(right_df, right_keys)
+    assert is_sorted or presorted == "auto", \
+        "With presorted=True, both DataFrames should be sorted on a single key without N/A values."
+    return is_sorted
@@ -0,0 +1,150 @@
+import io
+import os
+from pathlib import Path
+from typing import IO, Dict, Tuple, Union
+
+LOCAL_PROTOCOL = "file"
+
+
+class Storage(object):
+    """Location where the files are read and written, addressed by `<protocol>://<path>`."""
+
+    def open(self, path: str, mode: str) -> IO[bytes]:
+        """Open the file as a binary stream, `mode` being "rb" or "wb"."""
+        raise NotImplementedError
+
+    def exists(self, path: str) -> bool:
+        raise NotImplementedError
+
+    def remove(self, path: str) -> None:
+        raise NotImplementedError
+
+
+class LocalStorage(Storage):
+    """Local file system, the storage of the paths without protocol."""
+
+    def open(self, path: str, mode: str) -> IO[bytes]:
+        return open(path, mode)  # type: ignore
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def remove(self, path: str) -> None:
+        os.remove(path)
+
+
+class _MemoryFile(io.BytesIO):
+
+    def __init__(self, files: Dict[str, bytes], path: str):
+        super().__init__()
+        self._files = files
+        self._path = path
+
+    def close(self) -> None:
+        if not self.closed:
+            self._files[self._path] = self.getvalue()
+        super().close()
+
+
+class MemoryStorage(Storage):
+    """Files kept as bytes in memory, a file written is visible once it is closed.
+
+    Attributes:
+        files (dict of str, bytes): Path -> content of the file.
+    """
+
+    def __init__(self):
+        self.files: Dict[str, bytes] = {}
+
+    def open(self, path: str, mode: str) -> IO[bytes]:
+        if "w" in mode:
+            return _MemoryFile(self.files, path)
+        if path not in self.files:
+            raise FileNotFoundError(path)
+        return io.BytesIO(self.files[path])
+
+    def exists(self, path: str) -> bool:
+        return path in self.files
+
+    def remove(self, path: str) -> None:
+        del self.files[path]
+
+
+class FsspecStorage(Storage):
+    """Storage of an fsspec file system (s3, gcs, hdfs, ...).
+
+    Args:
+        protocol (str): fsspec protocol of the file system.
+        **storage_options: Keyword arguments to pass to `fsspec.filesystem`.
+    """
+
+    def __init__(self, protocol: str, **storage_options):
+        import fsspec
+        self.file_system = fsspec.filesystem(protocol, **storage_options)
+
+    def open(self, path: str, mode: str) -> IO[bytes]:
+        return self.file_system.open(path, mode)
+
+    def exists(self, path: str) -> bool:
+        return self.file_system.exists(path)
+
+    def remove(self, path: str) -> None:
+        self.file_system.rm(path)
+
+
+class StorageUrl(str):
+    """Path of a file with a protocol, e.g. memory://data.csv, validated by pydantic as a str
+    since a Path would drop the double slash of the protocol."""
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value):
+        if not isinstance(value, str) or "://" not in value:
+            raise ValueError("%s has no protocol." % value)
+        return cls(value)
+
+
+STORAGES: Dict[str, Storage] = {
+    LOCAL_PROTOCOL: LocalStorage(),
+    "memory": MemoryStorage()
+}
+
+
+def register_storage(protocol: str, storage: Storage) -> None:
+    """Read and write the files whose path starts with `<protocol>://` in the storage."""
+    STORAGES[protocol] = storage
+
+
+def get_storage(file_path: Union[str, Path]) -> Tuple[Storage, str]:
+    """Get the storage of a file and the path of the file in it.
+
+    The protocols which are not registered are handled by fsspec, if it is installed.
+    """
+    file_path = str(file_path)
+    if "://" not in file_path:
+        return STORAGES[LOCAL_PROTOCOL], file_path
+    protocol, path = file_path.split("://", 1)
+    if protocol not in STORAGES:
+        register_storage(protocol, FsspecStorage(protocol))
+    return STORAGES[protocol], path
+
+
+def has_storage(file_path: Union[str, Path]) -> bool:
+    """Is the file opened through a storage ? The files whose protocol is not registered have none
+    if fsspec is not installed: the pandas readers open them by themselves (e.g. https URLs with
+    urllib)."""
+    file_path = str(file_path)
+    if "://" not in file_path or file_path.split("://", 1)[0] in STORAGES:
+        return True
+    try:
+        import fsspec  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def is_local(file_path: Union[str, Path]) -> bool:
+    return isinstance(get_storage(file_path)[0], LocalStorage)
@@ -1,49 +1,231 @@
-import os
 import json
+import os
 import pickle as pk
+import threading
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, List, Optional, TYPE_CHECKING
+from pandas_keeper import pickle5
+from pandas_keeper.compression import Compression, open_compressed, split_compression
+from pandas_keeper.df_keeper.parallel import ExecutorKind, get_executor
 from pandas_keeper.logger import Logger
+from pandas_keeper.storage import LocalStorage, Storage, get_storage
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
 LOGGER = Logger()
+JSONL_CHUNKSIZE = 100000
+
+
+def write_jsonl(obj, f, chunksize=JSONL_CHUNKSIZE, **kw):
+    """Write a DataFrame or an iterable of records as JSON lines, `chunksize` rows at a time.
+
+    Only one chunk is serialized at a time, so the memory used does not grow with the rows.
+
+    Args:
+        obj (DataFrame or iterable of dict): Rows to write.
+        f: File opened in binary mode.
+        chunksize (int, default: 100000): Number of rows serialized at a time.
+        **kw: Keyword arguments to pass to `DataFrame.to_json` or to `json.dumps` for records.
+    """
+    if hasattr(obj, "to_json"):
+        for start in range(0, len(obj), chunksize):
+            json_lines = obj.iloc[start:start + chunksize].to_json(orient="records", lines=True,
+                                                                   **kw)
+            if not json_lines.endswith("\n"):
+                json_lines += "\n"
+            f.write(str.encode(json_lines))
+    else:
+        records = iter(obj)
+        for chunk in iter(lambda: list(islice(records, chunksize)), []):
+            f.write(str.encode("".join(json.dumps(record, **kw) + "\n" for record in chunk)))
+
+
+def write_json(obj, f, *args, **kw):
+    f.write(str.encode(json.dumps(obj, *args, **kw)))
+
+
+def write_csv(obj, f, *args, **kw):
+    f.write(str.encode(obj.to_csv(*args, **kw)))
+
+
+def write_parquet(obj, f, *args, **kw):
+    kw["engine"] = "pyarrow"
+    obj.to_parquet(f, *args, **kw)
+
+
+def write_pickle(obj, f, *args, **kw):
+    if not args:
+        kw.setdefault("protocol", pk.HIGHEST_PROTOCOL)
+    pk.dump(obj, f, *args, **kw)
+
+
+def write_pickle5(obj, f):
+    pickle5.dump(obj, f)
+
+
+def write_text(obj, f):
+    f.write(str.encode(obj))
+
+
+# Extension -> function writing an object into a binary file object.
+DATA_WRITER: Dict[str, Callable[..., None]] = {
+    "json": write_json,
+    "jsonl": write_jsonl,
+    "ndjson": write_jsonl,
+    "csv": write_csv,
+    "txt": write_csv,
+    "pq": write_parquet,
+    "pkl": write_pickle,
+    "pickle": write_pickle,
+    "pkl5": write_pickle5,
+    "sql": write_text
+}
+
+# Writers given the path of the local uncompressed files instead of a Python file object, which
+# lets them write with their own (faster) file handling.
+PATH_WRITERS: List[str] = ["pq"]
+
+
+def register_writer(extension: str, writer: Callable[..., None], path: bool = False) -> None:
+    """Register the writer of a file format, new or not.
+
+    Args:
+        extension (str): Extension of the files written.
+        writer (callable): Function writing an object into a binary file object, as
+            `writer(obj, f, *args, **kw)`.
+        path (bool, default: False): Can the writer be given the path of local files instead of
+            a file object ?
+    """
+    DATA_WRITER[extension] = writer
+    if path and extension not in PATH_WRITERS:
+        PATH_WRITERS.append(extension)
+
+
+def _open(storage: Storage, path: str, compression: Optional[Compression], threads: int):
+    f = storage.open(path, "wb")
+    if compression is None:
+        return f
+    return open_compressed(f, "wb", compression, threads)
 
 
 @LOGGER.timeit
-def write(obj, filename, *args, **kw):
+def write(obj, filename, *args, compression_threads=-1, **kw):
     """Write the file whatever its extensions.
 
     Implemented extensions of file:
         - json
+        - jsonl (or ndjson), written by chunks
         - csv (or txt as a csv)
         - pickle (or pkl)
+        - pkl5 (pickle protocol 5 with the buffers stored out of band, see `pickle5`)
         - pq (parquet file)
         - sql (as a text file)
+    Other extensions can be added with `register_writer`.
+
+    These files can be compressed with a second extension: gz, bz2, xz, zst or lz4 (e.g.
+    data.csv.gz). The file is compressed while it is written.
+
+    The file is written on the storage of its protocol, e.g. memory://data.csv, local if it has
+    none.
 
     Args:
         obj : Python object to write
         filename (str): File path.
         *args: Variable length argument to pass to the underlying write function.
+        compression_threads (int, default: -1): Number of threads compressing the file, only
+            zstd can compress with several threads. -1 uses as many threads as CPUs.
         **kw: Keyword arguments to pass to the underlying write function.
     """
-    file_extension = filename.split(".")[-1]
+    storage, path = get_storage(filename)
+    file_extension, compression = split_compression(path)
+    if file_extension not in DATA_WRITER:
+        raise NotImplementedError("Write .%s files is not implemented." % file_extension)
+    writer = DATA_WRITER[file_extension]
     try:
-        with open(filename, "wb") as f:
-            if file_extension == "json":
-                json_file = json.dumps(obj, *args, **kw)
-                f.write(str.encode(json_file))
-            elif file_extension in ["csv", "txt"]:
-                csv_file = obj.to_csv(*args, **kw)
-                f.write(str.encode(csv_file))
-            elif file_extension in ["pq"]:
-                kw["engine"] = "pyarrow"
-                obj.to_parquet(f, *args, **kw)
-            elif file_extension in ["pkl", "pickle"]:
-                pk.dump(obj, f, *args, **kw)
-            elif file_extension == "sql":
-                f.write(str.encode(obj))
-            else:
-                raise NotImplementedError("Write .%s files is not implemented." % file_extension)
+        if file_extension in PATH_WRITERS and compression is None and \
+                isinstance(storage, LocalStorage):
+            writer(obj, path, *args, **kw)
+        else:
+            with _open(storage, path, compression, compression_threads) as f:
+                writer(obj, f, *args, **kw)
     except Exception as e:  # If the writing has failed, remove the incompleted file
         try:
-            os.remove(filename)
+            storage.remove(path)
         except Exception as erase_error:
             print(erase_error)
         raise e
+
+
+class BackgroundWriter(object):
+    """Write files in background threads, so that their serialization and I/O overlap with the
+    computations of the caller.
+
+    At most `max_pending` writings are submitted and not finished: submitting another one blocks
+    until one of them finishes, which bounds the memory held by the objects waiting to be written.
+    The objects must not be modified until their writing is finished.
+
+    Args:
+        max_workers (int): Number of threads writing the files, the number of CPUs + 4 (at most
+            32) if not specified.
+        max_pending (int): Maximum number of writings submitted and not finished, twice the number
+            of threads if not specified.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self._executor = get_executor(ExecutorKind.thread, max_workers)
+        self._pending = threading.BoundedSemaphore(max_pending or 2 * max_workers)
+
+    def submit(self, obj, filename, *args, **kw) -> "Future":
+        """Write the file in background, see `write`. Block while `max_pending` writings are
+        pending.
+
+        Returns:
+            A Future of the writing, raising the error of the writing if it has failed (the
+            incomplete file being removed).
+        """
+        self._pending.acquire()
+        try:
+            future = self._executor.submit(write, obj, filename, *args, **kw)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        return future
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "BackgroundWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+
+_BACKGROUND_WRITER: Optional[BackgroundWriter] = None
+
+
+def write_async(obj, filename, *args, **kw) -> "Future":
+    """Write the file in background with a module BackgroundWriter, see `write`.
+
+    Returns:
+        A Future of the writing.
+    """
+    global _BACKGROUND_WRITER
+    if _BACKGROUND_WRITER is None:
+        _BACKGROUND_WRITER = BackgroundWriter()
+    return _BACKGROUND_WRITER.submit(obj, filename, *args, **kw)
+
+
+async def awrite(obj, filename, *args, **kw) -> None:
+    """Coroutine writing the file in background, see `write`.
+
+    The event loop is not blocked while waiting for a free slot of the BackgroundWriter.
+    """
+    import asyncio
+    loop = asyncio.get_event_loop()
+    future = await loop.run_in_executor(None, partial(write_async, obj, filename, *args, **kw))
+    await asyncio.wrap_future(future)
@@ -1,4 +1,5 @@
 import sys
+from copy import copy
 from pathlib import Path
 import pytest
 from shutil import copytree
@@ -21,6 +22,26 @@ def test_folder(tmp_path, data_folder):
     return dst
 
 
+@pytest.fixture()
+def restore_registries():
+    """Remove the readers, writers and storages registered by the test."""
+    from pandas_keeper.df_keeper import read
+    from pandas_keeper import storage, write
+    tables = [read.ENGINE_DATA_READER, read.CHUNK_DATA_READER, read.DTYPE_READERS,
+              read.COLUMNS_READERS, read.FILTERS_READERS, read.STREAM_READERS,
+              write.DATA_WRITER, write.PATH_WRITERS, storage.STORAGES]
+    saved_tables = [list(table) if isinstance(table, list) else
+                    {key: copy(value) if isinstance(value, (dict, list)) else value
+                     for key, value in table.items()} for table in tables]
+    yield
+    for table, saved_table in zip(tables, saved_tables):
+        if isinstance(table, list):
+            table[:] = saved_table
+        else:
+            table.clear()
+            table.update(saved_table)
+
+
 @pytest.fixture(scope="module")
 def df_to_merge():
     df = pd.DataFrame({"float1": np.random.randn(20)})
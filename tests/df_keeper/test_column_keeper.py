@@ -4,7 +4,9 @@ import pandas as pd
 from pytest_helpers.utils import assert_error
 from pandas_keeper import safe_replace_series
 from pandas_keeper.df_keeper.column_keeper import ColumnKeeper, ColumnActionName, ColumnAction, \
-    check_df_keeper_columns_are_in_df, treat_column, transform_column
+    check_df_keeper_columns_are_in_df, treat_column, transform_column, get_columns_dtypes, \
+    compile_actions, treat_columns
+from pandas_keeper.df_keeper.parallel import ExecutorKind
 
 DF = pd.DataFrame({
     "str_range_10": list(map(str, range(10))),
@@ -108,3 +110,98 @@ def test_treat_column():
 
     # Then
     pd.testing.assert_series_equal(actual_pds, expected_pds)
+
+
+def test_get_columns_dtypes():
+    # Given
+    column_keepers = [
+        ColumnKeeper(name="no_dtype"),
+        ColumnKeeper(name="dtype", dtype="Int64"),
+        ColumnKeeper(name="astype", dtype="float32",
+                     actions=[ColumnAction(name="astype", args=["float32"])]),
+        ColumnKeeper(name="fillna", dtype="Int64", actions=[ColumnAction(name="fillna", args=0)]),
+        ColumnKeeper(name="astype_str", actions=[ColumnAction(name="astype", args=["str"])]),
+        ColumnKeeper(name="astype_category",
+                     actions=[ColumnAction(name="astype", args=["category"])])
+    ]
+
+    # When
+    actual_dtypes = get_columns_dtypes(column_keepers)
+
+    # Then
+    assert actual_dtypes == {"dtype": "Int64", "astype": "float32"}
+
+
+@pytest.mark.parametrize("actions, expected_actions, case", [
+    ([ColumnAction(name="replace", args={"a": "b"}), ColumnAction(name="replace", args={})],
+     [ColumnAction(name="replace", args={"a": "b"})], "Empty replace is dropped."),
+    ([ColumnAction(name="replace", args={"a": "b", "c": "d"}),
+      ColumnAction(name="replace", args={"b": "c", "a": "e", "f": "g"})],
+     [ColumnAction(name="replace", args={"a": "c", "c": "d", "b": "c", "f": "g"})],
+     "Consecutive replace dictionaries are composed."),
+    ([ColumnAction(name="astype", args="int64"), ColumnAction(name="astype", args="int64")],
+     [ColumnAction(name="astype", args="int64")], "Repeated astype is dropped."),
+    ([ColumnAction(name="replace", args={"a": "b"}), ColumnAction(name="fillna", args="c"),
+      ColumnAction(name="replace", args={"c": "d"})],
+     [ColumnAction(name="replace", args={"a": "b"}), ColumnAction(name="fillna", args="c"),
+      ColumnAction(name="replace", args={"c": "d"})], "Non consecutive replace are kept."),
+    ([ColumnAction(name="replace", args={"a": ["b"]}), ColumnAction(name="replace", args={})],
+     [ColumnAction(name="replace", args={"a": ["b"]})], "Replace with list values are kept.")
+])
+def test_compile_actions(actions, expected_actions, case):
+    # When
+    actual_actions = compile_actions(actions)
+
+    # Then
+    assert actual_actions == expected_actions, case
+
+
+def test_compiled_actions_give_the_same_column():
+    # Given
+    pds = pd.Series(["a", "b", "c", None, "e"], name="col1")
+    actions = [ColumnAction(name="replace", args={"a": "b", "c": "d"}),
+               ColumnAction(name="replace", args={"b": "c", "a": "e"}),
+               ColumnAction(name="fillna", args="f")]
+    expected_pds = pds.copy()
+    for action in actions:
+        expected_pds = transform_column(expected_pds, action)
+
+    # When
+    actual_pds = treat_column(pds.copy(), ColumnKeeper(name="col1", actions=actions))
+
+    # Then
+    pd.testing.assert_series_equal(actual_pds, expected_pds)
+
+
+@pytest.mark.parametrize("executor_kind", [None, *ExecutorKind])
+def test_treat_columns(executor_kind):
+    # Given
+    column_keepers = [
+        ColumnKeeper(name="str_range_10_with_nan", actions=[ColumnAction(name="fillna", args="9")]),
+        ColumnKeeper(name="str_range_10", actions=[ColumnAction(name="astype", args="int64")])
+    ]
+    expected_columns = [DF["str_range_10_with_nan"].fillna("9"), DF["str_range_10"].astype(int)]
+
+    # When
+    actual_columns = treat_columns(DF.copy(), column_keepers, executor_kind, max_workers=2)
+
+    # Then
+    for actual_pds, expected_pds in zip(actual_columns, expected_columns):
+        pd.testing.assert_series_equal(actual_pds, expected_pds)
+
+
+@pytest.mark.parametrize("executor_kind", list(ExecutorKind))
+def test_treat_columns_gathers_errors(executor_kind):
+    # Given
+    column_keepers = [ColumnKeeper(name="str_range_10_with_nan", nullable=False),
+                      ColumnKeeper(name="str_range_10"),
+                      ColumnKeeper(name="a_j", actions=[
+                          ColumnAction(name="safe_replace", args=[{"a": "A"}])])]
+
+    # When
+    with pytest.raises(AssertionError) as error:
+        treat_columns(DF.copy(), column_keepers, executor_kind)
+
+    # Then
+    message = str(error.value)
+    assert message.index("str_range_10_with_nan") < message.index("a_j")
@@ -0,0 +1,45 @@
+import pandas as pd
+import pytest
+from pandas_keeper.df_keeper.compact import compact_column, compact_df
+
+
+@pytest.mark.parametrize("pds, expected_dtype, case", [
+    (pd.Series(range(200)), "uint8", "Positive integers are downcast to unsigned integers."),
+    (pd.Series([-1, 1000]), "int16", "Negative integers are downcast to signed integers."),
+    (pd.Series([0.5, None, 2.25]), "float32", "Floats representable in float32 are downcast."),
+    (pd.Series([0.1, 2.0]), "float64", "Floats not representable in float32 are kept."),
+    (pd.Series(["a", "b"] * 10), "category", "Low cardinality strings become categories."),
+    (pd.Series(["a", 1] * 10), "object", "Mixed values are kept."),
+    (pd.Series([1, None, 3], dtype="Int64"), "Int64", "Extension dtypes are kept.")
+])
+def test_compact_column(pds, expected_dtype, case):
+    # When
+    actual_pds = compact_column(pds)
+
+    # Then
+    assert actual_pds.dtype == expected_dtype, case
+    pd.testing.assert_series_equal(actual_pds, pds, check_dtype=False, check_categorical=False)
+
+
+def test_compact_column_high_cardinality_strings():
+    # Given
+    pds = pd.Series([str(i) for i in range(10)])
+
+    # When
+    actual_pds = compact_column(pds)
+
+    # Then
+    assert actual_pds.dtype == "string[pyarrow]"
+    assert list(actual_pds) == list(pds)
+
+
+def test_compact_df():
+    # Given
+    df = pd.DataFrame({"int": range(10), "float": [float(i) for i in range(10)]})
+
+    # When
+    actual_df = compact_df(df.copy(), ["int"])
+
+    # Then
+    assert actual_df["int"].dtype == "uint8"
+    assert actual_df["float"].dtype == "float64"
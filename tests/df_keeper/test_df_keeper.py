@@ -1,8 +1,9 @@
 from pathlib import Path
 import pytest
+from pydantic import ValidationError
 from pandas_keeper.df_keeper.column_keeper import ColumnKeeper
 from pandas_keeper.df_keeper.df_keeper import DFKeeper
-from pandas_keeper.df_keeper.read import DataReaderExtension
+from pandas_keeper.df_keeper.read import DataReaderExtension, DataReaderEngine
 
 
 @pytest.mark.parametrize("schema, expected_df_keeper_dict", [
@@ -16,6 +17,19 @@ from pandas_keeper.df_keeper.read import DataReaderExtension
     ({"file_path": "data.csv", "columns": [{"name": "Column 1"}, {"name": "Column 2"}]},
      {"file_path": Path("data.csv"), "reader": DataReaderExtension.csv,
       "columns": [ColumnKeeper(name="Column 1"), ColumnKeeper(name="Column 2")]}),
+    ({"file_path": "data.csv", "reader_engine": "pyarrow"},
+     {"file_path": Path("data.csv"), "reader": DataReaderExtension.csv,
+      "reader_engine": DataReaderEngine.pyarrow}),
+    ({"file_path": "data.csv.gz"},
+     {"file_path": Path("data.csv.gz"), "reader": DataReaderExtension.csv}),
+    ({"file_path": "memory://folder/data.csv"},
+     {"file_path": "memory://folder/data.csv", "reader": DataReaderExtension.csv}),
+    ({"file_path": "data.pq", "filters": [["Column 2", ">", 2]]},
+     {"file_path": Path("data.pq"), "reader": DataReaderExtension.pq,
+      "filters": [("Column 2", ">", 2)]}),
+    ({"file_path": "data.xlsx", "sheets": [0, "Sheet 2"], "cache_folder": "cache"},
+     {"file_path": Path("data.xlsx"), "reader": DataReaderExtension.xlsx,
+      "sheets": [0, "Sheet 2"], "cache_folder": Path("cache")}),
 ])
 def test_df_keeper(schema, expected_df_keeper_dict):
     # Given
@@ -26,3 +40,33 @@ def test_df_keeper(schema, expected_df_keeper_dict):
 
     # Then
     assert df_keeper == expected_df_keeper
+
+
+def test_df_keeper_reader_must_be_registered():
+    # When/Then
+    with pytest.raises(ValidationError):
+        DFKeeper(file_path="data.unknown")
+
+
+def test_df_keeper_engine_must_support_reader():
+    # When/Then
+    with pytest.raises(ValidationError):
+        DFKeeper(file_path="data.parquet", reader_engine="pyarrow")
+
+
+def test_df_keeper_sheets_only_for_excel():
+    # When/Then
+    with pytest.raises(ValidationError):
+        DFKeeper(file_path="data.csv", sheets=[0])
+
+
+def test_df_keeper_sheets_not_in_read_arguments():
+    # When/Then
+    with pytest.raises(ValidationError):
+        DFKeeper(file_path="data.xlsx", sheets=[0], read_arguments={"sheet_name": 1})
+
+
+def test_df_keeper_filters_only_for_filtering_readers():
+    # When/Then
+    with pytest.raises(ValidationError):
+        DFKeeper(file_path="data.csv", filters=[("Column 2", ">", 2)])
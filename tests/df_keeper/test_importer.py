@@ -1,5 +1,7 @@
 from pytest_helpers.utils import assert_error
+from pandas_keeper.df_keeper.df_keeper import DFKeeper
 from pandas_keeper.df_keeper.importer import import_df
+from pandas_keeper.df_keeper.report import ColumnCheck, CheckResult, ValidationReportError
 import pandas as pd
 import pytest
 
@@ -55,7 +57,119 @@ DATA_DF = pd.DataFrame({"Column 1": ["a", "b", "a", None], "Column 2": [1, 2, 3,
          ]
      },
      pd.DataFrame({"col_1": ["a", "b", "a", "c"], "Column 2": [1, 2, 3, 4]}), False,
-     "treat column 1 but not column 2.")
+     "treat column 1 but not column 2."),
+    ({
+         "file_path": "data.csv",
+         "reader_engine": "pyarrow",
+         "read_arguments": {"sep": ";"},
+         "columns": [
+             {
+                 "name": "Column 2",
+                 "dtype": "float64"
+             }
+         ]
+     },
+     DATA_DF.astype({"Column 2": "float64"}), False,
+     "Read with the pyarrow engine and parse Column 2 with its dtype."),
+    ({
+         "file_path": "data.csv",
+         "read_arguments": {"sep": ";"},
+         "columns": [
+             {
+                 "name": "Column 1",
+                 "dtype": "category"
+             },
+             {
+                 "name": "Column 2",
+                 "dtype": "Int64",
+                 "nullable": False
+             }
+         ]
+     },
+     DATA_DF.astype({"Column 1": "category", "Column 2": "Int64"}), False,
+     "Parse the columns directly with their dtypes."),
+    ({
+         "file_path": "data.csv",
+         "reader_engine": "pyarrow",
+         "read_arguments": {"sep": ";"},
+         "columns": [
+             {
+                 "name": "Column 1",
+                 "dtype": "category"
+             },
+             {
+                 "name": "Column 2",
+                 "dtype": "Int64"
+             }
+         ]
+     },
+     DATA_DF.astype({"Column 1": "category", "Column 2": "Int64"}), False,
+     "Parse the columns directly with their dtypes with the pyarrow engine."),
+    ({
+         "file_path": "data.csv",
+         "read_arguments": {"sep": ";"},
+         "compact": True,
+         "columns": [
+             {
+                 "name": "Column 1",
+                 "compact": False
+             }
+         ]
+     },
+     DATA_DF.astype({"Column 2": "uint8"}), False, "Compact the columns except Column 1."),
+    ({
+         "file_path": "data.csv",
+         "read_arguments": {"sep": ";"},
+         "executor": "thread",
+         "columns": [
+             {
+                 "name": "Column 1",
+                 "actions": [{"name": "fillna", "args": "c"}]
+             },
+             {
+                 "name": "Column 2",
+                 "actions": [{"name": "astype", "args": "float64"}]
+             }
+         ]
+     },
+     pd.DataFrame({"Column 1": ["a", "b", "a", "c"], "Column 2": [1., 2., 3., 4.]}), False,
+     "Treat the columns in parallel."),
+    ({
+         "file_path": "data.csv",
+         "read_arguments": {"sep": ";"},
+         "keep_only": True,
+         "columns": [
+             {
+                 "name": "Column 2",
+                 "drop": True
+             }
+         ]
+     },
+     pd.DataFrame(index=range(4)), False, "Drop all the kept columns."),
+    ({
+         "file_path": "data_with_nan.csv",
+         "read_arguments": {"sep": ";"},
+         "columns": [
+             {
+                 "name": "Column 2",
+                 "dtype": "int64"
+             }
+         ]
+     },
+     pd.DataFrame({"Column 1": ["a", "b", "a", None], "Column 2": [1., None, 3., 4.]}), False,
+     "Read a nullable int column with N/A values as inferred."),
+    ({
+         "file_path": "data_with_nan.csv",
+         "read_arguments": {"sep": ";"},
+         "columns": [
+             {
+                 "name": "Column 2",
+                 "dtype": "int64",
+                 "nullable": False
+             }
+         ]
+     },
+     None, True, "N/A values in a non nullable int column.")
 ])
 @assert_error
 def test_import_df(test_folder, schema, expected_df, should_fail, case):
@@ -68,3 +182,152 @@ def test_import_df(test_folder, schema, expected_df, should_fail, case):
     # Then
     if not should_fail:
         pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+def test_import_df_with_a_df_keeper(test_folder):
+    # Given
+    df_keeper = DFKeeper(file_path=str(test_folder / "data.csv"), read_arguments={"sep": ";"},
+                         columns=[{"name": "Column 1",
+                                   "actions": [{"name": "fillna", "args": "c"}]}])
+    expected_df = pd.DataFrame({"Column 1": ["a", "b", "a", "c"], "Column 2": [1, 2, 3, 4]})
+
+    # When
+    actual_dfs = [import_df(df_keeper) for _ in range(2)]
+
+    # Then
+    for actual_df in actual_dfs:
+        pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize("executor", [None, "thread"])
+def test_import_df_collecting_errors(test_folder, executor):
+    # Given
+    schema = {
+        "file_path": str(test_folder / "data.csv"),
+        "read_arguments": {"sep": ";"},
+        "executor": executor,
+        "columns": [
+            {"name": "Error"},
+            {"name": "Column 1", "nullable": False,
+             "actions": [{"name": "safe_replace", "args": [{"a": "A"}]}]},
+            {"name": "Column 2", "dtype": "Int64"}
+        ]
+    }
+    with open(test_folder / "data.csv", "a") as f:
+        f.write("c;x\n")
+    expected_results = [
+        CheckResult(column="Error", check=ColumnCheck.presence, count=1, examples=["Error"]),
+        CheckResult(column="Column 1", check=ColumnCheck.values, count=2, examples=["b", "c"]),
+        CheckResult(column="Column 1", check=ColumnCheck.nullable, count=1, examples=[None]),
+        CheckResult(column="Column 2", check=ColumnCheck.dtype, count=1, examples=["x"])
+    ]
+
+    # When
+    with pytest.raises(ValidationReportError) as error:
+        import_df(schema, collect_errors=True)
+
+    # Then
+    assert error.value.report.n_rows == 5
+    assert error.value.report.results == expected_results
+
+
+@pytest.mark.parametrize("dtype", ["category", "str", "float64", "Int64"])
+def test_import_df_astype_as_read_then_cast(tmp_path, dtype):
+    # Given
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("Column 1\n007\n8\n009\n")
+    schema = {"file_path": str(file_path),
+              "columns": [{"name": "Column 1", "actions": [{"name": "astype", "args": dtype}]}]}
+    expected_df = pd.read_csv(file_path).astype({"Column 1": dtype})
+
+    # When
+    actual_df = import_df(schema)
+
+    # Then
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize("sheet_name, expected_sheets", [
+    ("Sheet 2", [1]),
+    ([1, "Sheet 1"], [1, 0]),
+    (None, [0, 1]),
+])
+def test_import_excel_sheet_name_with_cache(test_folder, sheet_name, expected_sheets):
+    # Given
+    file_path = test_folder / "data.xlsx"
+    sheet_dfs = [DATA_DF, DATA_DF.assign(**{"Column 2": DATA_DF["Column 2"] * 10})]
+    with pd.ExcelWriter(file_path) as writer:
+        for i, sheet_df in enumerate(sheet_dfs):
+            sheet_df.to_excel(writer, sheet_name="Sheet %s" % (i + 1), index=False)
+    schema = {"file_path": str(file_path), "cache_folder": str(test_folder / "cache"),
+              "read_arguments": {"sheet_name": sheet_name}}
+    expected_df = pd.concat([sheet_dfs[i] for i in expected_sheets], ignore_index=True)
+
+    # When
+    actual_df = import_df(schema)
+
+    # Then
+    pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize("collect_errors", [False, True])
+def test_import_wide_df_with_inplace_actions_in_threads(tmp_path, collect_errors):
+    # Given
+    file_path = tmp_path / "wide.csv"
+    names = ["Column %s" % i for i in range(60)]
+    wide_df = pd.DataFrame({name: ["yes", "no", None] * 100 for name in names})
+    wide_df.to_csv(file_path, index=False)
+    schema = {"file_path": str(file_path), "executor": "thread", "max_workers": 8,
+              "columns": [{"name": name, "actions": [
+                  {"name": "replace", "args": {"yes": 1, "no": 0}},
+                  {"name": "fillna", "args": -1}]} for name in names]}
+    expected_df = pd.DataFrame({name: [1.0, 0.0, -1.0] * 100 for name in names})
+
+    # When
+    actual_dfs = [import_df(schema, collect_errors=collect_errors) for _ in range(5)]
+
+    # Then
+    for actual_df in actual_dfs:
+        pd.testing.assert_frame_equal(actual_df, expected_df, check_dtype=False)
+
+
+@pytest.mark.parametrize("columns, filters, expected_df, should_fail, case", [
+    ([{"name": "Column 2"}], None, DATA_DF[["Column 2"]], False, "Read only the kept column."),
+    ([{"name": "Column 2"}], [("Column 2", ">", 2)],
+     DATA_DF.loc[DATA_DF["Column 2"] > 2, ["Column 2"]].reset_index(drop=True), False,
+     "Read only the rows matching the filters."),
+    ([{"name": "Error"}], None, None, True, "Missing column of the projection."),
+])
+@assert_error
+def test_import_parquet_projection(test_folder, columns, filters, expected_df, should_fail,
+                                   case):
+    # Given
+    file_path = test_folder / "data.parquet"
+    DATA_DF.to_parquet(file_path)
+    schema = {"file_path": str(file_path), "keep_only": True, "columns": columns,
+              "filters": filters}
+
+    # When
+    actual_df = import_df(schema)
+
+    # Then
+    if not should_fail:
+        pd.testing.assert_frame_equal(actual_df, expected_df)
+
+
+@pytest.mark.parametrize("file_name, read_arguments", [
+    ("data.csv", {"sep": ";", "engine": "python"}),
+    ("data.xlsx", {"engine": "openpyxl"})
+])
+def test_import_df_with_pandas_engine_argument(test_folder, file_name, read_arguments):
+    # Given
+    file_path = test_folder / file_name
+    if file_name.endswith(".xlsx"):
+        DATA_DF.to_excel(file_path, index=False)
+    schema = {"file_path": str(file_path), "read_arguments": read_arguments}
+
+    # When
+    actual_df = import_df(schema)
+
+    # Then
+    pd.testing.assert_frame_equal(actual_df, DATA_DF)
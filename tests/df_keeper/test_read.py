@@ -1,9 +1,17 @@
+import gzip
 from typing import Dict
 from pandas import DataFrame
 import pandas as pd
-from pandas_keeper.df_keeper.read import DataReaderExtension, read_data
+from pandas_keeper.df_keeper.df_keeper import DFKeeper
+from pandas_keeper.df_keeper.parallel import ExecutorKind
+from pandas_keeper.df_keeper.read import DataReaderExtension, DataReaderEngine, read_data, \
+    read_excel_sheets, iter_data, register_reader
+from pandas_keeper.write import write
 import pytest
 
+# Modules of the optional compressions, the tests are skipped if they are not installed.
+COMPRESSION_MODULES = {"zst": "zstandard", "lz4": "lz4.frame"}
+
 
 @pytest.fixture(scope="session")
 def df(data_folder):
@@ -21,7 +29,16 @@ WRITE_CONF: Dict[DataReaderExtension, Dict] = {
     DataReaderExtension.xls: {"method": DataFrame.to_excel, "kwargs": {"index": False}},
     DataReaderExtension.xlsx: {"method": DataFrame.to_excel, "kwargs": {"index": False}},
     DataReaderExtension.xlsm: {"method": DataFrame.to_excel, "kwargs": {"index": False,
-                                                                        "engine": "openpyxl"}}
+                                                                        "engine": "openpyxl"}},
+    DataReaderExtension.feather: {"method": DataFrame.to_feather},
+    DataReaderExtension.arrow: {"method": DataFrame.to_feather},
+    DataReaderExtension.jsonl: {"method": DataFrame.to_json,
+                                "kwargs": {"orient": "records", "lines": True}},
+    DataReaderExtension.ndjson: {"method": DataFrame.to_json,
+                                 "kwargs": {"orient": "records", "lines": True}},
+    DataReaderExtension.pkl: {"method": DataFrame.to_pickle},
+    DataReaderExtension.pickle: {"method": DataFrame.to_pickle},
+    DataReaderExtension.pkl5: {"method": lambda df, path: write(df, str(path))}
 }
 
 
@@ -36,3 +53,184 @@ def test_import_df(df, test_folder, extension, write):
 
     # Then
     pd.testing.assert_frame_equal(read_df, df)
+
+
+@pytest.mark.parametrize("extension", [DataReaderExtension.csv, DataReaderExtension.txt])
+def test_read_data_with_pyarrow_engine(df, test_folder, extension):
+    # Given
+    path = test_folder / ("data.%s" % extension.value)
+    df.to_csv(path, index=False, sep=";")
+
+    # When
+    read_df = read_data(path, extension, reader_engine=DataReaderEngine.pyarrow, sep=";",
+                        dtype={"Column 2": "float64"})
+
+    # Then
+    pd.testing.assert_frame_equal(read_df, df.astype({"Column 2": "float64"}))
+
+
+def test_read_data_with_pyarrow_engine_not_implemented(test_folder):
+    # When/Then
+    with pytest.raises(NotImplementedError):
+        read_data(test_folder / "data.json", DataReaderExtension.json,
+                  reader_engine=DataReaderEngine.pyarrow)
+
+
+def test_read_parquet_with_memory_map(df, test_folder):
+    # Given
+    path = test_folder / "data.parquet"
+    df.to_parquet(path)
+
+    # When
+    read_df = read_data(path, DataReaderExtension.parquet, memory_map=True)
+
+    # Then
+    pd.testing.assert_frame_equal(read_df, df)
+
+
+@pytest.mark.parametrize("extension", [DataReaderExtension.feather, DataReaderExtension.arrow])
+def test_read_arrow_with_memory_map_without_copy(test_folder, extension):
+    # Given
+    import pyarrow as pa
+    path = test_folder / ("data.%s" % extension.value)
+    df = pd.DataFrame({"int": range(10 ** 6), "float": [0.5] * 10 ** 6})
+    df.to_feather(path, compression="uncompressed", chunksize=len(df))
+    allocated_bytes = pa.total_allocated_bytes()
+
+    # When
+    read_df = read_data(path, extension, memory_map=True)
+
+    # Then
+    assert pa.total_allocated_bytes() == allocated_bytes
+    pd.testing.assert_frame_equal(read_df, df)
+
+
+@pytest.mark.parametrize("executor_kind", [None, ExecutorKind.thread])
+def test_read_excel_sheets_with_cache(df, test_folder, executor_kind):
+    # Given
+    path = test_folder / "data.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        df.to_excel(writer, sheet_name="Sheet 1", index=False)
+        df.to_excel(writer, sheet_name="Sheet 2", index=False)
+    cache_folder = test_folder / "cache"
+    expected_df = pd.concat([df, df], ignore_index=True)
+
+    # When
+    read_df = read_excel_sheets(path, ["Sheet 1", "Sheet 2"], cache_folder, executor_kind)
+    cached_read_df = read_excel_sheets(path, ["Sheet 1", "Sheet 2"], cache_folder, executor_kind)
+
+    # Then
+    assert len(list(cache_folder.glob("*.parquet"))) == 2
+    pd.testing.assert_frame_equal(read_df, expected_df)
+    pd.testing.assert_frame_equal(cached_read_df, expected_df)
+
+
+@pytest.mark.parametrize("extension", [DataReaderExtension.jsonl, DataReaderExtension.ndjson])
+@pytest.mark.parametrize("engine", [DataReaderEngine.pandas, DataReaderEngine.pyarrow])
+def test_write_and_read_jsonl_by_chunks(df, test_folder, extension, engine):
+    # Given
+    path = test_folder / ("data.%s" % extension.value)
+    write(df, str(path), chunksize=3)
+
+    # When
+    read_df = read_data(path, extension, reader_engine=engine, dtype={"Column 2": "float64"})
+    chunks = list(iter_data(path, extension, chunksize=3))
+
+    # Then
+    pd.testing.assert_frame_equal(read_df, df.astype({"Column 2": "float64"}))
+    assert [len(chunk) for chunk in chunks] == [3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), df)
+
+
+@pytest.mark.parametrize("file_name", ["data.jsonl", "data.jsonl.gz", "memory://data.jsonl"])
+def test_read_jsonl_with_arrow_keeps_the_column_order(df, test_folder, file_name):
+    # Given
+    path = file_name if "://" in file_name else str(test_folder / file_name)
+    write(df, path)
+
+    # When
+    read_df = read_data(path, DataReaderExtension.jsonl, reader_engine=DataReaderEngine.pyarrow,
+                        dtype={"Column 2": "float64"})
+
+    # Then
+    assert list(read_df.columns) == list(df.columns)
+
+
+def test_write_jsonl_records(test_folder):
+    # Given
+    path = test_folder / "records.jsonl"
+    records = ({"a": i, "b": str(i)} for i in range(5))
+
+    # When
+    write(records, str(path), chunksize=2)
+
+    # Then
+    pd.testing.assert_frame_equal(read_data(path, DataReaderExtension.jsonl),
+                                  pd.DataFrame({"a": range(5), "b": range(5)}))
+
+
+@pytest.mark.parametrize("compression", ["gz", "bz2", "xz", "zst", "lz4"])
+@pytest.mark.parametrize("extension, engine, kwargs", [
+    (DataReaderExtension.csv, DataReaderEngine.pandas, {"sep": ";"}),
+    (DataReaderExtension.csv, DataReaderEngine.pyarrow, {"sep": ";"}),
+    (DataReaderExtension.jsonl, DataReaderEngine.pandas, {}),
+    (DataReaderExtension.jsonl, DataReaderEngine.pyarrow, {}),
+    (DataReaderExtension.pq, DataReaderEngine.pandas, {}),
+])
+def test_write_and_read_compressed_data(df, test_folder, compression, extension, engine, kwargs):
+    # Given
+    if compression in COMPRESSION_MODULES:
+        pytest.importorskip(COMPRESSION_MODULES[compression])
+    path = test_folder / ("data.%s.%s" % (extension.value, compression))
+    write_kwargs = {"index": False} if extension is DataReaderExtension.csv else {}
+    write(df, str(path), **kwargs, **write_kwargs)
+
+    # When
+    read_df = read_data(path, extension, reader_engine=engine, **kwargs)
+    chunks = list(iter_data(path, extension, reader_engine=engine, **kwargs))
+
+    # Then
+    pd.testing.assert_frame_equal(read_df, df)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
+@pytest.mark.parametrize("extension, read_kwargs", [
+    (DataReaderExtension.csv, {"sep": ";"}),
+    (DataReaderExtension.jsonl, {})
+])
+def test_read_compressed_data_with_encoding(test_folder, extension, read_kwargs):
+    # Given
+    path = test_folder / ("latin_1.%s.gz" % extension.value)
+    df = pd.DataFrame({"Column 1": ["é", "à"], "Column 2": [1, 2]})
+    if extension is DataReaderExtension.csv:
+        content = df.to_csv(sep=";", index=False)
+    else:
+        content = df.to_json(orient="records", lines=True, force_ascii=False)
+    with gzip.open(path, "wb") as f:
+        f.write(content.encode("latin-1"))
+
+    # When
+    read_df = read_data(path, extension, encoding="latin-1", **read_kwargs)
+    chunks = list(iter_data(path, extension, encoding="latin-1", **read_kwargs))
+
+    # Then
+    pd.testing.assert_frame_equal(read_df, df)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
+def test_register_reader(df, test_folder, restore_registries):
+    # Given
+    path = test_folder / "data.tsv"
+    df.to_csv(path, sep="\t", index=False)
+
+    def read_tsv(file_path, *args, **kw):
+        return pd.read_csv(file_path, *args, sep="\t", **kw)
+
+    # When
+    extension = register_reader("tsv", read_tsv, dtype=True, stream=True)
+    read_df = read_data(path, "tsv", dtype={"Column 2": "float64"})
+
+    # Then
+    assert extension == "tsv"
+    assert DFKeeper(file_path=path).reader == "tsv"
+    pd.testing.assert_frame_equal(read_df, df.astype({"Column 2": "float64"}))
@@ -0,0 +1,72 @@
+import json
+import pandas as pd
+import pytest
+from pandas_keeper.df_keeper.df_keeper import DFKeeper
+from pandas_keeper.df_keeper.importer import import_df
+from pandas_keeper.df_keeper.registry import SchemaRegistry, SCHEMA_REGISTRY, get_df_keeper
+
+
+@pytest.fixture()
+def schema(test_folder):
+    return {"file_path": str(test_folder / "data.csv"), "read_arguments": {"sep": ";"},
+            "columns": [{"name": "Column 1", "actions": [{"name": "fillna", "args": "c"}]}]}
+
+
+@pytest.fixture()
+def schema_folder(tmp_path, schema):
+    folder = tmp_path / "schemas"
+    folder.mkdir()
+    (folder / "data.json").write_text(json.dumps(schema))
+    (folder / "same_data.json").write_text(json.dumps(schema))
+    yaml = pytest.importorskip("yaml")
+    (folder / "data_yaml.yaml").write_text(yaml.safe_dump(schema))
+    (folder / "not_a_schema.txt").write_text("")
+    return folder
+
+
+def test_schema_registry_load_folder(schema_folder, schema):
+    # Given
+    registry = SchemaRegistry()
+
+    # When
+    df_keepers = registry.load_folder(schema_folder)
+
+    # Then
+    assert len(df_keepers) == 3
+    assert set(registry.df_keepers) == {"data", "same_data", "data_yaml"}
+    assert registry.get("data") is registry.get("same_data")
+    assert registry.get("data_yaml") == DFKeeper(**schema)
+
+
+def test_schema_registry_load_unchanged_file_once(schema_folder):
+    # Given
+    registry = SchemaRegistry()
+    df_keeper = registry.load(schema_folder / "data.json")
+
+    # When
+    reloaded_df_keeper = registry.load(schema_folder / "data.json", name="other_name")
+
+    # Then
+    assert reloaded_df_keeper is df_keeper
+    assert "other_name" in registry
+
+
+def test_df_keeper_is_immutable(schema):
+    # Given
+    df_keeper = get_df_keeper(schema)
+
+    # When/Then
+    with pytest.raises(TypeError):
+        df_keeper.keep_only = True
+
+
+def test_import_df_with_a_registered_schema_name(schema_folder):
+    # Given
+    SCHEMA_REGISTRY.load(schema_folder / "data.json", name="test_registry_data")
+    expected_df = pd.DataFrame({"Column 1": ["a", "b", "a", "c"], "Column 2": [1, 2, 3, 4]})
+
+    # When
+    actual_df = import_df("test_registry_data")
+
+    # Then
+    pd.testing.assert_frame_equal(actual_df, expected_df)
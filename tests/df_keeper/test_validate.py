@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+from pandas_keeper.df_keeper.report import ColumnCheck, CheckResult
+from pandas_keeper.df_keeper.validate import validate_df
+
+
+@pytest.mark.parametrize("columns, expected_results, case", [
+    ([{"name": "Column 1"}, {"name": "Column 2", "dtype": "int64", "nullable": False}], [],
+     "The file satisfies its schema."),
+    ([{"name": "Error"}, {"name": "Column 2"}],
+     [CheckResult(column="Error", check=ColumnCheck.presence, count=1, examples=["Error"])],
+     "A column is missing."),
+    ([{"name": "Column 1", "nullable": False}],
+     [CheckResult(column="Column 1", check=ColumnCheck.nullable, count=1, examples=[None])],
+     "A column has null values."),
+    ([{"name": "Column 1", "actions": [{"name": "safe_replace", "args": [{"a": "A"}]}]}],
+     [CheckResult(column="Column 1", check=ColumnCheck.values, count=1, examples=["b"])],
+     "A column has values not replaced."),
+    ([{"name": "Column 1", "dtype": "int64"}],
+     [CheckResult(column="Column 1", check=ColumnCheck.dtype, count=3, examples=["a", "b"])],
+     "A column has values of the wrong type, only 2 examples are kept."),
+    ([{"name": "Column 1", "actions": [{"name": "astype", "args": "int64"}], "nullable": False}],
+     [CheckResult(column="Column 1", check=ColumnCheck.action, count=4, examples=[
+         "astype: invalid literal for int() with base 10: 'a'",
+         "astype: invalid literal for int() with base 10: 'b'"])],
+     "An action fails.")
+])
+@pytest.mark.parametrize("extension", ["csv", "parquet"])
+def test_validate_df(test_folder, extension, columns, expected_results, case):
+    # Given
+    file_path = test_folder / ("data.%s" % extension)
+    if extension == "parquet":
+        pd.read_csv(test_folder / "data.csv", sep=";").to_parquet(file_path)
+        read_arguments = {}
+    else:
+        read_arguments = {"sep": ";"}
+    schema = {"file_path": str(file_path), "read_arguments": read_arguments, "columns": columns}
+
+    # When
+    report = validate_df(schema, chunksize=1, n_examples=2)
+
+    # Then
+    assert report.n_rows == 4
+    assert report.results == expected_results, case
+    assert report.is_valid == (not expected_results)
+
+
+@pytest.mark.parametrize("extension, schema, expected_n_rows", [
+    ("parquet", {"read_arguments": {"use_threads": False, "engine": "pyarrow"}}, 4),
+    ("parquet", {"filters": [("Column 2", ">", 2)]}, 2),
+    ("xlsx", {"sheets": [0, 1]}, 8),
+])
+def test_validate_df_with_schema_options(test_folder, extension, schema, expected_n_rows):
+    # Given
+    file_path = test_folder / ("data.%s" % extension)
+    df = pd.read_csv(test_folder / "data.csv", sep=";")
+    if extension == "parquet":
+        df.to_parquet(file_path)
+    else:
+        with pd.ExcelWriter(file_path) as writer:
+            df.to_excel(writer, sheet_name="Sheet 1", index=False)
+            df.to_excel(writer, sheet_name="Sheet 2", index=False)
+    schema = {"file_path": str(file_path), "columns": [{"name": "Column 2", "dtype": "int64"}],
+              **schema}
+
+    # When
+    report = validate_df(schema, chunksize=1)
+
+    # Then
+    assert report.n_rows == expected_n_rows
+    assert report.is_valid
+
+
+@pytest.mark.parametrize("values, expected_results", [
+    (["007", "8", "009"], []),
+    (["007", "8", None],
+     [CheckResult(column="Column 1", check=ColumnCheck.nullable, count=1, examples=[None])]),
+])
+def test_validate_df_parses_the_columns_as_import_df(tmp_path, values, expected_results):
+    # Given
+    file_path = tmp_path / "data.csv"
+    pd.DataFrame({"Column 1": values}).to_csv(file_path, index=False)
+    schema = {"file_path": str(file_path),
+              "columns": [{"name": "Column 1", "dtype": "str", "nullable": False}]}
+
+    # When
+    report = validate_df(schema, chunksize=2)
+
+    # Then
+    assert report.n_rows == 3
+    assert report.results == expected_results
+
+
+def test_validate_df_reports_only_the_values_which_cannot_be_parsed(test_folder):
+    # Given
+    with open(test_folder / "data.csv", "a") as f:
+        f.write("c;x\n")
+    schema = {"file_path": str(test_folder / "data.csv"), "read_arguments": {"sep": ";"},
+              "columns": [{"name": "Column 2", "dtype": "Int64"}]}
+
+    # When
+    report = validate_df(schema, chunksize=2)
+
+    # Then
+    assert report.n_rows == 5
+    assert report.results == [
+        CheckResult(column="Column 2", check=ColumnCheck.dtype, count=1, examples=["x"])]
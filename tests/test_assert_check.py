@@ -3,7 +3,8 @@ import pytest
 from pandas import DataFrame, Series
 from pytest_helpers.utils import assert_error
 from pandas_keeper.assert_check import safe_replace, assert_values, assert_type, \
-    safe_replace_series, assert_non_null_idx
+    safe_replace_series, assert_non_null_idx, get_wrong_type_values, get_wrong_values, \
+    replace_series
 
 DF = pd.DataFrame({
     "str_range_10": list(map(str, range(10))),
@@ -218,3 +219,63 @@ def test_assert_non_null_idx(pds, na_allowed, return_value, expected_returned_va
             pd.testing.assert_series_equal(actual_non_null_idx, expected_returned_value)
         else:
             assert actual_non_null_idx is None
+
+
+ARROW_STR = Series([" a", "B ", None, "c", "1"], dtype="string[pyarrow]")
+ARROW_INT = Series([1, 2, None, 2 ** 40], dtype="int64[pyarrow]")
+
+
+def _to_object(pds: Series) -> Series:
+    return pds.astype(object).where(pds.notnull(), None)
+
+
+@pytest.mark.parametrize("pds, dtype", [
+    (ARROW_STR, "int64"), (ARROW_STR, "float64"), (ARROW_STR, str), (ARROW_STR, object),
+    (ARROW_INT, "int32"), (ARROW_INT, "float64"), (ARROW_INT, "bool"), (ARROW_INT, str),
+    (ARROW_INT, object)
+])
+def test_get_wrong_type_values_of_arrow_series(pds, dtype):
+    # When
+    wrong_values = get_wrong_type_values(pds, dtype)
+
+    # Then
+    assert list(wrong_values) == list(get_wrong_type_values(_to_object(pds).dropna(), dtype))
+
+
+@pytest.mark.parametrize("values", [["a", "c"], ["a", "c", None], [1, 2]])
+def test_get_wrong_values_of_arrow_series(values):
+    # When
+    wrong_values = get_wrong_values(ARROW_STR, values)
+
+    # Then
+    assert list(wrong_values) == list(get_wrong_values(_to_object(ARROW_STR), values))
+
+
+@pytest.mark.parametrize("values, strip, lower", [
+    ({"a": "x", "B": "y"}, True, False),
+    ({"A": "x", "b": "y"}, True, True),
+    ({" a": "x"}, False, False),
+    ({"a": 1}, True, False)
+])
+def test_replace_arrow_series(values, strip, lower):
+    # When
+    replaced_pds = replace_series(ARROW_STR, values, strip, lower)
+
+    # Then
+    assert _to_object(replaced_pds).tolist() == \
+        replace_series(_to_object(ARROW_STR), values, strip, lower).tolist()
+    if all(isinstance(value, str) for value in values.values()):
+        assert replaced_pds.dtype == "string[pyarrow]"
+
+
+@pytest.mark.parametrize("values", [["1", "a", "1", None], [1, 2, 2], ["a", "b"]])
+@pytest.mark.parametrize("dtype", ["int", str, "float64"])
+def test_get_wrong_type_values_of_categorical_series(values, dtype):
+    # Given
+    pds = pd.Series(values, dtype="category")
+
+    # When
+    wrong_values = get_wrong_type_values(pds, dtype)
+
+    # Then
+    assert list(wrong_values) == list(get_wrong_type_values(pds.astype(object).dropna(), dtype))
@@ -0,0 +1,17 @@
+import pytest
+from pandas_keeper.compression import Compression, split_compression
+
+
+@pytest.mark.parametrize("file_path, expected", [
+    ("data.csv", ("csv", None)),
+    ("data.csv.gz", ("csv", Compression.gzip)),
+    ("folder.v2/data.parquet.zst", ("parquet", Compression.zstd)),
+    ("data.jsonl.LZ4", ("jsonl", Compression.lz4)),
+    ("data.gz", ("gz", None)),
+])
+def test_split_compression(file_path, expected):
+    # When
+    extension_compression = split_compression(file_path)
+
+    # Then
+    assert extension_compression == expected
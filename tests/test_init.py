@@ -1,5 +1,10 @@
+import subprocess
+import sys
+from pathlib import Path
 import pandas as pd
-from pandas_keeper import patch_pandas
+import pytest
+import pandas_keeper
+from pandas_keeper import patch_pandas, safe_merger
 
 NEW_DF_METHODS = ["safe_merge", "safe_replace"]
 NEW_SERIES_METHODS = ["assert_type", "assert_values", "safe_replace"]
@@ -79,3 +84,25 @@ def test_safe_replace_as_a_method_of_a_series():
 
     # Then
     pd.testing.assert_series_equal(actual_pds, expected_pds)
+
+
+def test_import_pandas_keeper_does_not_import_its_modules():
+    # Given
+    code = "import sys, pandas_keeper; print('pandas_keeper.safe_merger' in sys.modules)"
+
+    # When
+    output = subprocess.run([sys.executable, "-c", code], cwd=str(Path(__file__).parents[1]),
+                            stdout=subprocess.PIPE, universal_newlines=True).stdout
+
+    # Then
+    assert output.strip() == "False"
+
+
+def test_functions_are_loaded_on_first_access():
+    # When
+    from pandas_keeper import safe_merge
+
+    # Then
+    assert safe_merge is safe_merger.safe_merge
+    with pytest.raises(AttributeError):
+        pandas_keeper.error
@@ -209,3 +209,14 @@ class TestLogger(object):
         # log = start_msg + timer + empty_new_line
         assert "func finished in 00:00:0" in log_lines[-2]
         assert len(log_lines) == len(start_msg.split("\n")) + 1 + 1
+
+    def test_logger_is_configured_on_first_use(self, log_file):
+        # Given
+        logger = Logger(logger_name="LazyLogger", filename=log_file)
+        assert not log_file.exists()
+
+        # When
+        logger.logger.info("configured")
+
+        # Then
+        assert log_file.exists()
@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas_keeper import merge_keys
+from pandas_keeper.merge_keys import factorize_keys, factorize_sorted_keys, \
+    find_duplicated_keys, is_sorted_on_keys, match_keys, unify_categories
+
+
+@pytest.mark.parametrize("left_df, right_df, keys", [
+    (pd.DataFrame({"a": [1, 2, 2, 3]}), pd.DataFrame({"a": [2, 3, 4]}), ["a"]),
+    (pd.DataFrame({"a": [1, 1, 2, None], "b": ["x", "y", "x", "x"]}),
+     pd.DataFrame({"a": [1, 2, None, 5], "b": ["y", "y", "x", "x"]}), ["a", "b"]),
+    (pd.DataFrame({"a": pd.Series([], dtype="int64")}), pd.DataFrame({"a": [1]}), ["a"]),
+])
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_match_keys(left_df, right_df, keys, use_numba):
+    # Given
+    if use_numba:
+        pytest.importorskip("numba")
+    left_tuples = list(left_df[keys].itertuples(index=False, name=None))
+    right_tuples = list(right_df[keys].itertuples(index=False, name=None))
+    left_in_right = [_is_in(key, right_tuples) for key in left_tuples]
+    right_in_left = [_is_in(key, left_tuples) for key in right_tuples]
+
+    # When
+    keys_match = match_keys(*factorize_keys(left_df, keys, right_df, keys), n_samples=1,
+                            use_numba=use_numba)
+
+    # Then
+    assert keys_match.left_matched == sum(left_in_right)
+    assert keys_match.right_matched == sum(right_in_left)
+    assert list(keys_match.left_unmatched_sample) == \
+        [i for i, is_in in enumerate(left_in_right) if not is_in][:1]
+    assert list(keys_match.right_unmatched_sample) == \
+        [i for i, is_in in enumerate(right_in_left) if not is_in][:1]
+    assert keys_match.left_counts.sum() == len(left_df)
+    assert keys_match.right_counts.sum() == len(right_df)
+
+
+def _is_in(key, keys):
+    # N/A values match each other, as in merge.
+    return any(all(a == b or (pd.isna(a) and pd.isna(b)) for a, b in zip(key, other))
+               for other in keys)
+
+
+def test_factorize_keys_does_not_overflow():
+    # Given
+    n_rows = 1000
+    df = pd.DataFrame({"key_%i" % i: np.arange(n_rows) for i in range(10)})
+
+    # When
+    left_codes, right_codes, n_codes = factorize_keys(df, list(df.columns), df, list(df.columns))
+
+    # Then
+    assert n_codes == n_rows
+    assert list(left_codes) == list(right_codes) == list(range(n_rows))
+
+
+@pytest.mark.parametrize("left_values, right_values", [
+    ([1, 2, 2, 3, 5], [0, 2, 3, 3, 4, 6]),
+    (["a", "a", "b"], ["b", "c"]),
+    ([], [1, 2]),
+    ([1, 2], [])
+])
+def test_factorize_sorted_keys(left_values, right_values):
+    # Given
+    left_df = pd.DataFrame({"key": pd.Series(left_values, dtype=object)})
+    right_df = pd.DataFrame({"key": pd.Series(right_values, dtype=object)})
+
+    # When
+    left_codes, right_codes, n_codes = factorize_sorted_keys(left_df["key"].to_numpy(),
+                                                             right_df["key"].to_numpy())
+
+    # Then
+    codes = np.concatenate([left_codes, right_codes])
+    assert n_codes == len(set(left_values) | set(right_values))
+    assert len(set(codes)) == n_codes and codes.max(initial=-1) < n_codes
+    expected_codes = np.concatenate(factorize_keys(left_df, ["key"], right_df, ["key"])[:2])
+    assert (pd.factorize(codes)[0] == pd.factorize(expected_codes)[0]).all()
+
+
+@pytest.mark.parametrize("df, keys, is_sorted", [
+    (pd.DataFrame({"a": [1, 2, 2]}), ["a"], True),
+    (pd.DataFrame({"a": [2, 1]}), ["a"], False),
+    (pd.DataFrame({"a": [1., None]}), ["a"], False),
+    (pd.DataFrame({"a": [1, 2], "b": [1, 2]}), ["a", "b"], False),
+    (pd.DataFrame({"a": pd.Categorical(["a", "b"])}), ["a"], False)
+])
+def test_is_sorted_on_keys(df, keys, is_sorted):
+    assert is_sorted_on_keys(df, keys) == is_sorted
+
+
+@pytest.mark.parametrize("n_samples", [0, 2, 10])
+def test_find_duplicated_keys(monkeypatch, n_samples):
+    # Given
+    monkeypatch.setattr(merge_keys, "SAMPLE_CHUNKSIZE", 3)
+    codes = np.array([0, 1, 2, 1, 3, 3, 4, 0, 3, 5])
+    counts = np.bincount(codes)
+
+    # When
+    duplicated_keys = find_duplicated_keys(codes, counts, n_samples=n_samples)
+
+    # Then
+    assert duplicated_keys.n_keys == 3
+    assert duplicated_keys.n_rows == 7
+    assert list(duplicated_keys.sample) == [0, 1, 4][:n_samples]
+    assert list(duplicated_keys.sample_counts) == [2, 2, 3][:n_samples]
+
+
+def test_factorize_keys_of_categories():
+    # Given
+    left_df = pd.DataFrame({"key": pd.Categorical(["b", None, "c", "b"])})
+    right_df = pd.DataFrame({"key": pd.Categorical(["a", "c", "d"])})
+
+    # When
+    left_df, right_df = unify_categories(left_df, ["key"], right_df, ["key"])
+    left_codes, right_codes, n_codes = factorize_keys(left_df, ["key"], right_df, ["key"])
+
+    # Then
+    assert list(left_df["key"].cat.categories) == list(right_df["key"].cat.categories) == \
+        ["b", "c", "a", "d"]
+    assert n_codes == 5
+    assert list(left_codes) == [0, 4, 1, 0]
+    assert list(right_codes) == [2, 1, 3]
+
+
+def test_unify_categories_keeps_ordered_categories():
+    # Given
+    left_df = pd.DataFrame({"key": pd.Categorical(["a", "b"], ordered=True)})
+    right_df = pd.DataFrame({"key": pd.Categorical(["b", "c"])})
+
+    # When
+    unified_left_df, unified_right_df = unify_categories(left_df, ["key"], right_df, ["key"])
+
+    # Then
+    assert unified_left_df is left_df and unified_right_df is right_df
@@ -0,0 +1,57 @@
+import io
+import numpy as np
+import pandas as pd
+import pytest
+from pandas_keeper import pickle5
+from pandas_keeper.df_keeper.read import DataReaderExtension, read_data
+from pandas_keeper.write import write
+
+
+@pytest.fixture(scope="module")
+def df():
+    return pd.DataFrame({"float": np.arange(1000, dtype="float64"),
+                         "int": np.arange(1000),
+                         "str": ["a", "b"] * 500})
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_load_aligned_buffers(df, tmp_path, memory_map):
+    # Given
+    path = tmp_path / "data.pkl5"
+    with open(path, "wb") as f:
+        pickle5.dump(df, f)
+
+    # When
+    loaded_df = pickle5.load(path, memory_map=memory_map)
+
+    # Then
+    pd.testing.assert_frame_equal(loaded_df, df)
+    for col in ["float", "int"]:
+        assert loaded_df[col].values.ctypes.data % pickle5.ALIGNMENT == 0
+
+
+def test_loads_from_bytes(df):
+    # Given
+    f = io.BytesIO()
+    pickle5.dump(df, f)
+
+    # When
+    loaded_df = pickle5.loads(bytearray(f.getvalue()))
+
+    # Then
+    pd.testing.assert_frame_equal(loaded_df, df)
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_write_and_read_pickle5(df, tmp_path, memory_map):
+    # Given
+    path = tmp_path / "data.pkl5"
+    write(df, str(path))
+
+    # When
+    read_df = read_data(path, DataReaderExtension.pkl5, memory_map=memory_map)
+    read_df.loc[0, "float"] = -1.
+
+    # Then
+    pd.testing.assert_frame_equal(read_data(path, DataReaderExtension.pkl5), df)
+    assert read_df.loc[0, "float"] == -1.
@@ -1,10 +1,11 @@
+from unittest.mock import MagicMock
 import pytest
 import pandas as pd
 from pytest_helpers.utils import assert_error
 from pandas_keeper.safe_merger import _make_check_na_allowed, _check_keys_in_df, \
     _check_keys_are_in_df_only_once, _get_left_right_keys, _check_side_non_key_columns, \
-    _check_right_key_values_unicity, _get_matching_keys_info, _drop_other_key_columns, \
-    _get_check_na_allowed_args, safe_merge
+    _check_right_key_values_unicity, _drop_other_key_columns, \
+    _get_check_na_allowed_args, _to_list, safe_merge
 
 
 @pytest.mark.parametrize("left_columns, right_columns, kw, final_columns, should_fail, "
@@ -197,27 +198,28 @@ def test_check_right_key_values_unicity(df_to_merge, right_keys, should_fail, ca
     _check_right_key_values_unicity(right_concat_keys)
 
 
-@pytest.mark.parametrize(
-    "keys, other_keys, sum_in_other, size, pct_in_other",
-    [
-        (["int_key"], ["int_key"], 20, 20, 100.),
-        (["int_key"], ["mult_int_key"], 10, 20, 50.),
-        (["mult_int_key"], ["int_key"], 20, 20, 100.),
-        (["int_key", "mult_int_key"], ["mult_int_key", "mult_int_key"], 10, 20, 50.)
-    ])
-def test_get_matching_keys_info(df_to_merge, keys, other_keys, sum_in_other, size, pct_in_other):
+@pytest.mark.parametrize("left_keys, right_keys, left_matched, right_matched", [
+    (["int_key"], ["int_key"], "20 / 20, 100.00%", "20 / 20, 100.00%"),
+    (["int_key"], ["mult_int_key"], "10 / 20, 50.00%", "20 / 20, 100.00%"),
+    (["mult_int_key"], ["int_key"], "20 / 20, 100.00%", "10 / 20, 50.00%"),
+    (["int_key", "mult_int_key"], ["mult_int_key", "mult_int_key"], "10 / 20, 50.00%",
+     "20 / 20, 100.00%")
+])
+def test_safe_merge_logs_the_keys_match(df_to_merge, left_keys, right_keys, left_matched,
+                                        right_matched):
     # Given
-    concat_keys = pd.Series(list(zip(*[df_to_merge[col] for col in keys])))
-    other_concat_keys = pd.Series(list(zip(*[df_to_merge[col] for col in other_keys])))
+    left_df = df_to_merge[left_keys].copy()
+    right_df = pd.DataFrame({"right_%s" % i: df_to_merge[key] for i, key in enumerate(right_keys)})
+    logger = MagicMock()
 
     # When
-    actual_sum_in_other, actual_size, actual_pct_in_other = _get_matching_keys_info(
-        concat_keys, other_concat_keys)
+    safe_merge(left_df, right_df, on_key_dtypes="int", left_on=left_keys,
+               right_on=list(right_df.columns), validate="many_to_many", logger=logger)
 
     # Then
-    assert actual_sum_in_other == sum_in_other
-    assert actual_size == size
-    assert actual_pct_in_other == pct_in_other
+    assert logger.info.call_args_list[:2] == [
+        (("Left key values in right table: %s" % left_matched,),),
+        (("Right key values in left table: %s" % right_matched,),)]
 
 
 @pytest.mark.parametrize("columns, left_keys, right_keys, expected_final_columns", [
@@ -235,3 +237,144 @@ def test_drop_other_key_columns(df_to_merge, columns, left_keys, right_keys,
 
     # Then
     assert list(final_df.columns) == expected_final_columns
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("validate", ["many_to_one", "many_to_many"])
+def test_safe_merge_explain(df_to_merge, how, validate):
+    # Given
+    left_df = df_to_merge[["mult_int_key", "str1"]].iloc[:15]
+    right_df = df_to_merge[["mult_int_key", "float1"]].iloc[5:] if validate == "many_to_many" \
+        else df_to_merge[["int_key", "float1"]].rename(columns={"int_key": "mult_int_key"})
+    right_df = right_df[right_df["mult_int_key"] != 1]
+    kw = {"on_key_dtypes": "int", "on": "mult_int_key", "how": how, "validate": validate}
+    expected_df = left_df.merge(right_df, on="mult_int_key", how=how)
+
+    # When
+    merge_estimate = safe_merge(left_df, right_df, explain=True, **kw)
+
+    # Then
+    assert merge_estimate.n_rows == len(expected_df)
+    assert merge_estimate.memory >= expected_df.memory_usage(index=False).sum()
+    with pytest.raises(AssertionError):
+        safe_merge(left_df, right_df, max_rows=len(expected_df) - 1, **kw)
+    with pytest.raises(AssertionError):
+        safe_merge(left_df, right_df, max_memory=merge_estimate.memory - 1, **kw)
+    assert len(safe_merge(left_df, right_df, max_rows=len(expected_df), **kw)) == len(expected_df)
+
+
+@pytest.mark.parametrize("left_on, right_on, drop_side_keys, all_matched", [
+    ("key", "key", "right", False),
+    ("key", "key", "right", True),
+    ("key", "right_key", "right", False),
+    ("key", "right_key", "left", False),
+    (["key", "key2"], ["key", "key2"], "right", False),
+    (["key", "key2"], ["key", "right_key2"], None, False)
+])
+def test_safe_merge_lookup(left_on, right_on, drop_side_keys, all_matched):
+    # Given
+    left_df = pd.DataFrame({"key": ["b", "a", "c", "a", None, "d"], "key2": [1, 2, 1, 2, 1, 1],
+                            "left_value": range(6)}, index=list("uvwxyz"))
+    right_df = pd.DataFrame({
+        "key": ["a", "b", "c", None, "e"], "key2": [2, 1, 1, 1, 1], "int": [1, 2, 3, 4, 5],
+        "bool": [True, False, True, True, False], "nullable": pd.array([1, None, 3, 4, 5]),
+        "category": pd.Categorical(["x", "y", "x", "y", "x"]),
+        "date": pd.date_range("2020-01-01", periods=5), "string": list("vwxyz")})
+    right_df = right_df.rename(columns={"key": right_on[0] if isinstance(right_on, list)
+                                        else right_on})
+    right_df = right_df.rename(columns={"key2": right_on[1] if isinstance(right_on, list)
+                                        else "key2_"})
+    if all_matched:
+        left_df = left_df.iloc[:4]
+    expected_df = left_df.merge(right_df, how="left", left_on=left_on, right_on=right_on)
+    if drop_side_keys == "right":
+        expected_df = _drop_other_key_columns(expected_df, _to_list(left_on), _to_list(right_on))
+    elif drop_side_keys == "left":
+        expected_df = _drop_other_key_columns(expected_df, _to_list(right_on), _to_list(left_on))
+
+    # When
+    merged_df = safe_merge(left_df, right_df, left_on=left_on, right_on=right_on, na_allowed=True,
+                           on_key_dtypes="str" if left_on == "key" else "object",
+                           drop_side_keys=drop_side_keys)
+
+    # Then
+    pd.testing.assert_frame_equal(merged_df, expected_df)
+
+
+@pytest.mark.parametrize("how", ["left", "inner", "right", "outer"])
+@pytest.mark.parametrize("validate", ["many_to_one", "many_to_many"])
+@pytest.mark.parametrize("presorted", [True, "auto"])
+def test_safe_merge_presorted(how, validate, presorted):
+    # Given
+    left_df = pd.DataFrame({"key": [0, 1, 1, 2, 4, 4, 6], "left_value": list("abcdefg")},
+                           index=range(10, 17))
+    right_df = pd.DataFrame({"key": [1, 2, 3, 4, 5], "int": range(5), "bool": [True] * 5})
+    if validate == "many_to_many":
+        right_df = pd.DataFrame({"key": [1, 1, 2, 4, 4, 4, 5], "int": range(7),
+                                 "bool": [True] * 7})
+    expected_df = left_df.merge(right_df, how=how, on="key")
+
+    # When
+    merged_df = safe_merge(left_df, right_df, how=how, on="key", on_key_dtypes="int",
+                           validate=validate, presorted=presorted)
+
+    # Then
+    pd.testing.assert_frame_equal(merged_df, expected_df)
+
+
+@pytest.mark.parametrize("presorted, should_fail", [(True, True), ("auto", False)])
+@assert_error
+def test_safe_merge_presorted_unsorted(df_to_merge, presorted, should_fail):
+    # Given
+    left_df = df_to_merge[["mult_int_key", "str1"]]
+    right_df = df_to_merge[["int_key", "float1"]].rename(columns={"int_key": "mult_int_key"})
+
+    # When
+    merged_df = safe_merge(left_df, right_df, on="mult_int_key", on_key_dtypes="int",
+                           presorted=presorted)
+
+    # Then
+    pd.testing.assert_frame_equal(merged_df, left_df.merge(right_df, on="mult_int_key",
+                                                           how="left"))
+
+
+def test_safe_merge_duplicated_keys(df_to_merge, tmp_path):
+    # Given
+    left_df = df_to_merge[["int_key", "str1"]]
+    right_df = df_to_merge[["mult_int_key", "float1"]]
+    duplicates_file = str(tmp_path / "duplicated_keys.csv")
+
+    # When
+    with pytest.raises(pd.errors.MergeError) as error:
+        safe_merge(left_df, right_df, on_key_dtypes="int", left_on="int_key",
+                   right_on="mult_int_key", duplicates_file=duplicates_file)
+
+    # Then
+    assert "10 key values are on several rows (20 rows), e.g. (0,): 2 rows" in str(error.value)
+    assert "(5,)" not in str(error.value)
+    duplicates_df = pd.read_csv(duplicates_file, index_col=0)
+    assert list(duplicates_df["mult_int_key"]) == list(range(10))
+    assert list(duplicates_df["n_rows"]) == [2] * 10
+
+
+@pytest.mark.parametrize("how", ["left", "inner", "right", "outer"])
+@pytest.mark.parametrize("validate", ["many_to_one", "many_to_many"])
+def test_safe_merge_categorical_keys(how, validate):
+    # Given
+    left_df = pd.DataFrame({"key": pd.Categorical(["b", "a", "c", "a", None]),
+                            "left_value": range(5)})
+    right_df = pd.DataFrame({"key": pd.Categorical(["c", "d", "a", None]), "right_value": range(4)})
+    if validate == "many_to_many":
+        right_df = pd.concat([right_df, right_df], ignore_index=True)
+    expected_df = left_df.astype({"key": object}).merge(
+        right_df.astype({"key": object}), how=how, on="key", validate=validate)
+
+    # When
+    merged_df = safe_merge(left_df, right_df, how=how, on="key", na_allowed=True,
+                           validate=validate)
+
+    # Then
+    assert list(merged_df["key"].cat.categories) == ["a", "b", "c", "d"]
+    pd.testing.assert_frame_equal(merged_df.astype({"key": object}), expected_df)
+    pd.testing.assert_frame_equal(left_df[["key"]], pd.DataFrame({"key": pd.Categorical(
+        ["b", "a", "c", "a", None])}))
@@ -0,0 +1,118 @@
+import sys
+import pandas as pd
+import pytest
+from pandas_keeper.df_keeper.read import DataReaderExtension, DataReaderEngine, read_data, \
+    iter_data, register_reader
+from pandas_keeper.df_keeper.importer import import_df
+from pandas_keeper.storage import FsspecStorage, LocalStorage, MemoryStorage, get_storage, \
+    register_storage
+from pandas_keeper.write import register_writer, write
+
+DF = pd.DataFrame({"Column 1": ["a", "b", "a", None], "Column 2": [1, 2, 3, 4]})
+
+
+@pytest.mark.parametrize("file_path, expected_storage_type, expected_path", [
+    ("data/data.csv", LocalStorage, "data/data.csv"),
+    ("file:///data/data.csv", LocalStorage, "/data/data.csv"),
+    ("memory://data/data.csv", MemoryStorage, "data/data.csv"),
+])
+def test_get_storage(file_path, expected_storage_type, expected_path):
+    # When
+    storage, path = get_storage(file_path)
+
+    # Then
+    assert isinstance(storage, expected_storage_type)
+    assert path == expected_path
+
+
+@pytest.mark.parametrize("file_name, extension, engine", [
+    ("data.csv", DataReaderExtension.csv, DataReaderEngine.pandas),
+    ("data.csv.gz", DataReaderExtension.csv, DataReaderEngine.pyarrow),
+    ("data.pq", DataReaderExtension.pq, DataReaderEngine.pandas),
+    ("data.jsonl.zst", DataReaderExtension.jsonl, DataReaderEngine.pandas),
+])
+@pytest.mark.parametrize("protocol", ["memory", "fsspec-file"])
+def test_write_and_read_data_in_storage(tmp_path, restore_registries, protocol, file_name,
+                                        extension, engine):
+    # Given
+    if file_name.endswith(".zst"):
+        pytest.importorskip("zstandard")
+    if protocol == "fsspec-file":
+        pytest.importorskip("fsspec")
+        register_storage("fsspec-file", FsspecStorage("file"))
+    file_path = "%s://%s/%s" % (protocol, tmp_path, file_name)
+    kwargs = {"index": False} if extension is DataReaderExtension.csv else {}
+
+    # When
+    write(DF, file_path, **kwargs)
+    read_df = read_data(file_path, extension, reader_engine=engine)
+    chunks = list(iter_data(file_path, extension, reader_engine=engine))
+
+    # Then
+    assert get_storage(file_path)[0].exists(str(tmp_path / file_name))
+    pd.testing.assert_frame_equal(read_df, DF)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), DF)
+
+
+def test_write_failure_removes_the_file():
+    # Given
+    storage, path = get_storage("memory://failure.csv")
+
+    # When
+    with pytest.raises(AttributeError):
+        write("not a DataFrame", "memory://failure.csv")
+
+    # Then
+    assert not storage.exists(path)
+
+
+def test_register_writer(restore_registries):
+    # Given
+    def write_tsv(obj, f, *args, **kw):
+        f.write(str.encode(obj.to_csv(*args, sep="\t", **kw)))
+
+    # When
+    register_writer("tsv", write_tsv)
+    write(DF, "memory://data.tsv", index=False)
+
+    # Then
+    assert get_storage("memory://data.tsv")[0].files["data.tsv"] == \
+        str.encode(DF.to_csv(sep="\t", index=False))
+
+
+def test_read_url_without_fsspec(monkeypatch, restore_registries):
+    # Given
+    monkeypatch.setitem(sys.modules, "fsspec", None)
+    read_paths = []
+
+    def read_tsv(file_path, *args, **kw):
+        read_paths.append(file_path)
+        return DF
+
+    register_reader("tsv", read_tsv)
+
+    # When
+    read_df = read_data("https://example.com/data.tsv", "tsv")
+
+    # Then
+    assert read_paths == ["https://example.com/data.tsv"]
+    pd.testing.assert_frame_equal(read_df, DF)
+
+
+@pytest.mark.parametrize("cache", [False, True])
+@pytest.mark.parametrize("executor", [None, "thread"])
+def test_import_excel_sheets_in_storage(tmp_path, cache, executor):
+    # Given
+    with pd.ExcelWriter(tmp_path / "data.xlsx") as writer:
+        DF.to_excel(writer, sheet_name="Sheet 1", index=False)
+        DF.to_excel(writer, sheet_name="Sheet 2", index=False)
+    get_storage("memory://workbook.xlsx")[0].files["workbook.xlsx"] = \
+        (tmp_path / "data.xlsx").read_bytes()
+    schema = {"file_path": "memory://workbook.xlsx", "sheets": [0, "Sheet 2"],
+              "executor": executor, "cache_folder": str(tmp_path / "cache") if cache else None}
+
+    # When
+    read_df = import_df(schema)
+
+    # Then
+    pd.testing.assert_frame_equal(read_df, pd.concat([DF, DF], ignore_index=True))
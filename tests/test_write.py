@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import pandas as pd
+import pytest
+from pandas_keeper.write import BackgroundWriter, awrite, register_writer, write_async
+
+DF = pd.DataFrame({"Column 1": ["a", "b", "a", None], "Column 2": [1, 2, 3, 4]})
+
+
+def test_write_async(tmp_path):
+    # Given
+    paths = [tmp_path / ("data_%i.csv" % i) for i in range(5)]
+
+    # When
+    futures = [write_async(DF, str(path), index=False) for path in paths]
+
+    # Then
+    for future, path in zip(futures, paths):
+        future.result()
+        pd.testing.assert_frame_equal(pd.read_csv(path), DF)
+
+
+def test_background_writer_back_pressure(tmp_path):
+    # Given
+    release = threading.Event()
+    register_writer("blocking", lambda obj, f: release.wait())
+    writer = BackgroundWriter(max_workers=1, max_pending=1)
+    writer.submit(DF, str(tmp_path / "first.blocking"))
+
+    # When
+    submitted = threading.Event()
+    thread = threading.Thread(target=lambda: (writer.submit(DF, str(tmp_path / "second.blocking")),
+                                              submitted.set()))
+    thread.start()
+
+    # Then
+    assert not submitted.wait(0.2)
+    release.set()
+    assert submitted.wait(5)
+    thread.join()
+    writer.shutdown()
+
+
+def test_background_writer_removes_failed_file(tmp_path):
+    # Given
+    path = tmp_path / "failure.csv"
+
+    # When
+    with BackgroundWriter() as writer:
+        future = writer.submit("not a DataFrame", str(path))
+
+    # Then
+    with pytest.raises(AttributeError):
+        future.result()
+    assert not path.exists()
+
+
+def test_awrite(tmp_path):
+    # Given
+    path = tmp_path / "data.csv"
+
+    # When
+    asyncio.run(awrite(DF, str(path), index=False))
+
+    # Then
+    pd.testing.assert_frame_equal(pd.read_csv(path), DF)